@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Análise de backtracking das expressões regulares do validador.
+
+Para cada padrão (os nove de ValidadorDados.patterns e os registrados com
+registrar_campo), gera entradas candidatas a pior caso a partir da própria
+regex, no formato prefixo + bomba * n + sufixo que falha. Em seguida mede o
+tempo de `padrao.match` conforme n cresce e estima o expoente do
+crescimento (inclinação em escala log-log). Um padrão falha a verificação
+se o expoente passar do limite (padrão: 1.5) ou se a medição estourar o
+tempo limite, o que indica crescimento exponencial.
+
+    python analise_backtracking.py
+    python analise_backtracking.py --padrao produto='^(\\w+\\s?)+$' --saida analise.json
+
+As medições rodam em um processo separado, encerrado ao fim do tempo
+limite, então um padrão exponencial não trava a análise.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import re
+import sys
+import time
+from itertools import product
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+from validador_dados import ValidadorDados
+
+LIMITE_EXPOENTE = 1.5
+MAX_TAMANHO = 8192
+TEMPO_LIMITE = 30.0
+
+# Caracteres usados como sufixo que faz o casamento falhar no fim da entrada
+SUFIXOS = ('', '!', '\n!', ' ')
+
+# Tempo alvo de cada medição (o valor é casado várias vezes até atingi-lo)
+ALVO_MEDICAO = 0.002
+# Acima disso por casamento, a série de tamanhos para de crescer
+MAX_POR_CASAMENTO = 0.25
+# Candidatos que seguem para a série completa de tamanhos
+FINALISTAS = 3
+
+
+class ResultadoAnalise(NamedTuple):
+    campo: str
+    padrao: str
+    classe: str                  # 'linear', 'superlinear' ou 'exponencial'
+    expoente: Optional[float]    # inclinação log-log do tempo em função de n
+    pior_entrada: str            # descrição do candidato mais lento
+    medicoes: Tuple[Tuple[int, float], ...]
+    avisos: Tuple[str, ...]      # observações da análise estática
+
+    @property
+    def aprovado(self) -> bool:
+        return self.classe == 'linear'
+
+
+# Geração de entradas a partir da árvore da regex
+
+Padrao = Union[str, re.Pattern]
+
+
+def _arvore(padrao: Padrao):
+    """Árvore da regex; de um padrão compilado, com as flags dele (ex.: re.VERBOSE)."""
+    if isinstance(padrao, str):
+        return sre_parse.parse(padrao)
+    return sre_parse.parse(padrao.pattern, padrao.flags)
+
+
+def _caracteres(no) -> List[str]:
+    """Caracteres representativos aceitos por um nó de um caractere."""
+    operacao, argumento = no
+    if operacao is sre_parse.LITERAL:
+        return [chr(argumento)]
+    if operacao is sre_parse.NOT_LITERAL:
+        return ['a' if argumento != ord('a') else 'b']
+    if operacao is sre_parse.ANY:
+        return ['a']
+    if operacao is sre_parse.IN:
+        if argumento and argumento[0][0] is sre_parse.NEGATE:
+            return ['!']
+        caracteres = []
+        for tipo, valor in argumento:
+            if tipo is sre_parse.LITERAL:
+                caracteres.append(chr(valor))
+            elif tipo is sre_parse.RANGE:
+                caracteres.append(chr(valor[0]))
+            elif tipo is sre_parse.CATEGORY:
+                caracteres.append({
+                    sre_parse.CATEGORY_DIGIT: '1',
+                    sre_parse.CATEGORY_WORD: 'a',
+                    sre_parse.CATEGORY_SPACE: ' ',
+                }.get(valor, '!'))
+        return caracteres
+    return []
+
+
+def _subpadroes(no):
+    """Os subpadrões (listas de nós) contidos em um nó composto."""
+    operacao, argumento = no
+    if operacao in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) or \
+            operacao is getattr(sre_parse, 'POSSESSIVE_REPEAT', None):
+        return [argumento[2]]
+    if operacao is sre_parse.SUBPATTERN:
+        return [argumento[-1]]
+    if operacao is sre_parse.BRANCH:
+        return list(argumento[1])
+    if operacao in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return [argumento[1]]
+    if operacao is getattr(sre_parse, 'ATOMIC_GROUP', None):
+        return [argumento]
+    return []
+
+
+def _repeticao(no) -> Optional[Tuple[int, int, list]]:
+    operacao, argumento = no
+    if operacao in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) or \
+            operacao is getattr(sre_parse, 'POSSESSIVE_REPEAT', None):
+        return argumento
+    return None
+
+
+def _exemplo(subpadrao) -> str:
+    """Uma string curta que percorre o subpadrão (ignora lookaheads)."""
+    partes = []
+    for no in subpadrao:
+        operacao, argumento = no
+        repeticao = _repeticao(no)
+        if repeticao is not None:
+            minimo = repeticao[0]
+            partes.append(_exemplo(repeticao[2]) * max(minimo, 1))
+        elif operacao is sre_parse.SUBPATTERN:
+            partes.append(_exemplo(argumento[-1]))
+        elif operacao is sre_parse.BRANCH:
+            partes.append(_exemplo(argumento[1][0]))
+        elif operacao is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            partes.append(_exemplo(argumento))
+        else:
+            caracteres = _caracteres(no)
+            if caracteres:
+                partes.append(caracteres[0])
+    return ''.join(partes)
+
+
+def _percorrer(subpadrao):
+    for no in subpadrao:
+        yield no
+        for interno in _subpadroes(no):
+            yield from _percorrer(interno)
+
+
+def _prefixos(subpadrao, antes: str = '', profundidade: int = 0) -> List[str]:
+    """Prefixos que levam o casamento até cada ponto da sequência de nós."""
+    prefixos = []
+    for indice, no in enumerate(subpadrao):
+        atual = antes + _exemplo(subpadrao[:indice])
+        prefixos.append(atual)
+        if profundidade < 4:
+            for interno in _subpadroes(no):
+                if _repeticao(no) is None:
+                    prefixos.extend(_prefixos(interno, atual, profundidade + 1))
+    return prefixos
+
+
+def gerar_candidatos(padrao: Padrao) -> List[Tuple[str, str, str]]:
+    """Entradas candidatas a pior caso, como (prefixo, bomba, sufixo)."""
+    arvore = _arvore(padrao)
+    nos = list(_percorrer(arvore))
+
+    caracteres = []
+    for no in nos:
+        for caractere in _caracteres(no):
+            if caractere not in caracteres:
+                caracteres.append(caractere)
+
+    bombas = list(caracteres)
+    for no in nos:
+        repeticao = _repeticao(no)
+        if repeticao is not None:
+            corpo = _exemplo(repeticao[2])
+            if corpo and corpo not in bombas:
+                bombas.append(corpo)
+    for primeiro, segundo in product(caracteres[:6], repeat=2):
+        if primeiro + segundo not in bombas:
+            bombas.append(primeiro + segundo)
+
+    prefixos = list(dict.fromkeys(_prefixos(list(arvore))))
+    return [(prefixo, bomba, sufixo) for prefixo in prefixos for bomba in bombas for sufixo in SUFIXOS]
+
+
+def avisos_estaticos(padrao: Padrao) -> List[str]:
+    """Construções conhecidas por causar backtracking catastrófico."""
+    avisos = []
+
+    def visitar(subpadrao, dentro_de_repeticao: bool):
+        for no in subpadrao:
+            repeticao = _repeticao(no)
+            ilimitada = repeticao is not None and repeticao[1] == sre_parse.MAXREPEAT
+            if ilimitada and dentro_de_repeticao:
+                avisos.append(f"quantificador ilimitado aninhado: {_exemplo([no])!r}")
+            if no[0] is sre_parse.BRANCH and dentro_de_repeticao:
+                avisos.append("alternância dentro de repetição ilimitada")
+            for interno in _subpadroes(no):
+                visitar(interno, dentro_de_repeticao or ilimitada)
+
+    visitar(_arvore(padrao), False)
+    return list(dict.fromkeys(avisos))
+
+
+# Medição
+
+def _medir(casar, valor: str) -> float:
+    """Segundos por casamento, o menor de três rodadas."""
+    inicio = time.perf_counter()
+    casar(valor)
+    uma = time.perf_counter() - inicio
+    if uma > MAX_POR_CASAMENTO:
+        return uma
+    vezes = max(1, int(ALVO_MEDICAO / max(uma, 1e-7)))
+    melhor = float('inf')
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for _ in range(vezes):
+            casar(valor)
+        melhor = min(melhor, (time.perf_counter() - inicio) / vezes)
+    return melhor
+
+
+def estimar_expoente(medicoes: List[Tuple[int, float]]) -> Optional[float]:
+    """Inclinação da reta de mínimos quadrados de log(tempo) x log(n)."""
+    if len(medicoes) < 2:
+        return None
+    xs = [math.log(n) for n, _ in medicoes]
+    ys = [math.log(max(t, 1e-12)) for _, t in medicoes]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    variancia = sum((x - media_x) ** 2 for x in xs)
+    return sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys)) / variancia
+
+
+def _descrever(candidato: Tuple[str, str, str]) -> str:
+    prefixo, bomba, sufixo = candidato
+    return ' + '.join(parte for parte in (repr(prefixo) if prefixo else '', f'{bomba!r} * n',
+                                          repr(sufixo) if sufixo else '') if parte)
+
+
+def _montar(candidato: Tuple[str, str, str], tamanho: int) -> str:
+    prefixo, bomba, sufixo = candidato
+    return prefixo + bomba * max(1, tamanho // len(bomba)) + sufixo
+
+
+def _serie(padrao: re.Pattern, max_tamanho: int, conexao) -> None:
+    """Processo filho: escolhe os piores candidatos e mede a série de tamanhos."""
+    casar = padrao.match
+    candidatos = gerar_candidatos(padrao)
+
+    # Triagem 1: em tamanhos minúsculos, crescimento explosivo já aparece
+    explosivos = []
+    for candidato in candidatos:
+        pequeno = _medir(casar, _montar(candidato, 8))
+        grande = _medir(casar, _montar(candidato, 16))
+        if grande > pequeno * 16 and grande > 1e-5:
+            explosivos.append((grande / pequeno, candidato))
+    if explosivos:
+        conexao.send(('explosivo', _descrever(max(explosivos)[1]), []))
+        return
+
+    # Triagem 2: os candidatos mais lentos num tamanho intermediário
+    triagem = min(1024, max_tamanho)
+    tempos = sorted(((_medir(casar, _montar(candidato, triagem)), candidato) for candidato in candidatos),
+                    reverse=True)
+    pior = None
+    for _, candidato in tempos[:FINALISTAS]:
+        medicoes = []
+        tamanho = 256
+        while tamanho <= max_tamanho:
+            tempo = _medir(casar, _montar(candidato, tamanho))
+            medicoes.append((tamanho, tempo))
+            if tempo > MAX_POR_CASAMENTO:
+                break
+            tamanho *= 2
+        expoente = estimar_expoente(medicoes)
+        if pior is None or (expoente or 0) > (pior[0] or 0):
+            pior = (expoente, candidato, medicoes)
+    conexao.send(('serie', _descrever(pior[1]), pior[2]))
+
+
+def analisar_padrao(padrao: Padrao, campo: str = '', max_tamanho: int = MAX_TAMANHO,
+                    limite_expoente: float = LIMITE_EXPOENTE,
+                    tempo_limite: float = TEMPO_LIMITE) -> ResultadoAnalise:
+    """Mede o crescimento do tempo de casamento de `padrao` (texto ou compilado, com as flags)."""
+    padrao = re.compile(padrao)
+    avisos = tuple(avisos_estaticos(padrao))
+    receber, enviar = multiprocessing.Pipe(duplex=False)
+    processo = multiprocessing.Process(target=_serie, args=(padrao, max_tamanho, enviar), daemon=True)
+    processo.start()
+    enviar.close()
+    try:
+        resposta = receber.recv() if receber.poll(tempo_limite) else None
+    except EOFError:
+        resposta = None
+    finally:
+        if processo.is_alive():
+            processo.kill()
+        processo.join()
+
+    if resposta is None:
+        # Sem resposta no prazo: o crescimento é no mínimo superlinear
+        return ResultadoAnalise(campo, padrao.pattern, 'superlinear', None,
+                                f'(tempo limite de {tempo_limite:.0f}s esgotado)', (), avisos)
+    tipo, descricao, medicoes = resposta
+    if tipo == 'explosivo':
+        return ResultadoAnalise(campo, padrao.pattern, 'exponencial', None, descricao, (), avisos)
+
+    expoente = estimar_expoente(medicoes)
+    classe = 'linear' if expoente is not None and expoente <= limite_expoente else 'superlinear'
+    return ResultadoAnalise(campo, padrao.pattern, classe, round(expoente, 2) if expoente is not None else None,
+                            descricao, tuple((n, t) for n, t in medicoes), avisos)
+
+
+def analisar_validador(validador: Optional[ValidadorDados] = None, campos: Optional[Iterable[str]] = None,
+                       **opcoes) -> List[ResultadoAnalise]:
+    """Analisa os padrões de todos os campos do registro (ou só de `campos`)."""
+    validador = validador or ValidadorDados()
+    nomes = list(campos) if campos is not None else validador.campos.nomes()
+    return [analisar_padrao(validador.campos[campo].padrao, campo, **opcoes) for campo in nomes]
+
+
+def imprimir_resultados(resultados: List[ResultadoAnalise]) -> None:
+    for resultado in resultados:
+        simbolo = '✅' if resultado.aprovado else '❌'
+        expoente = f"{resultado.expoente:.2f}" if resultado.expoente is not None else '-'
+        print(f"{simbolo} {resultado.campo:<18} {resultado.classe:<12} expoente {expoente:>5}  "
+              f"pior: {resultado.pior_entrada}")
+        for aviso in resultado.avisos:
+            print(f"     ⚠️  {aviso}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Análise de backtracking das regex do validador')
+    parser.add_argument('--campos', help='campos a analisar, separados por vírgula (padrão: todos)')
+    parser.add_argument('--padrao', action='append', default=[], metavar='NOME=REGEX',
+                        help='registra e analisa um padrão adicional (repetível)')
+    parser.add_argument('--max-tamanho', type=int, default=MAX_TAMANHO,
+                        help=f'maior n da série de medições (padrão: {MAX_TAMANHO})')
+    parser.add_argument('--limite', type=float, default=LIMITE_EXPOENTE,
+                        help=f'maior expoente aceito (padrão: {LIMITE_EXPOENTE})')
+    parser.add_argument('--tempo-limite', type=float, default=TEMPO_LIMITE,
+                        help=f'segundos por padrão antes de considerá-lo exponencial (padrão: {TEMPO_LIMITE:.0f})')
+    parser.add_argument('--saida', help='grava os resultados neste arquivo JSON')
+    args = parser.parse_args(argv)
+
+    validador = ValidadorDados()
+    for item in args.padrao:
+        nome, separador, regex = item.partition('=')
+        if not separador:
+            parser.error(f"Use NOME=REGEX em --padrao: {item!r}")
+        validador.registrar_campo(nome.strip(), regex, f"Formato de {nome.strip()} inválido", substituir=True)
+    campos = [campo.strip() for campo in args.campos.split(',')] if args.campos else None
+    if campos:
+        campos += [item.partition('=')[0].strip() for item in args.padrao]
+
+    resultados = analisar_validador(validador, campos, max_tamanho=args.max_tamanho,
+                                    limite_expoente=args.limite, tempo_limite=args.tempo_limite)
+    imprimir_resultados(resultados)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump([dict(r._asdict(), aprovado=r.aprovado) for r in resultados], arquivo,
+                      indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+    reprovados = [r.campo for r in resultados if not r.aprovado]
+    if reprovados:
+        print(f"\n⚠️  Crescimento acima de linear: {', '.join(reprovados)}")
+        return 1
+    print("\n✅ Todos os padrões têm crescimento linear")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
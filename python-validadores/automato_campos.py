@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Autômato produto dos padrões do ValidadorDados.
+
+Cada regex é convertida em um AFN (construção de Thompson) e depois em um AFD
+(construção de subconjuntos). Os AFDs são combinados em um único autômato
+produto, que lê o valor uma vez e informa todos os campos que o aceitam.
+
+Subconjunto de regex suportado: literais, escapes (`\\d` e pontuação),
+classes `[...]` com intervalos e negação, `.`, grupos `(...)`/`(?:...)`,
+alternância `|`, quantificadores `? * + {n} {n,} {n,m}` e lookaheads `(?=...)`
+no início do padrão (tratados como interseção de linguagens). O padrão deve
+ser ancorado com `^...$`.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+# Alfabeto: os 128 caracteres ASCII, mais um símbolo para dígitos não ASCII
+# (aceitos por `\d`) e outro para qualquer outro caractere não ASCII
+DIGITO_NAO_ASCII = 128
+OUTRO_NAO_ASCII = 129
+TAMANHO_ALFABETO = 130
+
+TODOS = frozenset(range(TAMANHO_ALFABETO))
+DIGITOS = frozenset(range(ord('0'), ord('9') + 1)) | {DIGITO_NAO_ASCII}
+QUALQUER = TODOS - {ord('\n')}
+
+QUEBRA = ord('\n')
+
+
+def simbolo(caractere: str) -> int:
+    codigo = ord(caractere)
+    if codigo < 128:
+        return codigo
+    return DIGITO_NAO_ASCII if caractere.isdecimal() else OUTRO_NAO_ASCII
+
+
+class _Parser:
+    """Converte uma regex em uma árvore: ('conj', símbolos), ('seq', [...]),
+    ('alt', [...]) ou ('rep', nó, mínimo, máximo)."""
+
+    def __init__(self, texto: str):
+        self.texto = texto
+        self.pos = 0
+
+    def erro(self, mensagem: str) -> ValueError:
+        return ValueError(f"{mensagem} na posição {self.pos} de {self.texto!r}")
+
+    def espiar(self) -> Optional[str]:
+        return self.texto[self.pos] if self.pos < len(self.texto) else None
+
+    def ler(self) -> str:
+        caractere = self.espiar()
+        if caractere is None:
+            raise self.erro("Fim inesperado")
+        self.pos += 1
+        return caractere
+
+    def alternancia(self):
+        opcoes = [self.sequencia()]
+        while self.espiar() == '|':
+            self.pos += 1
+            opcoes.append(self.sequencia())
+        return opcoes[0] if len(opcoes) == 1 else ('alt', opcoes)
+
+    def sequencia(self):
+        itens = []
+        while self.espiar() not in (None, '|', ')'):
+            itens.append(self.quantificador(self.atomo()))
+        return ('seq', itens)
+
+    def atomo(self):
+        caractere = self.ler()
+        if caractere == '(':
+            if self.texto.startswith('?:', self.pos):
+                self.pos += 2
+            elif self.espiar() == '?':
+                raise self.erro("Grupo especial não suportado")
+            no = self.alternancia()
+            if self.ler() != ')':
+                raise self.erro("Esperado ')'")
+            return no
+        if caractere == '[':
+            return ('conj', self.classe())
+        if caractere == '.':
+            return ('conj', QUALQUER)
+        if caractere == '\\':
+            return ('conj', self.escape())
+        if caractere in '^$*+?{':
+            raise self.erro(f"'{caractere}' inesperado")
+        return ('conj', frozenset({simbolo(caractere)}))
+
+    def escape(self) -> FrozenSet[int]:
+        caractere = self.ler()
+        if caractere == 'd':
+            return DIGITOS
+        if caractere == 'D':
+            return TODOS - DIGITOS
+        if caractere.isalnum():
+            raise self.erro(f"Escape '\\{caractere}' não suportado")
+        return frozenset({simbolo(caractere)})
+
+    def classe(self) -> FrozenSet[int]:
+        negada = self.espiar() == '^'
+        if negada:
+            self.pos += 1
+        simbolos = set()
+        primeiro = True
+        while True:
+            caractere = self.ler()
+            if caractere == ']' and not primeiro:
+                break
+            primeiro = False
+            if caractere == '\\':
+                conjunto = self.escape()
+                if len(conjunto) > 1:
+                    simbolos |= conjunto
+                    continue
+                inicio = next(iter(conjunto))
+            else:
+                inicio = simbolo(caractere)
+            if self.espiar() == '-' and self.texto[self.pos + 1:self.pos + 2] not in ('', ']'):
+                self.pos += 1
+                fim = self.ler()
+                fim = next(iter(self.escape())) if fim == '\\' else simbolo(fim)
+                if inicio >= 128 or fim >= 128 or fim < inicio:
+                    raise self.erro("Intervalo inválido")
+                simbolos.update(range(inicio, fim + 1))
+            else:
+                simbolos.add(inicio)
+        return frozenset(TODOS - simbolos if negada else simbolos)
+
+    def quantificador(self, no):
+        caractere = self.espiar()
+        if caractere == '*':
+            minimo, maximo = 0, None
+        elif caractere == '+':
+            minimo, maximo = 1, None
+        elif caractere == '?':
+            minimo, maximo = 0, 1
+        elif caractere == '{':
+            fim = self.texto.find('}', self.pos)
+            if fim < 0:
+                raise self.erro("Esperado '}'")
+            partes = self.texto[self.pos + 1:fim].split(',')
+            try:
+                minimo = int(partes[0])
+                maximo = minimo if len(partes) == 1 else (int(partes[1]) if partes[1] else None)
+            except ValueError:
+                raise self.erro("Quantificador inválido") from None
+            self.pos = fim
+        else:
+            return no
+        self.pos += 1
+        if self.espiar() == '?':
+            # Modo preguiçoso não muda a linguagem aceita
+            self.pos += 1
+        return self.quantificador(('rep', no, minimo, maximo))
+
+
+def _separar_lookaheads(padrao: str) -> Tuple[List[str], str]:
+    """Separa '^(?=A)(?=B)C$' em (['A', 'B'], 'C')."""
+    if not (padrao.startswith('^') and padrao.endswith('$') and not padrao.endswith('\\$')):
+        raise ValueError(f"O padrão deve ser ancorado com ^...$: {padrao!r}")
+    corpo = padrao[1:-1]
+    lookaheads = []
+    while corpo.startswith('(?='):
+        profundidade, i, em_classe = 0, 0, False
+        while i < len(corpo):
+            caractere = corpo[i]
+            if caractere == '\\':
+                i += 2
+                continue
+            if em_classe:
+                em_classe = caractere != ']'
+            elif caractere == '[':
+                em_classe = True
+            elif caractere == '(':
+                profundidade += 1
+            elif caractere == ')':
+                profundidade -= 1
+                if profundidade == 0:
+                    break
+            i += 1
+        else:
+            raise ValueError(f"Lookahead sem ')' em {padrao!r}")
+        lookaheads.append(corpo[3:i])
+        corpo = corpo[i + 1:]
+    return lookaheads, corpo
+
+
+class _AFN:
+    def __init__(self):
+        self.transicoes: List[List[Tuple[Optional[FrozenSet[int]], int]]] = []
+
+    def novo_estado(self) -> int:
+        self.transicoes.append([])
+        return len(self.transicoes) - 1
+
+    def construir(self, no) -> Tuple[int, int]:
+        tipo = no[0]
+        inicio, fim = self.novo_estado(), self.novo_estado()
+        if tipo == 'conj':
+            self.transicoes[inicio].append((no[1], fim))
+        elif tipo == 'seq':
+            atual = inicio
+            for item in no[1]:
+                entrada, saida = self.construir(item)
+                self.transicoes[atual].append((None, entrada))
+                atual = saida
+            self.transicoes[atual].append((None, fim))
+        elif tipo == 'alt':
+            for opcao in no[1]:
+                entrada, saida = self.construir(opcao)
+                self.transicoes[inicio].append((None, entrada))
+                self.transicoes[saida].append((None, fim))
+        else:
+            _, filho, minimo, maximo = no
+            atual = inicio
+            for _ in range(minimo):
+                entrada, saida = self.construir(filho)
+                self.transicoes[atual].append((None, entrada))
+                atual = saida
+            if maximo is None:
+                entrada, saida = self.construir(filho)
+                self.transicoes[atual].append((None, entrada))
+                self.transicoes[saida].append((None, entrada))
+                self.transicoes[saida].append((None, fim))
+            else:
+                for _ in range(maximo - minimo):
+                    entrada, saida = self.construir(filho)
+                    self.transicoes[atual].append((None, entrada))
+                    self.transicoes[atual].append((None, fim))
+                    atual = saida
+            self.transicoes[atual].append((None, fim))
+        return inicio, fim
+
+    def fecho(self, estados) -> FrozenSet[int]:
+        pilha = list(estados)
+        visitados = set(pilha)
+        while pilha:
+            for conjunto, destino in self.transicoes[pilha.pop()]:
+                if conjunto is None and destino not in visitados:
+                    visitados.add(destino)
+                    pilha.append(destino)
+        return frozenset(visitados)
+
+
+class AFD:
+    """AFD completo sobre o alfabeto de símbolos; o estado -1 é o estado morto."""
+
+    def __init__(self, transicoes: List[List[int]], finais: FrozenSet[int]):
+        self.transicoes = transicoes
+        self.finais = finais
+
+    @classmethod
+    def de_regex(cls, regex: str, prefixo: bool = False) -> 'AFD':
+        """Compila `regex` (sem âncoras). Com `prefixo=True` aceita qualquer
+        texto que comece com a regex, como um lookahead (?=...) no início."""
+        parser = _Parser(regex)
+        arvore = parser.alternancia()
+        if parser.pos != len(parser.texto):
+            raise parser.erro("')' sem '(' correspondente")
+
+        afn = _AFN()
+        inicio, fim = afn.construir(arvore)
+        if prefixo:
+            afn.transicoes[fim].append((TODOS, fim))
+
+        inicial = afn.fecho([inicio])
+        indices = {inicial: 0}
+        fila = [inicial]
+        transicoes = []
+        for conjunto in fila:
+            linha = []
+            for s in range(TAMANHO_ALFABETO):
+                proximos = [destino for estado in conjunto
+                            for simbolos, destino in afn.transicoes[estado]
+                            if simbolos is not None and s in simbolos]
+                if not proximos:
+                    linha.append(-1)
+                    continue
+                destino = afn.fecho(proximos)
+                if destino not in indices:
+                    indices[destino] = len(fila)
+                    fila.append(destino)
+                linha.append(indices[destino])
+            transicoes.append(linha)
+
+        finais = frozenset(i for conjunto, i in indices.items() if fim in conjunto)
+        return cls(transicoes, finais)
+
+
+class AutomatoProduto:
+    """Produto dos AFDs de vários campos: uma leitura, todos os campos aceitos.
+
+    A tabela de transições é um vetor plano: o próximo estado é
+    `tabela[estado + simbolo]`, com os estados já multiplicados pelo tamanho
+    do alfabeto. O estado 0 é o estado morto.
+    """
+
+    def __init__(self, padroes: Dict[str, str]):
+        componentes = []  # (campo, AFD), um por regex principal e por lookahead
+        for campo, padrao in padroes.items():
+            lookaheads, corpo = _separar_lookaheads(padrao)
+            # Lookaheads viram interseção: o campo só aceita se todos aceitarem
+            for regex in lookaheads:
+                componentes.append((campo, AFD.de_regex(regex, prefixo=True)))
+            componentes.append((campo, AFD.de_regex(corpo)))
+        self.campos = tuple(padroes)
+        self._construir(componentes)
+
+    def _construir(self, componentes: Sequence[Tuple[str, AFD]]) -> None:
+        morto = tuple(-1 for _ in componentes)
+        inicial = tuple(0 for _ in componentes)
+        indices = {morto: 0, inicial: 1}
+        fila = [morto, inicial]
+        tabela = []
+
+        for estado in fila:
+            for s in range(TAMANHO_ALFABETO):
+                if estado == morto:
+                    tabela.append(0)
+                    continue
+                proximo = tuple(-1 if e < 0 else afd.transicoes[e][s]
+                                for e, (_, afd) in zip(estado, componentes))
+                if proximo not in indices:
+                    indices[proximo] = len(fila)
+                    fila.append(proximo)
+                tabela.append(indices[proximo] * TAMANHO_ALFABETO)
+
+        # Um campo aceita quando todos os seus componentes estão em estado final
+        aceitos = []
+        for estado in fila:
+            recusados = {campo for e, (campo, afd) in zip(estado, componentes) if e not in afd.finais}
+            aceitos.append(tuple(campo for campo in self.campos if campo not in recusados))
+
+        self.tabela = tabela
+        self.aceitos = aceitos
+        self.total_estados = len(fila)
+
+    def _percorrer(self, valor: str) -> int:
+        tabela = self.tabela
+        estado = TAMANHO_ALFABETO  # estado inicial (1), já multiplicado
+        simbolos = valor.encode('ascii') if valor.isascii() else map(simbolo, valor)
+        for s in simbolos:
+            estado = tabela[estado + s]
+            if not estado:
+                break
+        return estado
+
+    def detectar(self, valor: str) -> Tuple[str, ...]:
+        """Campos cujo padrão aceita `valor`, na ordem dos padrões."""
+        if valor[-1:] != '\n':
+            return self.aceitos[self._percorrer(valor) // TAMANHO_ALFABETO]
+
+        # `$` também casa antes de um '\n' final: vale o estado antes e depois dele
+        estado = self._percorrer(valor[:-1])
+        antes = self.aceitos[estado // TAMANHO_ALFABETO]
+        depois = self.aceitos[self.tabela[estado + QUEBRA] // TAMANHO_ALFABETO]
+        if not antes or antes == depois:
+            return depois
+        return tuple(campo for campo in self.campos if campo in antes or campo in depois)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark dos validadores sobre dados sintéticos.
+
+Mede ns/op de cada validar_*, de validar_todos_campos, de validar_lote e do
+modo paralelo para entradas válidas, inválidas, quase válidas e patológicas
+(strings longas). Os resultados são gravados em JSON para comparar execuções:
+
+    python benchmark_validadores.py --tamanhos 10k,1m --saida atual.json
+    python benchmark_validadores.py --saida nova.json --comparar atual.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import string
+import sys
+import time
+from itertools import chain, cycle, islice
+from typing import Callable, List, Optional, Sequence
+
+import validacao_numpy
+from plano_telefonia import ler_plano
+from validador_dados import CAMPOS, MASCARAS, ValidadorDados, digitos_verificadores_cpf
+
+CATEGORIAS = ('valido', 'invalido', 'quase', 'patologico')
+
+# Valores distintos gerados por campo/categoria; o conjunto é repetido até o tamanho pedido
+DISTINTOS = 1000
+
+# Registros (dicts) montados de uma vez para os benchmarks por registro; como
+# os dados se repetem, o bloco é percorrido em ciclo até o tamanho pedido
+BLOCO_REGISTROS = 100 * DISTINTOS
+
+# DDDs existentes, para os telefones valerem também no modo estrito
+DDDS = [ddd for ddd, prefixos in enumerate(ler_plano().prefixos) if prefixos]
+
+
+def _digitos(rng: random.Random, n: int) -> str:
+    return ''.join(rng.choice(string.digits) for _ in range(n))
+
+
+def _palavra(rng: random.Random, n: int) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(n))
+
+
+def _valido(campo: str, rng: random.Random) -> str:
+    if campo == 'nome':
+        return _palavra(rng, rng.randint(2, 10)).capitalize() + ' ' + _palavra(rng, rng.randint(2, 12)).capitalize()
+    if campo == 'email':
+        return f"{_palavra(rng, rng.randint(1, 12))}@{_palavra(rng, rng.randint(1, 10))}.br"
+    if campo == 'senha':
+        caracteres = [rng.choice(string.ascii_uppercase), rng.choice(string.digits)]
+        caracteres += [rng.choice(string.ascii_letters + string.digits) for _ in range(6)]
+        rng.shuffle(caracteres)
+        return ''.join(caracteres)
+    if campo == 'cpf':
+        # Dígitos verificadores corretos, para valer também no modo estrito
+        digitos = _digitos(rng, 9)
+        return f"{digitos[:3]}.{digitos[3:6]}.{digitos[6:]}-{digitos_verificadores_cpf(digitos)}"
+    if campo == 'rg':
+        return f"{_digitos(rng, 6)}-{_digitos(rng, 1)}"
+    if campo == 'telefone':
+        return f"({rng.choice(DDDS)}) 9{_digitos(rng, 4)}-{_digitos(rng, 4)}"
+    if campo == 'cep':
+        return f"{_digitos(rng, 2)}.{_digitos(rng, 3)}-{_digitos(rng, 3)}"
+    if campo == 'data_horario':
+        return (f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1900, 2100)} "
+                f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}")
+    if campo == 'numero_flutuante':
+        return f"{rng.choice(['', '+', '-'])}{_digitos(rng, rng.randint(1, 6))}{rng.choice(['.', ','])}{_digitos(rng, rng.randint(1, 4))}"
+    raise ValueError(f"Campo desconhecido: {campo}")
+
+
+def _invalido(campo: str, rng: random.Random) -> str:
+    # Lixo de tamanho arbitrário, como colunas trocadas ou mal formatadas
+    return ''.join(rng.choice(string.ascii_letters + string.digits + '.-@/() ')
+                   for _ in range(rng.randint(1, 40))).strip() or 'x'
+
+
+def _quase(campo: str, rng: random.Random) -> str:
+    # Valor válido com o último caractere trocado: falha só no fim da regex
+    return _valido(campo, rng)[:-1] + '#'
+
+
+def _patologico(campo: str, rng: random.Random, tamanho: int) -> str:
+    # Strings longas quase aceitas, que forçam a regex a percorrer tudo
+    if campo == 'nome':
+        return 'A' + 'a' * tamanho + ' B' + 'b' * tamanho + '1'
+    if campo == 'email':
+        return 'a' * tamanho + '@' + 'b' * tamanho + '.com'
+    if campo == 'senha':
+        return 'a' * tamanho
+    if campo == 'numero_flutuante':
+        return '1' * tamanho + '.' + '2' * tamanho + 'x'
+    return '1' * tamanho
+
+
+def gerar_valores(campo: str, categoria: str, n: int, semente: int = 42,
+                  tamanho_patologico: int = 256) -> List[str]:
+    rng = random.Random(f"{semente}:{campo}:{categoria}")
+    if categoria == 'valido':
+        gerar = lambda: _valido(campo, rng)
+    elif categoria == 'invalido':
+        gerar = lambda: _invalido(campo, rng)
+    elif categoria == 'quase':
+        gerar = lambda: _quase(campo, rng)
+    elif categoria == 'patologico':
+        gerar = lambda: _patologico(campo, rng, tamanho_patologico)
+    else:
+        raise ValueError(f"Categoria desconhecida: {categoria}")
+
+    distintos = [gerar() for _ in range(min(n, DISTINTOS))]
+    return list(islice(cycle(distintos), n))
+
+
+def medir(funcao: Callable[[], object], operacoes: int, repeticoes: int = 3) -> float:
+    """Executa `funcao` `repeticoes` vezes e devolve o menor tempo em ns por operação."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter_ns()
+        funcao()
+        melhor = min(melhor, time.perf_counter_ns() - inicio)
+    return melhor / operacoes
+
+
+def _loop_metodo(metodo: Callable, valores: List[str]) -> Callable[[], None]:
+    def executar():
+        for valor in valores:
+            metodo(valor)
+    return executar
+
+
+def _loop_ciclico(metodo: Callable, itens: Sequence, operacoes: int) -> Callable[[], None]:
+    """Chama `metodo` `operacoes` vezes, percorrendo `itens` em ciclo."""
+    completas, resto = divmod(operacoes, len(itens))
+
+    def executar():
+        for _ in range(completas):
+            for item in itens:
+                metodo(item)
+        for item in islice(itens, resto):
+            metodo(item)
+    return executar
+
+
+def executar_benchmark(tamanhos: List[int], categorias=CATEGORIAS, campos=CAMPOS,
+                       workers: int = 0, repeticoes: int = 3,
+                       tamanho_patologico: int = 256, progresso: bool = True) -> dict:
+    validador = ValidadorDados()
+    estrito = ValidadorDados(cpf_estrito=True, data_estrita=True, telefone_estrito=True)
+    resultados = []
+
+    def registrar(alvo: str, categoria: str, tamanho: int, ns_por_op: float):
+        resultados.append({'alvo': alvo, 'categoria': categoria,
+                           'tamanho': tamanho, 'ns_por_op': round(ns_por_op, 1)})
+        if progresso:
+            print(f"{alvo:<28} {categoria:<10} {tamanho:>10}  {ns_por_op:>10.1f} ns/op", flush=True)
+
+    for tamanho in tamanhos:
+        for categoria in categorias:
+            colunas = {}
+            for campo in campos:
+                valores = gerar_valores(campo, categoria, tamanho, tamanho_patologico=tamanho_patologico)
+                metodo = getattr(validador, f'validar_{campo}')
+                registrar(f'validar_{campo}', categoria, tamanho,
+                          medir(_loop_metodo(metodo, valores), tamanho, repeticoes))
+                colunas[campo] = valores
+
+                # Motor posicional contra a regex original, sem o restante da validação
+                if campo in MASCARAS:
+                    registrar(f'regex_{campo}', categoria, tamanho,
+                              medir(_loop_metodo(validador.patterns[campo].match, valores), tamanho, repeticoes))
+                    registrar(f'mascara_{campo}', categoria, tamanho,
+                              medir(_loop_metodo(validador.campos[campo].casador, valores), tamanho, repeticoes))
+                    if campo in ('cpf', 'data_horario', 'telefone'):
+                        # Modos estritos: dígitos verificadores, calendário e plano de DDDs
+                        registrar(f'{campo}_estrito', categoria, tamanho,
+                                  medir(_loop_metodo(getattr(estrito, f'validar_{campo}'), valores), tamanho, repeticoes))
+                        registrar(f'{campo}_estrito_lote', categoria, tamanho,
+                                  medir(lambda: estrito.validar_lote({campo: valores}), tamanho, repeticoes))
+                    if validacao_numpy.disponivel():
+                        array = validacao_numpy.np.array(valores)
+                        registrar(f'numpy_{campo}', categoria, tamanho,
+                                  medir(lambda: validador.validar_coluna_numpy(campo, array), tamanho, repeticoes))
+                        if campo in ('cpf', 'data_horario', 'telefone'):
+                            registrar(f'numpy_{campo}_estrito', categoria, tamanho,
+                                      medir(lambda: estrito.validar_coluna_numpy(campo, array), tamanho, repeticoes))
+
+            # Identificação do tipo: autômato produto contra os nove validadores em sequência.
+            # Registros e valores mistos vêm em um bloco limitado, percorrido em ciclo,
+            # para a memória não crescer com o tamanho (10M registros seriam ~6 GB de dicts)
+            bloco = min(tamanho, BLOCO_REGISTROS)
+            valores_mistos = list(islice(chain.from_iterable(zip(*colunas.values())), bloco))
+            metodos = [getattr(validador, f'validar_{campo}') for campo in campos]
+            registrar('detectar_tipos', categoria, tamanho,
+                      medir(_loop_ciclico(validador.detectar_tipos, valores_mistos, tamanho), tamanho, repeticoes))
+            registrar('detectar_por_validadores', categoria, tamanho,
+                      medir(_loop_ciclico(lambda v: [m(v) for m in metodos], valores_mistos, tamanho),
+                            tamanho, repeticoes))
+            del valores_mistos
+
+            registros = [dict(zip(colunas, linha)) for linha in islice(zip(*colunas.values()), bloco)]
+            registrar('validar_todos_campos', categoria, tamanho,
+                      medir(_loop_ciclico(validador.validar_todos_campos, registros, tamanho), tamanho, repeticoes))
+            plano = validador.compilar_plano(campos)
+            registrar('plano_registro', categoria, tamanho,
+                      medir(_loop_ciclico(plano, registros, tamanho), tamanho, repeticoes))
+            registrar('plano_valido', categoria, tamanho,
+                      medir(_loop_ciclico(plano.valido, registros, tamanho), tamanho, repeticoes))
+            registrar('falha_rapida', categoria, tamanho,
+                      medir(_loop_ciclico(validador.registro_valido, registros, tamanho), tamanho, repeticoes))
+            del registros
+
+            registrar('validar_lote', categoria, tamanho,
+                      medir(lambda: validador.validar_lote(colunas), tamanho, repeticoes))
+
+            # Os dados repetem DISTINTOS valores por campo, então o cache acerta quase sempre
+            com_cache = ValidadorDados(tamanho_cache=len(campos) * DISTINTOS)
+            registrar('validar_lote_cache', categoria, tamanho,
+                      medir(lambda: com_cache.validar_lote(colunas), tamanho, repeticoes))
+
+            if workers > 1:
+                from processamento_paralelo import ExecutorValidacao
+                tamanho_bloco = max(1000, tamanho // (workers * 4))
+                with ExecutorValidacao(workers, tamanho_bloco) as executor:
+                    executor.validar_lote({campo: valores[:1] for campo, valores in colunas.items()})
+                    registrar(f'paralelo_{workers}', categoria, tamanho,
+                              medir(lambda: executor.validar_lote(colunas), tamanho, repeticoes))
+
+    return {
+        'meta': {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'repeticoes': repeticoes,
+            'tamanho_patologico': tamanho_patologico,
+        },
+        'resultados': resultados,
+    }
+
+
+def _chave(resultado: dict) -> tuple:
+    return resultado['alvo'], resultado['categoria'], resultado['tamanho']
+
+
+def comparar(atual: dict, anterior: dict, tolerancia: float = 0.10) -> List[dict]:
+    """Lista as medições de `atual` mais lentas que `anterior` além da tolerância (0.10 = 10%)."""
+    base = {_chave(r): r['ns_por_op'] for r in anterior['resultados']}
+    regressoes = []
+    for resultado in atual['resultados']:
+        antes = base.get(_chave(resultado))
+        if antes and resultado['ns_por_op'] > antes * (1 + tolerancia):
+            regressoes.append({**resultado, 'ns_por_op_anterior': antes,
+                               'variacao': round(resultado['ns_por_op'] / antes - 1, 3)})
+    return regressoes
+
+
+def interpretar_tamanho(texto: str) -> int:
+    texto = texto.strip().lower()
+    multiplicador = {'k': 1_000, 'm': 1_000_000}.get(texto[-1:], 1)
+    if multiplicador > 1:
+        texto = texto[:-1]
+    return int(float(texto) * multiplicador)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark dos validadores de dados')
+    parser.add_argument('--tamanhos', default='10k',
+                        help='tamanhos dos conjuntos, separados por vírgula (ex.: 10k,1m,10m)')
+    parser.add_argument('--categorias', default=','.join(CATEGORIAS),
+                        help=f"categorias de entrada (padrão: {','.join(CATEGORIAS)})")
+    parser.add_argument('--workers', type=int, default=0,
+                        help='também mede o modo paralelo com N processos')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--tamanho-patologico', type=int, default=256,
+                        help='comprimento base das entradas patológicas')
+    parser.add_argument('--saida', help='grava os resultados neste arquivo JSON')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior para detectar regressões')
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help='piora relativa aceita antes de acusar regressão (padrão: 0.10)')
+    args = parser.parse_args(argv)
+
+    tamanhos = [interpretar_tamanho(t) for t in args.tamanhos.split(',')]
+    categorias = [c.strip() for c in args.categorias.split(',')]
+    relatorio = executar_benchmark(tamanhos, categorias, workers=args.workers,
+                                   repeticoes=args.repeticoes,
+                                   tamanho_patologico=args.tamanho_patologico)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            anterior = json.load(arquivo)
+        regressoes = comparar(relatorio, anterior, args.tolerancia)
+        medidas_anteriores = {_chave(a) for a in anterior['resultados']}
+        if not regressoes and medidas_anteriores.isdisjoint(map(_chave, relatorio['resultados'])):
+            print("\n⚠️  Nenhuma medição em comum com a execução anterior")
+            return 1
+        if regressoes:
+            print(f"\n⚠️  {len(regressoes)} regressões acima de {args.tolerancia:.0%}:")
+            for r in regressoes:
+                print(f"  {r['alvo']} [{r['categoria']}, {r['tamanho']}]: "
+                      f"{r['ns_por_op_anterior']:.1f} -> {r['ns_por_op']:.1f} ns/op ({r['variacao']:+.0%})")
+            return 1
+        print("\n✅ Nenhuma regressão encontrada")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
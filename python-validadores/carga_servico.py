@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Teste de carga do serviço de validação (servico_validacao.py).
+
+Sobe o serviço localmente (ou usa um já em execução, com --url), dispara
+requisições com N conexões keep-alive simultâneas e informa vazão,
+percentis de latência e taxa de erros por tipo de carga:
+
+    python carga_servico.py --concorrencia 64 --duracao 10
+    python carga_servico.py --mistura campo=80,registro=15,lote=5 --tamanho-lote 1000
+    python carga_servico.py --url http://127.0.0.1:8080 --saida carga.json
+
+Tudo roda em localhost, sem acesso à rede. O cliente é um único processo
+asyncio; para medir o teto do servidor, compare com o uso de CPU dele.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmark_validadores import gerar_valores
+from validador_dados import CAMPOS
+
+TIPOS_CARGA = ('campo', 'registro', 'lote')
+MISTURA_PADRAO = 'campo=70,registro=25,lote=5'
+
+# Corpos distintos pré-gerados por tipo de carga
+VARIACOES = 200
+
+
+def interpretar_mistura(texto: str) -> Dict[str, float]:
+    """Converte 'campo=70,registro=30' em pesos {'campo': 70.0, 'registro': 30.0}."""
+    mistura = {}
+    for item in texto.split(','):
+        tipo, _, peso = item.partition('=')
+        tipo = tipo.strip()
+        if tipo not in TIPOS_CARGA:
+            raise ValueError(f"Tipo de carga desconhecido '{tipo}' (tipos: {', '.join(TIPOS_CARGA)})")
+        mistura[tipo] = float(peso or 1)
+    if not any(mistura.values()):
+        raise ValueError("A mistura precisa de algum peso positivo")
+    return mistura
+
+
+def gerar_requisicoes(tamanho_lote: int, fracao_invalidos: float = 0.2,
+                      semente: int = 42) -> Dict[str, List[Tuple[str, bytes]]]:
+    """Corpos das requisições de cada tipo: (caminho, JSON)."""
+    rng = random.Random(semente)
+    total = max(VARIACOES, tamanho_lote)
+    valores = {campo: (gerar_valores(campo, 'valido', total, semente),
+                       gerar_valores(campo, 'invalido', total, semente)) for campo in CAMPOS}
+
+    def valor(campo: str, indice: int) -> str:
+        validos, invalidos = valores[campo]
+        return (invalidos if rng.random() < fracao_invalidos else validos)[indice % total]
+
+    def registro(indice: int) -> Dict[str, str]:
+        return {campo: valor(campo, indice) for campo in CAMPOS}
+
+    requisicoes = {'campo': [], 'registro': [], 'lote': []}
+    for indice in range(VARIACOES):
+        campo = CAMPOS[indice % len(CAMPOS)]
+        requisicoes['campo'].append((f'/validar/{campo}', json.dumps({'valor': valor(campo, indice)}).encode()))
+        requisicoes['registro'].append(('/validar', json.dumps(registro(indice)).encode()))
+    for indice in range(max(1, VARIACOES // 20)):
+        lote = [registro(indice * tamanho_lote + i) for i in range(tamanho_lote)]
+        requisicoes['lote'].append(('/lote', json.dumps(lote).encode()))
+    return requisicoes
+
+
+class Estatisticas:
+    """Latências e erros de um tipo de carga."""
+
+    def __init__(self):
+        self.latencias: List[float] = []
+        self.erros: Dict[str, int] = {}
+
+    def registrar_erro(self, motivo: str) -> None:
+        self.erros[motivo] = self.erros.get(motivo, 0) + 1
+
+    def resumo(self, duracao: float) -> dict:
+        total_erros = sum(self.erros.values())
+        total = len(self.latencias) + total_erros
+        ordenadas = sorted(self.latencias)
+        return {
+            'requisicoes': total,
+            'por_segundo': round(total / duracao, 1) if duracao > 0 else 0.0,
+            'taxa_erros': round(total_erros / total, 4) if total else 0.0,
+            'erros': dict(self.erros),
+            'p50_ms': round(percentil(ordenadas, 50) * 1000, 3),
+            'p90_ms': round(percentil(ordenadas, 90) * 1000, 3),
+            'p99_ms': round(percentil(ordenadas, 99) * 1000, 3),
+            'max_ms': round(ordenadas[-1] * 1000, 3) if ordenadas else 0.0,
+        }
+
+
+def percentil(ordenadas: List[float], p: float) -> float:
+    """Percentil pelo método do posto mais próximo, sobre uma lista já ordenada."""
+    if not ordenadas:
+        return 0.0
+    posicao = max(0, min(len(ordenadas) - 1, int(round(p / 100 * len(ordenadas))) - 1))
+    return ordenadas[posicao]
+
+
+async def _ler_resposta(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    cabecalho = await reader.readuntil(b'\r\n\r\n')
+    linhas = cabecalho.decode('latin-1').split('\r\n')
+    status = int(linhas[0].split(' ', 2)[1])
+    cabecalhos = {}
+    for linha in linhas[1:]:
+        nome, _, valor = linha.partition(':')
+        cabecalhos[nome.strip().lower()] = valor.strip()
+
+    if cabecalhos.get('transfer-encoding', '').lower() == 'chunked':
+        partes = []
+        while True:
+            tamanho = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if tamanho == 0:
+                await reader.readuntil(b'\r\n')
+                return status, b''.join(partes)
+            partes.append(await reader.readexactly(tamanho))
+            await reader.readexactly(2)
+    return status, await reader.readexactly(int(cabecalhos.get('content-length', 0)))
+
+
+async def _cliente(host: str, porta: int, requisicoes: Dict[str, List[Tuple[str, bytes]]],
+                   tipos: List[str], pesos: List[float], fim: float, semente: int,
+                   estatisticas: Dict[str, Estatisticas]) -> None:
+    rng = random.Random(semente)
+    reader = writer = None
+    try:
+        while time.perf_counter() < fim:
+            tipo = rng.choices(tipos, pesos)[0]
+            caminho, corpo = rng.choice(requisicoes[tipo])
+            mensagem = (f'POST {caminho} HTTP/1.1\r\nHost: {host}\r\n'
+                        f'Content-Type: application/json\r\nContent-Length: {len(corpo)}\r\n\r\n'
+                        ).encode('latin-1') + corpo
+            inicio = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, porta, limit=1 << 20)
+                writer.write(mensagem)
+                status, _ = await _ler_resposta(reader)
+            except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+                estatisticas[tipo].registrar_erro(type(e).__name__)
+                if writer is not None:
+                    writer.close()
+                reader = writer = None
+                await asyncio.sleep(0.01)
+                continue
+            if 200 <= status < 300:
+                estatisticas[tipo].latencias.append(time.perf_counter() - inicio)
+            else:
+                estatisticas[tipo].registrar_erro(f'HTTP {status}')
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def gerar_carga(host: str, porta: int, concorrencia: int, duracao: float,
+                      mistura: Dict[str, float], tamanho_lote: int = 1000,
+                      semente: int = 42) -> dict:
+    """Dispara `concorrencia` clientes por `duracao` segundos e devolve o relatório."""
+    requisicoes = gerar_requisicoes(tamanho_lote, semente=semente)
+    tipos = [tipo for tipo, peso in mistura.items() if peso > 0]
+    pesos = [mistura[tipo] for tipo in tipos]
+    estatisticas = {tipo: Estatisticas() for tipo in tipos}
+
+    inicio = time.perf_counter()
+    fim = inicio + duracao
+    await asyncio.gather(*(_cliente(host, porta, requisicoes, tipos, pesos, fim, semente + i, estatisticas)
+                           for i in range(concorrencia)))
+    decorrido = time.perf_counter() - inicio
+
+    geral = Estatisticas()
+    for parcial in estatisticas.values():
+        geral.latencias.extend(parcial.latencias)
+        for motivo, quantidade in parcial.erros.items():
+            geral.erros[motivo] = geral.erros.get(motivo, 0) + quantidade
+
+    return {
+        'concorrencia': concorrencia,
+        'duracao_s': round(decorrido, 3),
+        'mistura': mistura,
+        'tamanho_lote': tamanho_lote,
+        'total': geral.resumo(decorrido),
+        'por_tipo': {tipo: parcial.resumo(decorrido) for tipo, parcial in estatisticas.items()},
+    }
+
+
+def iniciar_servidor_local(argumentos: List[str]) -> Tuple[subprocess.Popen, int]:
+    """Sobe servico_validacao.py numa porta livre e devolve (processo, porta)."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'servico_validacao.py')
+    processo = subprocess.Popen([sys.executable, script, '--porta', '0'] + argumentos,
+                                stdout=subprocess.PIPE, text=True, start_new_session=True)
+    # Primeira linha: "Serviço de validação em http://127.0.0.1:PORTA (...)"
+    endereco = re.search(r'http://[^:/\s]+:(\d+)', processo.stdout.readline())
+    if endereco is None:
+        parar_servidor_local(processo)
+        raise RuntimeError("O serviço de validação não iniciou")
+    return processo, int(endereco.group(1))
+
+
+def parar_servidor_local(processo: subprocess.Popen, espera: float = 10.0) -> None:
+    """Encerra o serviço com SIGTERM; se não sair a tempo, mata o grupo todo.
+
+    O serviço roda numa sessão própria, então o SIGKILL do grupo também
+    alcança os workers do pool, que de outro modo ficariam órfãos.
+    """
+    if processo.poll() is None:
+        processo.terminate()
+        try:
+            processo.wait(timeout=espera)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(processo.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+    processo.wait()
+    try:
+        # Workers que sobreviveram ao líder ainda estão no grupo
+        os.killpg(processo.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    if processo.stdout is not None:
+        processo.stdout.close()
+
+
+def imprimir_relatorio(relatorio: dict) -> None:
+    print(f"Concorrência: {relatorio['concorrencia']}  Duração: {relatorio['duracao_s']:.1f}s")
+    print(f"{'tipo':<10} {'req':>9} {'req/s':>10} {'erros':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+    linhas = list(relatorio['por_tipo'].items()) + [('total', relatorio['total'])]
+    for tipo, r in linhas:
+        print(f"{tipo:<10} {r['requisicoes']:>9} {r['por_segundo']:>10.1f} {r['taxa_erros']:>8.2%} "
+              f"{r['p50_ms']:>9.3f} {r['p90_ms']:>9.3f} {r['p99_ms']:>9.3f}")
+    if relatorio['total']['erros']:
+        print("Erros:", ', '.join(f"{motivo}: {n}" for motivo, n in relatorio['total']['erros'].items()))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Teste de carga do serviço de validação')
+    parser.add_argument('--url', help='serviço já em execução (padrão: sobe um local numa porta livre)')
+    parser.add_argument('-n', '--concorrencia', type=int, default=32, help='conexões simultâneas (padrão: 32)')
+    parser.add_argument('-d', '--duracao', type=float, default=10.0, help='segundos de carga (padrão: 10)')
+    parser.add_argument('--mistura', default=MISTURA_PADRAO,
+                        help=f'pesos por tipo de carga (padrão: {MISTURA_PADRAO})')
+    parser.add_argument('--tamanho-lote', type=int, default=1000, help='registros por lote (padrão: 1000)')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='workers do serviço local (padrão: o do serviço, um por CPU)')
+    parser.add_argument('--saida', help='grava o relatório neste arquivo JSON')
+    parser.add_argument('--max-erros', type=float, default=0.0,
+                        help='taxa de erros aceita antes de sair com código 1 (padrão: 0)')
+    args = parser.parse_args(argv)
+
+    try:
+        mistura = interpretar_mistura(args.mistura)
+    except ValueError as e:
+        parser.error(str(e))
+
+    processo = None
+    if args.url:
+        endereco = urlsplit(args.url)
+        host, porta = endereco.hostname or '127.0.0.1', endereco.port or 80
+    else:
+        processo, porta = iniciar_servidor_local([] if args.workers is None else ['--workers', str(args.workers)])
+        host = '127.0.0.1'
+
+    try:
+        relatorio = asyncio.run(gerar_carga(host, porta, args.concorrencia, args.duracao,
+                                            mistura, args.tamanho_lote))
+    finally:
+        if processo is not None:
+            parar_servidor_local(processo)
+
+    imprimir_relatorio(relatorio)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nRelatório gravado em {args.saida}")
+    return 1 if relatorio['total']['taxa_erros'] > args.max_erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
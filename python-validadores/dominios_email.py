@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Listas de domínios de email (permitidos e bloqueados).
+
+Uma lista é um arquivo de texto com um domínio por linha ('#' começa um
+comentário; '@' e '*.' no início são ignorados). Um domínio da lista cobre
+também os seus subdomínios: bloquear 'descartavel.br' bloqueia
+'x.descartavel.br'. Cada consulta procura o domínio e cada sufixo dele, em
+tempo proporcional ao tamanho do domínio.
+
+- ConjuntoDominios: as listas carregadas num frozenset (cerca de 0,1 s
+  para 300 mil domínios; para listas grandes, prefira o índice).
+- IndiceDominios: as listas gravadas uma vez num arquivo binário (tabela
+  de dispersão com endereçamento aberto, crc32) e mapeadas em memória:
+  abrir é instantâneo e os processos compartilham as páginas.
+
+    python dominios_email.py descartaveis.txt outros.txt bloqueados.idx
+
+Depois, ValidadorDados().usar_dominios_email(bloqueados='bloqueados.idx').
+"""
+
+import argparse
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Union
+from zlib import crc32
+
+# Cabeçalho: assinatura, versão, número de domínios e de posições da tabela (little-endian)
+MAGICA = b'DOMIDX'
+VERSAO = 1
+CABECALHO = struct.Struct('<6sHII')
+
+# Maior domínio aceito (RFC 1035), para caber no byte de tamanho do índice
+MAX_DOMINIO = 253
+
+_COMENTARIOS = re.compile(r'#[^\n]*')
+_PREFIXOS = re.compile(r'(?<!\S)(?:@|\*\.)')
+
+
+def normalizar_dominio(texto: str) -> str:
+    """' @Exemplo.BR ' -> 'exemplo.br'; '*.exemplo.br' -> 'exemplo.br'."""
+    dominio = texto.strip().lower()
+    if dominio.startswith('@'):
+        dominio = dominio[1:]
+    elif dominio.startswith('*.'):
+        dominio = dominio[2:]
+    return dominio
+
+
+def ler_dominios(caminho: str, encoding: str = 'utf-8') -> FrozenSet[str]:
+    """Domínios normalizados de uma lista em texto, sem comentários.
+
+    O arquivo é tratado de uma vez (expressões regulares e split sobre o
+    texto todo), sem laço em Python por linha.
+    """
+    with open(caminho, encoding=encoding) as arquivo:
+        texto = arquivo.read().lower()
+    if '#' in texto:
+        texto = _COMENTARIOS.sub('', texto)
+    if '@' in texto or '*' in texto:
+        texto = _PREFIXOS.sub('', texto)
+    return frozenset(texto.split())
+
+
+class ConjuntoDominios:
+    """Lista de domínios em memória (frozenset)."""
+
+    __slots__ = ('dominios',)
+
+    def __init__(self, dominios: Iterable[str]):
+        self.dominios = dominios if isinstance(dominios, frozenset) else frozenset(dominios)
+
+    @classmethod
+    def carregar(cls, caminhos: Union[str, Sequence[str]], encoding: str = 'utf-8') -> 'ConjuntoDominios':
+        caminhos = [caminhos] if isinstance(caminhos, str) else caminhos
+        listas = [ler_dominios(caminho, encoding) for caminho in caminhos]
+        return cls(listas[0] if len(listas) == 1 else frozenset().union(*listas))
+
+    def contem(self, dominio: str) -> bool:
+        """Se o domínio (já em minúsculas) ou um domínio pai está na lista."""
+        dominios = self.dominios
+        if dominio in dominios:
+            return True
+        ponto = dominio.find('.')
+        while ponto >= 0:
+            if dominio[ponto + 1:] in dominios:
+                return True
+            ponto = dominio.find('.', ponto + 1)
+        return False
+
+    def __contains__(self, dominio: str) -> bool:
+        return self.contem(normalizar_dominio(dominio))
+
+    def __len__(self) -> int:
+        return len(self.dominios)
+
+
+def gravar_indice(dominios: Iterable[str], saida: str) -> int:
+    """Grava os domínios no formato binário do índice e devolve quantos foram gravados.
+
+    Formato: cabeçalho, tabela de `posicoes` inteiros de 32 bits (0 = vazia,
+    senão 1 + deslocamento do domínio nos dados) e os dados (um byte de
+    tamanho seguido do domínio em UTF-8). `posicoes` é uma potência de 2
+    com ao menos o dobro de domínios.
+    """
+    unicos = sorted(set(dominios))
+    posicoes = 1
+    while posicoes < 2 * len(unicos):
+        posicoes *= 2
+    mascara = posicoes - 1
+    tabela = array('I', bytes(4 * posicoes))
+    if tabela.itemsize != 4:
+        raise RuntimeError("O índice de domínios requer inteiros de 32 bits em array('I')")
+    dados = bytearray()
+    for dominio in unicos:
+        chave = dominio.encode('utf-8')
+        if len(chave) > MAX_DOMINIO:
+            raise ValueError(f"Domínio inválido: '{dominio[:60]}...' (máximo {MAX_DOMINIO} bytes)")
+        posicao = crc32(chave) & mascara
+        while tabela[posicao]:
+            posicao = (posicao + 1) & mascara
+        tabela[posicao] = len(dados) + 1
+        dados.append(len(chave))
+        dados += chave
+    if sys.byteorder != 'little':
+        tabela.byteswap()
+    with open(saida, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICA, VERSAO, len(unicos), posicoes))
+        tabela.tofile(arquivo)
+        arquivo.write(dados)
+    return len(unicos)
+
+
+def construir_indice(entradas: Sequence[str], saida: str, encoding: str = 'utf-8') -> int:
+    """Lê as listas em texto `entradas` e grava o índice em `saida`."""
+    return gravar_indice(frozenset().union(*(ler_dominios(entrada, encoding) for entrada in entradas)), saida)
+
+
+class IndiceDominios:
+    """Lista de domínios num índice binário mapeado em memória (somente leitura).
+
+    Como o IndiceCEP, ao ser serializado leva só o caminho.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, 'rb') as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magica, versao, quantidade, posicoes = CABECALHO.unpack_from(self._mapa)
+        except struct.error:
+            magica, versao, quantidade, posicoes = b'', 0, 0, 0
+        inicio_dados = CABECALHO.size + 4 * posicoes
+        if (magica != MAGICA or versao != VERSAO or posicoes & (posicoes - 1) or posicoes <= quantidade
+                or len(self._mapa) < inicio_dados):
+            self._mapa.close()
+            raise ValueError(f"'{caminho}' não é um índice de domínios válido (gere com dominios_email.py)")
+        self.quantidade = quantidade
+        self._mascara = posicoes - 1
+        if sys.byteorder == 'little':
+            self._tabela = memoryview(self._mapa)[CABECALHO.size:inicio_dados].cast('I')
+        else:  # pragma: no cover - cópia convertida em máquinas big-endian
+            self._tabela = array('I', self._mapa[CABECALHO.size:inicio_dados])
+            self._tabela.byteswap()
+        # Deslocamentos da tabela são relativos aos dados; -1 compensa o 1 de "ocupada"
+        self._base = inicio_dados - 1
+
+    def contem(self, dominio: str) -> bool:
+        """Se o domínio (já em minúsculas) ou um domínio pai está na lista."""
+        try:
+            chave = dominio.encode('utf-8')
+        except UnicodeEncodeError:
+            return False
+        tabela = self._tabela
+        mapa = self._mapa
+        mascara = self._mascara
+        base = self._base
+        inicio = 0
+        while True:
+            sufixo = chave[inicio:] if inicio else chave
+            # Entrada procurada nos dados: o byte de tamanho seguido do sufixo
+            registro = bytes((len(sufixo),)) + sufixo
+            posicao = crc32(sufixo) & mascara
+            entrada = tabela[posicao]
+            while entrada:
+                deslocamento = base + entrada
+                if mapa[deslocamento:deslocamento + len(registro)] == registro:
+                    return True
+                posicao = (posicao + 1) & mascara
+                entrada = tabela[posicao]
+            inicio = chave.find(b'.', inicio) + 1
+            if not inicio:
+                return False
+
+    def __contains__(self, dominio: str) -> bool:
+        return self.contem(normalizar_dominio(dominio))
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def __reduce__(self):
+        return IndiceDominios, (self.caminho,)
+
+    def fechar(self) -> None:
+        if isinstance(self._tabela, memoryview):
+            self._tabela.release()
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+ListaDominios = Union[ConjuntoDominios, IndiceDominios]
+# Caminho de uma lista (texto ou índice), vários caminhos de listas em texto, ou uma lista aberta
+FonteDominios = Union[str, Sequence[str], ListaDominios]
+
+
+def abrir_dominios(fonte: FonteDominios) -> ListaDominios:
+    """Abre uma lista de domínios: um índice binário (de dominios_email.py),
+    uma ou mais listas em texto, ou uma lista já aberta."""
+    if isinstance(fonte, (ConjuntoDominios, IndiceDominios)):
+        return fonte
+    caminhos = [fonte] if isinstance(fonte, str) else list(fonte)
+    indices = [caminho for caminho in caminhos if _e_indice(caminho)]
+    if not indices:
+        return ConjuntoDominios.carregar(caminhos)
+    if len(caminhos) > 1:
+        raise ValueError(f"'{indices[0]}' é um índice e não pode ser combinado com outras listas "
+                         f"(gere um único índice com todas elas)")
+    return IndiceDominios(indices[0])
+
+
+def _e_indice(caminho: str) -> bool:
+    with open(caminho, 'rb') as arquivo:
+        return arquivo.read(len(MAGICA)) == MAGICA
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Constrói o índice binário de uma lista de domínios de email')
+    parser.add_argument('entradas', nargs='+', help='listas de domínios em texto (um por linha)')
+    parser.add_argument('saida', help='arquivo do índice (ex.: bloqueados.idx)')
+    parser.add_argument('--encoding', default='utf-8', help='codificação das listas (padrão: utf-8)')
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        quantidade = construir_indice(args.entradas, args.saida, encoding=args.encoding)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    print(f"{quantidade} domínios gravados em {args.saida} ({time.perf_counter() - inicio:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
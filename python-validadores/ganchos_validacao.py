@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ganchos de diagnóstico do ValidadorDados.
+
+- Gancho: callbacks antes(campo, valor) e depois(campo, valor, resultado,
+  segundos) em torno de cada validação (veja ValidadorDados.adicionar_gancho).
+- RegistroLentas: gancho "depois" que registra, por amostragem, as chamadas
+  acima de um limiar, com o valor que as causou.
+- capturar: perfil (cProfile) ou alocações (tracemalloc) de uma execução em
+  lote. Pode ser ligado sem mudar código, pela variável de ambiente
+  VALIDADOR_CAPTURA=cprofile|tracemalloc (saída em VALIDADOR_CAPTURA_SAIDA)
+  ou pela opção --captura da linha de comando.
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional
+
+VARIAVEL_CAPTURA = 'VALIDADOR_CAPTURA'
+VARIAVEL_SAIDA = 'VALIDADOR_CAPTURA_SAIDA'
+MODOS_CAPTURA = ('cprofile', 'tracemalloc')
+
+# Comprimento máximo do valor guardado em cada registro de chamada lenta
+MAX_VALOR = 200
+
+logger = logging.getLogger('validador_dados')
+
+
+class Gancho(NamedTuple):
+    """Callbacks em torno de cada validação; qualquer um pode ser None."""
+    antes: Optional[Callable[[str, str], None]] = None
+    depois: Optional[Callable[[str, str, object, float], None]] = None
+
+
+class RegistroLentas:
+    """Registra chamadas mais lentas que `limiar` segundos.
+
+    Só uma fração `amostragem` das chamadas lentas é registrada. Cada
+    registro ({campo, valor, tamanho, segundos, valido}) vai para `destino`
+    (padrão: o logger 'validador_dados', nível WARNING) e fica também nas
+    últimas `maximo` entradas de `self.lentas`.
+    """
+
+    def __init__(self, limiar: float = 1e-4, amostragem: float = 1.0,
+                 destino: Optional[Callable[[dict], None]] = None, maximo: int = 1000,
+                 semente: Optional[int] = None):
+        self.limiar = limiar
+        self.amostragem = amostragem
+        self.destino = destino or destino_logging()
+        self.lentas = deque(maxlen=maximo)
+        self.total_lentas = 0
+        # Identificador devolvido por adicionar_gancho, para remover_gancho
+        self.gancho: Optional[Gancho] = None
+        self._sortear = random.Random(semente).random
+
+    def __call__(self, campo: str, valor: str, resultado, segundos: float) -> None:
+        if segundos < self.limiar:
+            return
+        self.total_lentas += 1
+        if self.amostragem < 1.0 and self._sortear() >= self.amostragem:
+            return
+        texto = valor if isinstance(valor, str) else repr(valor)
+        registro = {
+            'campo': campo,
+            'valor': texto[:MAX_VALOR],
+            'tamanho': len(texto),
+            'segundos': segundos,
+            'valido': bool(resultado[0]),
+        }
+        self.lentas.append(registro)
+        self.destino(registro)
+
+
+def destino_logging(registrador: logging.Logger = logger, nivel: int = logging.WARNING) -> Callable[[dict], None]:
+    def registrar(registro: dict) -> None:
+        registrador.log(nivel, "Validação lenta de %s: %.1f µs (%d caracteres): %r",
+                        registro['campo'], registro['segundos'] * 1e6, registro['tamanho'], registro['valor'])
+    return registrar
+
+
+def destino_jsonl(caminho: str) -> Callable[[dict], None]:
+    """Acrescenta cada registro como uma linha JSON em `caminho`."""
+    def registrar(registro: dict) -> None:
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+    return registrar
+
+
+@contextmanager
+def capturar(modo: Optional[str], saida: Optional[str] = None, linhas: int = 20) -> Iterator[None]:
+    """Captura perfil (cProfile) ou alocações (tracemalloc) do bloco.
+
+    Com `modo` None não faz nada. O resumo vai para stderr e, com `saida`,
+    o resultado completo é gravado no arquivo (cProfile: formato pstats;
+    tracemalloc: texto). Mede apenas o processo atual; para perfilar a
+    validação em si, use workers=1.
+    """
+    if modo is None:
+        yield
+        return
+    if modo not in MODOS_CAPTURA:
+        raise ValueError(f"Modo de captura desconhecido '{modo}' (use {', '.join(MODOS_CAPTURA)})")
+
+    if modo == 'cprofile':
+        import cProfile
+        import pstats
+        perfil = cProfile.Profile()
+        perfil.enable()
+        try:
+            yield
+        finally:
+            perfil.disable()
+            if saida:
+                perfil.dump_stats(saida)
+            estatisticas = pstats.Stats(perfil, stream=sys.stderr)
+            estatisticas.sort_stats('cumulative').print_stats(linhas)
+        return
+
+    import tracemalloc
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        foto = tracemalloc.take_snapshot()
+        atual, pico = tracemalloc.get_traced_memory()
+        if not ja_ativo:
+            tracemalloc.stop()
+        maiores = foto.statistics('lineno')
+        resumo = [f"tracemalloc: atual {atual / 1024:.1f} KiB, pico {pico / 1024:.1f} KiB, "
+                  f"{time.perf_counter() - inicio:.3f}s"]
+        resumo += [str(estatistica) for estatistica in maiores[:linhas]]
+        print('\n'.join(resumo), file=sys.stderr)
+        if saida:
+            with open(saida, 'w', encoding='utf-8') as arquivo:
+                arquivo.write('\n'.join(resumo[:1] + [str(estatistica) for estatistica in maiores]) + '\n')
+
+
+def captura_do_ambiente() -> Optional[str]:
+    """Modo de captura pedido em VALIDADOR_CAPTURA (ou None)."""
+    return os.environ.get(VARIAVEL_CAPTURA) or None
+
+
+def capturar_do_ambiente():
+    """capturar() configurado pelas variáveis de ambiente; sem elas, não faz nada."""
+    return capturar(captura_do_ambiente(), os.environ.get(VARIAVEL_SAIDA) or None)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Índice de faixas de CEP para conferir se um CEP existe.
+
+O índice é construído uma vez a partir de um CSV de faixas (CEP inicial e
+final por linha, ou um CEP por linha) e gravado como um arquivo binário
+compacto: as faixas ordenadas e sem sobreposição, em dois vetores de
+inteiros de 32 bits (inícios e fins), precedidos de um diretório com a
+primeira faixa de cada grupo de CEPs (os três primeiros dígitos), que
+restringe a busca a poucas faixas. O validador mapeia o arquivo em memória
+(mmap) e procura cada CEP por busca binária: abrir o índice é instantâneo e
+as páginas são compartilhadas entre os processos.
+
+    python indice_cep.py faixas.csv ceps.idx --inicio cep_inicial --fim cep_final -d ';'
+
+Depois, ValidadorDados(indice_cep='ceps.idx') ou v.usar_indice_cep('ceps.idx').
+"""
+
+import argparse
+import csv
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+# Cabeçalho: assinatura, versão e número de faixas (little-endian)
+MAGICA = b'CEPIDX'
+VERSAO = 1
+CABECALHO = struct.Struct('<6sHI')
+
+# Diretório: posição da primeira faixa que começa em cada grupo de CEPs
+TAMANHO_GRUPO = 100000
+GRUPOS = 1000
+MAIOR_CEP = TAMANHO_GRUPO * GRUPOS - 1
+
+_NAO_DIGITOS = re.compile(r'\D')
+
+
+def numero_cep(texto: str) -> int:
+    """'66.645-225', '66645-225' ou '66645225' -> 66645225."""
+    digitos = _NAO_DIGITOS.sub('', texto)
+    if len(digitos) != 8:
+        raise ValueError(f"CEP inválido: '{texto}'")
+    return int(digitos)
+
+
+def ler_faixas(caminho: str, inicio: str = 'cep_inicial', fim: Optional[str] = 'cep_final',
+               delimitador: str = ',', encoding: str = 'utf-8') -> Iterator[Tuple[int, int]]:
+    """Faixas (inicial, final) das colunas `inicio` e `fim` do CSV; sem `fim`, um CEP por linha."""
+    with open(caminho, newline='', encoding=encoding) as arquivo:
+        leitor = csv.DictReader(arquivo, delimiter=delimitador)
+        colunas = [inicio] + ([fim] if fim else [])
+        ausentes = [coluna for coluna in colunas if coluna not in (leitor.fieldnames or ())]
+        if ausentes:
+            raise ValueError(f"Colunas ausentes em '{caminho}': {', '.join(ausentes)}")
+        for numero, linha in enumerate(leitor, 2):
+            try:
+                primeiro = numero_cep(linha[inicio])
+                ultimo = numero_cep(linha[fim]) if fim else primeiro
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Linha {numero} de '{caminho}': {e}") from None
+            if ultimo < primeiro:
+                raise ValueError(f"Linha {numero} de '{caminho}': CEP final menor que o inicial")
+            yield primeiro, ultimo
+
+
+def fundir_faixas(faixas: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Ordena as faixas e junta as sobrepostas ou contíguas."""
+    fundidas: List[Tuple[int, int]] = []
+    for primeiro, ultimo in sorted(faixas):
+        if fundidas and primeiro <= fundidas[-1][1] + 1:
+            if ultimo > fundidas[-1][1]:
+                fundidas[-1] = (fundidas[-1][0], ultimo)
+        else:
+            fundidas.append((primeiro, ultimo))
+    return fundidas
+
+
+def gravar_indice(faixas: Iterable[Tuple[int, int]], saida: str) -> int:
+    """Grava as faixas no formato binário do índice e devolve quantas foram gravadas."""
+    fundidas = fundir_faixas(faixas)
+    inicios = array('I', (primeiro for primeiro, _ in fundidas))
+    fins = array('I', (ultimo for _, ultimo in fundidas))
+    if inicios.itemsize != 4:
+        raise RuntimeError("O índice de CEP requer inteiros de 32 bits em array('I')")
+    diretorio = array('I', (bisect_right(inicios, grupo * TAMANHO_GRUPO - 1) for grupo in range(GRUPOS + 1)))
+    if sys.byteorder != 'little':
+        for vetor in (diretorio, inicios, fins):
+            vetor.byteswap()
+    with open(saida, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICA, VERSAO, len(fundidas)))
+        for vetor in (diretorio, inicios, fins):
+            vetor.tofile(arquivo)
+    return len(fundidas)
+
+
+def tamanho_indice(quantidade: int) -> int:
+    """Tamanho em bytes do arquivo de um índice com `quantidade` faixas."""
+    return CABECALHO.size + 4 * (GRUPOS + 1) + 8 * quantidade
+
+
+def construir_indice(entrada: str, saida: str, **opcoes) -> int:
+    """Lê as faixas do CSV `entrada` (veja ler_faixas) e grava o índice em `saida`."""
+    return gravar_indice(ler_faixas(entrada, **opcoes), saida)
+
+
+class IndiceCEP:
+    """Índice de faixas de CEP mapeado em memória (somente leitura).
+
+    `contem(numero)` faz uma busca binária nos inícios das faixas do grupo
+    do CEP (veja o diretório), começando na última faixa anterior. Ao ser
+    serializado (ex.: para um worker paralelo), leva só o caminho: cada
+    processo mapeia o mesmo arquivo.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, 'rb') as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magica, versao, quantidade = CABECALHO.unpack_from(self._mapa)
+        except struct.error:
+            magica, versao, quantidade = b'', 0, 0
+        if magica != MAGICA or versao != VERSAO or len(self._mapa) != tamanho_indice(quantidade):
+            self._mapa.close()
+            raise ValueError(f"'{caminho}' não é um índice de CEP válido (gere com indice_cep.py)")
+        self.quantidade = quantidade
+
+        limites = (CABECALHO.size, CABECALHO.size + 4 * (GRUPOS + 1),
+                   CABECALHO.size + 4 * (GRUPOS + 1 + quantidade), len(self._mapa))
+        if sys.byteorder == 'little':
+            dados = memoryview(self._mapa)
+            self.diretorio, self.inicios, self.fins = (dados[inicio:fim].cast('I')
+                                                       for inicio, fim in zip(limites, limites[1:]))
+        else:  # pragma: no cover - cópia convertida em máquinas big-endian
+            self.diretorio, self.inicios, self.fins = (array('I', self._mapa[inicio:fim])
+                                                       for inicio, fim in zip(limites, limites[1:]))
+            for vetor in (self.diretorio, self.inicios, self.fins):
+                vetor.byteswap()
+
+    def contem(self, numero: int) -> bool:
+        """`numero` é um CEP de 8 dígitos como inteiro (0 a MAIOR_CEP)."""
+        grupo = numero // TAMANHO_GRUPO
+        diretorio = self.diretorio
+        posicao = bisect_right(self.inicios, numero, diretorio[grupo], diretorio[grupo + 1]) - 1
+        return posicao >= 0 and numero <= self.fins[posicao]
+
+    def __contains__(self, cep: Union[str, int]) -> bool:
+        numero = cep if isinstance(cep, int) else numero_cep(cep)
+        return 0 <= numero <= MAIOR_CEP and self.contem(numero)
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def __reduce__(self):
+        return IndiceCEP, (self.caminho,)
+
+    def fechar(self) -> None:
+        for vetor in (self.diretorio, self.inicios, self.fins):
+            if isinstance(vetor, memoryview):
+                vetor.release()
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Constrói o índice binário de faixas de CEP a partir de um CSV')
+    parser.add_argument('entrada', help='CSV com as faixas de CEP')
+    parser.add_argument('saida', help='arquivo do índice (ex.: ceps.idx)')
+    parser.add_argument('--inicio', default='cep_inicial', help='coluna do CEP inicial (padrão: cep_inicial)')
+    parser.add_argument('--fim', default='cep_final',
+                        help='coluna do CEP final (padrão: cep_final; vazio = um CEP por linha)')
+    parser.add_argument('-d', '--delimitador', default=',', help='delimitador do CSV (padrão: ,)')
+    parser.add_argument('--encoding', default='utf-8', help='codificação do CSV (padrão: utf-8)')
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        quantidade = construir_indice(args.entrada, args.saida, inicio=args.inicio, fim=args.fim or None,
+                                      delimitador=args.delimitador, encoding=args.encoding)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    print(f"{quantidade} faixas gravadas em {args.saida} "
+          f"({tamanho_indice(quantidade)} bytes, {time.perf_counter() - inicio:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -69,8 +69,7 @@ class InterfaceValidador:
             if valor.lower() == 'voltar':
                 break
             
-            metodo = getattr(self.validador, f'validar_{tipo_campo}')
-            valido, mensagem = metodo(valor)
+            valido, mensagem = self.validador.validar(tipo_campo, valor)
             
             status = "✓ VÁLIDO" if valido else "✗ INVÁLIDO"
             cor = '\033[92m' if valido else '\033[91m'
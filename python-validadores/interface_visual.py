@@ -290,11 +290,10 @@ class ValidadorGUI:
             if current_value != value:  # Valor mudou, ignorar validação antiga
                 return
                 
-            if not hasattr(self.validador, f'validar_{field_key}'):
+            if field_key not in self.validador.campos:
                 return
                 
-            metodo = getattr(self.validador, f'validar_{field_key}')
-            valido, mensagem = metodo(value)
+            valido, mensagem = self.validador.validar(field_key, value)
             
             result_label = self.result_labels[field_key]
             
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Métricas opcionais do ValidadorDados: chamadas, válidos/inválidos e
+latência por campo, além do cache, exportáveis como dicionário, JSON ou
+texto no formato do Prometheus.
+
+    v = ValidadorDados()
+    metricas = v.ativar_metricas()
+    ...
+    print(metricas.como_prometheus())
+
+Com as métricas desligadas (o padrão) o validador não faz nenhuma medição:
+ativar_metricas troca os métodos do caminho crítico por versões medidas, e
+desativar_metricas os devolve.
+"""
+
+import bisect
+import json
+import time
+from typing import Dict, Tuple
+
+# Limites superiores (em segundos) dos intervalos de latência de uma validação
+LIMITES_VALIDACAO = (2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5,
+                     1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+
+
+class HistogramaLatencia:
+    """Histograma de latências com intervalos fixos (estilo Prometheus)."""
+
+    def __init__(self, limites: Tuple[float, ...] = LIMITES_VALIDACAO):
+        self.limites = limites
+        self.contagens = [0] * (len(limites) + 1)  # o último intervalo é +inf
+        self.total = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos: float) -> None:
+        self.contagens[bisect.bisect_left(self.limites, segundos)] += 1
+        self.total += 1
+        self.soma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, p: float) -> float:
+        """Estimativa do percentil `p` (0-100), interpolando dentro do intervalo que o contém."""
+        if not self.total:
+            return 0.0
+        alvo = p / 100 * self.total
+        acumulado = 0
+        for indice, contagem in enumerate(self.contagens):
+            if contagem and acumulado + contagem >= alvo:
+                if indice == len(self.limites):
+                    return self.maximo
+                inferior = self.limites[indice - 1] if indice else 0.0
+                superior = min(self.limites[indice], self.maximo)
+                return inferior + (superior - inferior) * (alvo - acumulado) / contagem
+            acumulado += contagem
+        return self.maximo
+
+    def como_dict(self, unidade: str = 'us') -> dict:
+        escala = {'s': 1, 'ms': 1e3, 'us': 1e6}[unidade]
+        return {
+            'total': self.total,
+            f'soma_{unidade}': round(self.soma * escala, 3),
+            f'media_{unidade}': round(self.soma / self.total * escala, 3) if self.total else 0.0,
+            f'p50_{unidade}': round(self.percentil(50) * escala, 3),
+            f'p90_{unidade}': round(self.percentil(90) * escala, 3),
+            f'p99_{unidade}': round(self.percentil(99) * escala, 3),
+            f'max_{unidade}': round(self.maximo * escala, 3),
+        }
+
+    def acumulados(self):
+        """(limite, contagem acumulada) de cada intervalo, terminando em +inf."""
+        acumulado = 0
+        for indice, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            yield (self.limites[indice] if indice < len(self.limites) else float('inf')), acumulado
+
+
+class MetricasCampo:
+    """Contadores e latências de um campo."""
+
+    __slots__ = ('validos', 'invalidos', 'latencia', 'lotes', 'valores_lote', 'validos_lote', 'tempo_lote')
+
+    def __init__(self):
+        self.validos = 0
+        self.invalidos = 0
+        self.latencia = HistogramaLatencia()
+        # validar_lote mede colunas inteiras: só contagens e tempo total
+        self.lotes = 0
+        self.valores_lote = 0
+        self.validos_lote = 0
+        self.tempo_lote = 0.0
+
+    def como_dict(self) -> dict:
+        return {
+            'chamadas': self.validos + self.invalidos,
+            'validos': self.validos,
+            'invalidos': self.invalidos,
+            'latencia': self.latencia.como_dict(),
+            'lote': {
+                'colunas': self.lotes,
+                'valores': self.valores_lote,
+                'validos': self.validos_lote,
+                'invalidos': self.valores_lote - self.validos_lote,
+                'tempo_s': round(self.tempo_lote, 6),
+                'ns_por_valor': round(self.tempo_lote * 1e9 / self.valores_lote, 1) if self.valores_lote else 0.0,
+            },
+        }
+
+
+class MetricasValidacao:
+    """Métricas de um ValidadorDados, por campo.
+
+    `cache` é o CacheResultados do validador (ou None). Com várias threads
+    os contadores são aproximados (não há trava no caminho crítico).
+    """
+
+    def __init__(self, cache=None):
+        self.campos: Dict[str, MetricasCampo] = {}
+        self.cache = cache
+        self.inicio = time.time()
+
+    def _campo(self, campo: str) -> MetricasCampo:
+        metricas = self.campos.get(campo)
+        if metricas is None:
+            metricas = self.campos[campo] = MetricasCampo()
+        return metricas
+
+    def registrar(self, campo: str, valido: bool, segundos: float) -> None:
+        metricas = self._campo(campo)
+        if valido:
+            metricas.validos += 1
+        else:
+            metricas.invalidos += 1
+        metricas.latencia.registrar(segundos)
+
+    def registrar_lote(self, campo: str, valores: int, validos: int, segundos: float) -> None:
+        metricas = self._campo(campo)
+        metricas.lotes += 1
+        metricas.valores_lote += valores
+        metricas.validos_lote += validos
+        metricas.tempo_lote += segundos
+
+    def limpar(self) -> None:
+        self.campos.clear()
+        self.inicio = time.time()
+
+    def como_dict(self) -> dict:
+        dados = {
+            'inicio': self.inicio,
+            'duracao_s': round(time.time() - self.inicio, 3),
+            'campos': {campo: metricas.como_dict() for campo, metricas in self.campos.items()},
+        }
+        if self.cache is not None:
+            dados['cache'] = self.cache.estatisticas()
+        return dados
+
+    def como_json(self, **opcoes) -> str:
+        """Instantâneo das métricas em JSON (com o horário da coleta)."""
+        dados = self.como_dict()
+        dados['coletado_em'] = time.time()
+        return json.dumps(dados, ensure_ascii=False, **opcoes)
+
+    def como_prometheus(self, prefixo: str = 'validador') -> str:
+        """Métricas no formato de texto do Prometheus (exposition format 0.0.4)."""
+        linhas = []
+
+        def familia(nome: str, tipo: str, ajuda: str) -> str:
+            nome = f'{prefixo}_{nome}'
+            linhas.append(f'# HELP {nome} {ajuda}')
+            linhas.append(f'# TYPE {nome} {tipo}')
+            return nome
+
+        nome = familia('validacoes_total', 'counter', 'Validacoes individuais por campo e resultado.')
+        for campo, metricas in self.campos.items():
+            linhas.append(f'{nome}{{campo="{campo}",resultado="valido"}} {metricas.validos}')
+            linhas.append(f'{nome}{{campo="{campo}",resultado="invalido"}} {metricas.invalidos}')
+
+        nome = familia('latencia_segundos', 'histogram', 'Latencia de cada validacao individual.')
+        for campo, metricas in self.campos.items():
+            for limite, acumulado in metricas.latencia.acumulados():
+                le = '+Inf' if limite == float('inf') else repr(limite)
+                linhas.append(f'{nome}_bucket{{campo="{campo}",le="{le}"}} {acumulado}')
+            linhas.append(f'{nome}_sum{{campo="{campo}"}} {metricas.latencia.soma!r}')
+            linhas.append(f'{nome}_count{{campo="{campo}"}} {metricas.latencia.total}')
+
+        nome = familia('lote_valores_total', 'counter', 'Valores validados em lote por campo e resultado.')
+        for campo, metricas in self.campos.items():
+            linhas.append(f'{nome}{{campo="{campo}",resultado="valido"}} {metricas.validos_lote}')
+            linhas.append(f'{nome}{{campo="{campo}",resultado="invalido"}} '
+                          f'{metricas.valores_lote - metricas.validos_lote}')
+
+        nome = familia('lote_segundos_total', 'counter', 'Tempo gasto validando colunas em lote.')
+        for campo, metricas in self.campos.items():
+            linhas.append(f'{nome}{{campo="{campo}"}} {metricas.tempo_lote!r}')
+
+        if self.cache is not None:
+            estatisticas = self.cache.estatisticas()
+            for chave, tipo, ajuda in (('acertos', 'counter', 'Consultas respondidas pelo cache.'),
+                                       ('faltas', 'counter', 'Consultas que nao estavam no cache.'),
+                                       ('despejos', 'counter', 'Entradas removidas do cache.'),
+                                       ('tamanho', 'gauge', 'Entradas no cache.'),
+                                       ('capacidade', 'gauge', 'Capacidade do cache.')):
+                sufixo = '_total' if tipo == 'counter' else ''
+                nome = familia(f'cache_{chave}{sufixo}', tipo, ajuda)
+                linhas.append(f'{nome} {estatisticas[chave]}')
+
+        return '\n'.join(linhas) + '\n'
+
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Plano de numeração de telefones: DDDs existentes e prefixos aceitos.
+
+O plano vem de um CSV local com uma linha por DDD (colunas `ddd` e,
+opcionalmente, `prefixos`, os primeiros dígitos aceitos do número; padrão
+'9', de celular). ddd_brasil.csv traz os 67 DDDs do plano nacional.
+
+O plano vira uma tabela de 100 entradas, uma por DDD: cada entrada é o
+conjunto de bits dos primeiros dígitos aceitos (0 = DDD inexistente). Conferir
+um telefone é uma consulta à tabela e um deslocamento de bits, em tempo
+constante.
+
+    ValidadorDados(telefone_estrito=True)            # ddd_brasil.csv
+    v.usar_plano_telefonia('meu_plano.csv')
+"""
+
+import csv
+import os
+from typing import Dict, Optional, Tuple
+
+ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ddd_brasil.csv')
+
+TOTAL_DDDS = 100
+PREFIXOS_PADRAO = '9'
+
+
+def _bits_prefixos(prefixos: str) -> int:
+    """'9' -> 1 << 9; '789' -> bits 7, 8 e 9."""
+    if not prefixos or not all(caractere in '0123456789' for caractere in prefixos):
+        raise ValueError(f"Prefixos inválidos: '{prefixos}' (use dígitos, ex.: 9 ou 789)")
+    bits = 0
+    for digito in prefixos:
+        bits |= 1 << int(digito)
+    return bits
+
+
+class PlanoTelefonia:
+    """DDDs válidos (`ddds`, um inteiro com um bit por DDD) e os primeiros
+    dígitos aceitos em cada um (`prefixos[ddd]`, um bit por dígito)."""
+
+    __slots__ = ('ddds', 'prefixos', 'origem')
+
+    def __init__(self, regras: Dict[int, str], origem: str = ''):
+        prefixos = [0] * TOTAL_DDDS
+        for ddd, digitos in regras.items():
+            if not 11 <= ddd < TOTAL_DDDS:
+                raise ValueError(f"DDD inválido: {ddd} (use 11 a 99)")
+            prefixos[ddd] = _bits_prefixos(digitos or PREFIXOS_PADRAO)
+        self.prefixos: Tuple[int, ...] = tuple(prefixos)
+        self.ddds = sum(1 << ddd for ddd, bits in enumerate(self.prefixos) if bits)
+        self.origem = origem
+
+    def aceita(self, ddd: int, primeiro: int) -> bool:
+        """Se o DDD existe e aceita números começando pelo dígito `primeiro`."""
+        return 0 <= ddd < TOTAL_DDDS and bool(self.prefixos[ddd] >> primeiro & 1)
+
+    def __contains__(self, ddd: int) -> bool:
+        return 0 <= ddd < TOTAL_DDDS and bool(self.ddds >> ddd & 1)
+
+    def __len__(self) -> int:
+        return bin(self.ddds).count('1')
+
+    def __repr__(self) -> str:
+        return f"PlanoTelefonia({len(self)} DDDs{', ' + self.origem if self.origem else ''})"
+
+
+def ler_plano(caminho: Optional[str] = None, delimitador: str = ',',
+              encoding: str = 'utf-8') -> PlanoTelefonia:
+    """Plano de um CSV com as colunas `ddd` e (opcional) `prefixos`; padrão: ddd_brasil.csv."""
+    caminho = caminho or ARQUIVO_PADRAO
+    regras: Dict[int, str] = {}
+    with open(caminho, newline='', encoding=encoding) as arquivo:
+        leitor = csv.DictReader(arquivo, delimiter=delimitador)
+        if 'ddd' not in (leitor.fieldnames or ()):
+            raise ValueError(f"Coluna ausente em '{caminho}': ddd")
+        for numero, linha in enumerate(leitor, 2):
+            prefixos = (linha.get('prefixos') or '').strip()
+            try:
+                ddd = int(linha['ddd'])
+                _bits_prefixos(prefixos or PREFIXOS_PADRAO)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Linha {numero} de '{caminho}': {e}") from None
+            if ddd in regras:
+                raise ValueError(f"Linha {numero} de '{caminho}': DDD {ddd} repetido")
+            regras[ddd] = prefixos
+    try:
+        return PlanoTelefonia(regras, origem=caminho)
+    except ValueError as e:
+        raise ValueError(f"'{caminho}': {e}") from None
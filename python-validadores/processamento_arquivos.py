@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Validação de arquivos CSV e JSON Lines em fluxo contínuo.
+
+Os registros são lidos com geradores e validados em blocos de tamanho fixo,
+então o uso de memória não depende do tamanho do arquivo. Apenas os
+registros inválidos (com as mensagens de erro) são gravados na saída.
+"""
+
+import csv
+import json
+import os
+import tempfile
+from collections import deque
+from itertools import islice
+from typing import Container, Dict, Iterable, Iterator, List, Optional
+
+from ganchos_validacao import VARIAVEL_SAIDA, captura_do_ambiente, capturar
+from validador_dados import CAMPOS, ValidadorDados
+
+FORMATOS = ('csv', 'jsonl')
+
+# Coluna das células a mais de uma linha de CSV maior que o cabeçalho
+COLUNA_EXTRAS = '_extras'
+
+# Tipos aceitos como valor de um campo; outros (números, listas... do JSON)
+# tornam o registro inválido naquele campo
+TIPOS_TEXTO = frozenset((str, type(None)))
+
+
+class ResumoValidacao:
+    """Totais acumulados durante a validação de um arquivo."""
+
+    def __init__(self, campos: Iterable[str]):
+        self.total = 0
+        self.invalidos = 0
+        self.falhas = {campo: 0 for campo in campos}
+        # Número do primeiro registro não avaliado quando o orçamento de tempo acaba
+        self.primeiro_nao_avaliado: Optional[int] = None
+
+    def acumular(self, resultado) -> List[int]:
+        """Soma um ResultadoLote ao resumo e devolve os índices inválidos do bloco.
+
+        `total` conta apenas os registros avaliados.
+        """
+        invalidos = resultado.indices_invalidos()
+        self.total += resultado.avaliados
+        self.invalidos += len(invalidos)
+        for campo, quantidade in resultado.contagem_falhas().items():
+            self.falhas[campo] += quantidade
+        return invalidos
+
+
+def detectar_formato(caminho: str) -> str:
+    extensao = os.path.splitext(caminho)[1].lower().lstrip('.')
+    if extensao in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    if extensao in ('csv', 'txt'):
+        return 'csv'
+    raise ValueError(f"Não foi possível detectar o formato de '{caminho}' (use csv ou jsonl)")
+
+
+def ler_csv(caminho: str, delimitador: str = ',', encoding: str = 'utf-8') -> Iterator[Dict[str, str]]:
+    """Registros de um CSV; células além do cabeçalho ficam numa lista em COLUNA_EXTRAS."""
+    with open(caminho, newline='', encoding=encoding) as arquivo:
+        yield from csv.DictReader(arquivo, delimiter=delimitador, restkey=COLUNA_EXTRAS)
+
+
+def ler_jsonl(caminho: str, encoding: str = 'utf-8') -> Iterator[Dict[str, str]]:
+    """Registros de um arquivo JSON Lines; cada linha precisa ser um objeto."""
+    with open(caminho, encoding=encoding) as arquivo:
+        for numero, linha in enumerate(arquivo, 1):
+            linha = linha.strip()
+            if not linha:
+                continue
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSON inválido na linha {numero} de '{caminho}': {e}") from e
+            if not isinstance(registro, dict):
+                raise ValueError(f"Linha {numero} de '{caminho}': esperado um objeto {{campo: valor}}, "
+                                 f"recebido {type(registro).__name__}")
+            yield registro
+
+
+def ler_registros(caminho: str, formato: Optional[str] = None, **opcoes) -> Iterator[Dict[str, str]]:
+    formato = formato or detectar_formato(caminho)
+    if formato == 'csv':
+        return ler_csv(caminho, **opcoes)
+    if formato == 'jsonl':
+        return ler_jsonl(caminho, **opcoes)
+    raise ValueError(f"Formato desconhecido: '{formato}' (use {', '.join(FORMATOS)})")
+
+
+def em_blocos(registros: Iterable[dict], tamanho: int) -> Iterator[List[dict]]:
+    if tamanho < 1:
+        raise ValueError("O tamanho do bloco deve ser positivo")
+    iterador = iter(registros)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def mapeamento_padrao(colunas: Container[str], campos: Iterable[str] = CAMPOS) -> Dict[str, str]:
+    """Associa cada campo do validador à coluna de mesmo nome, se existir
+    (`colunas` é um registro ou o conjunto dos nomes de coluna)."""
+    return {campo: campo for campo in campos if campo in colunas}
+
+
+def colunas_do_bloco(bloco: List[dict], mapeamento: Dict[str, str]) -> Dict[str, List[str]]:
+    """Colunas {campo: valores} do bloco. Valores que não são texto nem None
+    viram None, ou seja, inválidos (veja mensagens_de_erro)."""
+    colunas = {}
+    for campo, coluna in mapeamento.items():
+        valores = [registro.get(coluna) for registro in bloco]
+        if not set(map(type, valores)) <= TIPOS_TEXTO:
+            valores = [valor if type(valor) in TIPOS_TEXTO else None for valor in valores]
+        colunas[campo] = valores
+    return colunas
+
+
+def mensagem_de_tipo(valor) -> str:
+    return f"Valor deve ser texto (recebido {type(valor).__name__})"
+
+
+def mensagens_de_erro(validador: ValidadorDados, registro: dict, mapeamento: Dict[str, str]) -> Dict[str, str]:
+    erros = {}
+    for campo, coluna in mapeamento.items():
+        valor = registro.get(coluna)
+        if type(valor) not in TIPOS_TEXTO:
+            erros[campo] = mensagem_de_tipo(valor)
+            continue
+        valido, mensagem = validador.validar(campo, valor)
+        if not valido:
+            erros[campo] = mensagem
+    return erros
+
+
+class EscritorInvalidos:
+    """Grava registros inválidos em CSV (colunas originais + erros) ou JSON Lines.
+
+    Em CSV, os registros podem ter colunas diferentes (ex.: vindos de JSON
+    Lines): eles são guardados num arquivo temporário e o cabeçalho, com a
+    união das colunas na ordem em que aparecem, é escrito ao fechar. A
+    memória usada é só a dos nomes de coluna.
+    """
+
+    def __init__(self, caminho: str, formato: Optional[str] = None, encoding: str = 'utf-8'):
+        self.formato = formato or detectar_formato(caminho)
+        self.arquivo = open(caminho, 'w', newline='', encoding=encoding)
+        self._colunas: Dict[str, None] = {}
+        self._pendentes = tempfile.TemporaryFile('w+', encoding='utf-8') if self.formato == 'csv' else None
+
+    def escrever(self, numero: int, registro: dict, erros: Dict[str, str]) -> None:
+        if self.formato == 'jsonl':
+            linha = {'registro': numero, 'dados': registro, 'erros': erros}
+            self.arquivo.write(json.dumps(linha, ensure_ascii=False) + '\n')
+            return
+
+        self._colunas.update(dict.fromkeys(registro))
+        linha = dict(registro)
+        linha['registro'] = numero
+        linha['erros'] = '; '.join(f"{campo}: {mensagem}" for campo, mensagem in erros.items())
+        self._pendentes.write(json.dumps(linha, ensure_ascii=False) + '\n')
+
+    def fechar(self) -> None:
+        if self._pendentes is not None:
+            self._colunas.pop('registro', None)
+            self._colunas.pop('erros', None)
+            escritor = csv.DictWriter(self.arquivo, fieldnames=['registro', *self._colunas, 'erros'])
+            escritor.writeheader()
+            self._pendentes.seek(0)
+            escritor.writerows(map(json.loads, self._pendentes))
+            self._pendentes.close()
+            self._pendentes = None
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+def validar_arquivo(entrada: str, saida: str,
+                    mapeamento: Optional[Dict[str, str]] = None,
+                    formato_entrada: Optional[str] = None,
+                    formato_saida: Optional[str] = None,
+                    tamanho_bloco: int = 10000,
+                    validador: Optional[ValidadorDados] = None,
+                    workers: int = 1,
+                    captura: Optional[str] = None,
+                    captura_saida: Optional[str] = None,
+                    orcamento: Optional[float] = None) -> ResumoValidacao:
+    """Valida `entrada` bloco a bloco e grava os registros inválidos em `saida`.
+
+    `mapeamento` associa campos do validador a colunas do arquivo
+    ({'cpf': 'documento'}); sem ele, usa as colunas com o nome do campo, e
+    um campo passa a ser conferido a partir do primeiro bloco em que aparece
+    em algum registro (em JSON Lines, os registros podem ter chaves
+    diferentes).
+    Os registros são numerados a partir de 1, na ordem do arquivo.
+    Com `workers` > 1 os blocos são validados em paralelo por processos
+    (veja processamento_paralelo); a saída continua na ordem da entrada.
+    Se `validador` tiver cache, cada worker recebe um cache do mesmo tamanho.
+    `captura` ('cprofile' ou 'tracemalloc') perfila a execução (veja
+    ganchos_validacao.capturar); sem ela, vale a variável VALIDADOR_CAPTURA.
+    Com `orcamento` (segundos para o arquivo inteiro), a validação para
+    quando o tempo acaba; o resumo informa em `primeiro_nao_avaliado` o
+    número do primeiro registro que ficou sem validação.
+    """
+    validador = validador or ValidadorDados()
+    if mapeamento is not None:
+        desconhecidos = [campo for campo in mapeamento if campo not in validador.campos]
+        if desconhecidos:
+            raise ValueError(f"Campos desconhecidos no mapeamento: {', '.join(desconhecidos)}")
+
+    from processamento_paralelo import ExecutorValidacao
+
+    tamanho_cache = validador.cache.capacidade if validador.cache is not None else 0
+    registros = ler_registros(entrada, formato_entrada)
+    resumo = ResumoValidacao(mapeamento or {})
+
+    # Blocos já enviados para validação (com o mapeamento usado), na mesma ordem dos resultados
+    pendentes = deque()
+
+    def colunas_dos_blocos():
+        atual = mapeamento or {}
+        campos = validador.campos.nomes()
+        for bloco in em_blocos(registros, tamanho_bloco):
+            if mapeamento is None:
+                # União das chaves: campos ausentes do primeiro registro também são conferidos
+                ampliado = mapeamento_padrao(set(atual).union(*bloco), campos)
+                if len(ampliado) > len(atual):
+                    atual = ampliado
+                    for campo in atual:
+                        resumo.falhas.setdefault(campo, 0)
+            pendentes.append((bloco, atual))
+            yield colunas_do_bloco(bloco, atual)
+
+    if captura is None:
+        captura, captura_saida = captura_do_ambiente(), captura_saida or os.environ.get(VARIAVEL_SAIDA)
+
+    with capturar(captura, captura_saida), \
+            EscritorInvalidos(saida, formato_saida) as escritor, \
+            ExecutorValidacao(workers, tamanho_bloco, validador, tamanho_cache) as executor:
+        inicio = 0
+        for resultado in executor.validar_blocos(colunas_dos_blocos(), orcamento):
+            bloco, mapeamento_bloco = pendentes.popleft()
+            for indice in resumo.acumular(resultado):
+                registro = bloco[indice]
+                escritor.escrever(inicio + indice + 1, registro,
+                                  mensagens_de_erro(validador, registro, mapeamento_bloco))
+            if resultado.nao_avaliados:
+                resumo.primeiro_nao_avaliado = inicio + resultado.avaliados + 1
+                break
+            inicio += len(bloco)
+
+    return resumo
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Validação em paralelo com um pool de processos.
+
+A validação é puramente CPU (regex), então threads não ajudam por causa do
+GIL. Cada processo do pool cria o seu próprio ValidadorDados uma única vez
+(no inicializador); as tarefas levam apenas as colunas de um bloco e
+devolvem um ResultadoLote. Os resultados são combinados na ordem da entrada.
+"""
+
+import os
+import time
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ganchos_validacao import capturar_do_ambiente
+from processamento_arquivos import colunas_do_bloco, mapeamento_padrao
+from validador_dados import ResultadoLote, ValidadorDados
+
+# Validador do processo worker, criado uma vez por _iniciar_worker
+_validador: Optional[ValidadorDados] = None
+
+
+def _iniciar_worker(tamanho_cache: int = 0, definicoes: Iterable[dict] = (),
+                    limites_tamanho: Optional[Dict[str, int]] = None) -> None:
+    global _validador
+    _validador = ValidadorDados(tamanho_cache=tamanho_cache, limites_tamanho=limites_tamanho)
+    # Campos registrados em tempo de execução no validador do processo principal
+    for definicao in definicoes:
+        _validador.registrar_campo(**definicao)
+
+
+def _validar_bloco(colunas: Dict[str, List[str]], prazo: Optional[float] = None) -> ResultadoLote:
+    # `prazo` é um instante de time.monotonic, o mesmo relógio em todos os processos
+    if prazo is None:
+        return _validador.validar_lote(colunas)
+    return _validador.validar_lote(colunas, orcamento=prazo - time.monotonic())
+
+
+class ExecutorValidacao:
+    """Distribui blocos de registros entre processos e devolve os resultados em ordem.
+
+    `workers` é o número de processos (padrão: número de CPUs) e
+    `tamanho_bloco` o número de registros por tarefa. Com `workers=1` a
+    validação roda no próprio processo, sem pool. `tamanho_cache` ativa um
+    cache LRU próprio em cada worker. Campos registrados em `validador` com
+    registrar_campo são registrados também em cada worker, com os mesmos
+    limites de tamanho.
+    """
+
+    def __init__(self, workers: Optional[int] = None, tamanho_bloco: int = 50000,
+                 validador: Optional[ValidadorDados] = None, tamanho_cache: int = 0):
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco deve ser positivo")
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError("O número de workers deve ser positivo")
+        self.tamanho_bloco = tamanho_bloco
+        # Limita blocos em andamento para manter a memória constante
+        self.max_pendentes = self.workers * 2
+        self._validador = validador
+        self.tamanho_cache = tamanho_cache
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+    def fechar(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def validar_blocos(self, blocos: Iterable[Dict[str, List[str]]],
+                       orcamento: Optional[float] = None) -> Iterator[ResultadoLote]:
+        """Valida blocos no formato {campo: [valores]}, devolvendo um resultado por bloco, em ordem.
+
+        `orcamento` (segundos) vale para todos os blocos juntos: quando acaba,
+        os registros restantes de cada bloco voltam como não avaliados.
+        """
+        prazo = time.monotonic() + orcamento if orcamento is not None else None
+        if self.workers == 1:
+            if self._validador is None:
+                self._validador = ValidadorDados(tamanho_cache=self.tamanho_cache)
+            for colunas in blocos:
+                if prazo is None:
+                    yield self._validador.validar_lote(colunas)
+                else:
+                    yield self._validador.validar_lote(colunas, orcamento=prazo - time.monotonic())
+            return
+
+        if self._pool is None:
+            if self._validador is not None:
+                definicoes = self._validador.definicoes_personalizadas()
+                limites = self._validador.limites_tamanho()
+            else:
+                definicoes, limites = [], None
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_iniciar_worker,
+                                             initargs=(self.tamanho_cache, definicoes, limites))
+
+        pendentes = deque()
+        for colunas in blocos:
+            pendentes.append(self._pool.submit(_validar_bloco, colunas, prazo))
+            if len(pendentes) >= self.max_pendentes:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+    def validar_lote(self, registros, orcamento: Optional[float] = None) -> ResultadoLote:
+        """Equivalente paralelo de ValidadorDados.validar_lote.
+
+        Com VALIDADOR_CAPTURA definida, a execução é perfilada (veja ganchos_validacao).
+        """
+        resultado = ResultadoLote(0, {}, {})
+        with capturar_do_ambiente():
+            for parcial in self.validar_blocos(self._dividir(registros), orcamento):
+                resultado.estender(parcial)
+        return resultado
+
+    def _dividir(self, registros) -> Iterator[Dict[str, List[str]]]:
+        if self._validador is None:
+            self._validador = ValidadorDados(tamanho_cache=self.tamanho_cache)
+        campos = self._validador.campos.nomes()
+        if isinstance(registros, Mapping):
+            colunas = {campo: registros[campo] for campo in campos if campo in registros}
+            total = len(next(iter(colunas.values()))) if colunas else 0
+            for inicio in range(0, total, self.tamanho_bloco):
+                fim = inicio + self.tamanho_bloco
+                yield {campo: valores[inicio:fim] for campo, valores in colunas.items()}
+            return
+
+        # Como em validar_lote, os campos são os que aparecem em algum registro
+        if not isinstance(registros, (list, tuple)):
+            registros = list(registros)
+        mapeamento = mapeamento_padrao(set().union(*registros), campos)
+        for inicio in range(0, len(registros), self.tamanho_bloco):
+            yield colunas_do_bloco(registros[inicio:inicio + self.tamanho_bloco], mapeamento)
+
+
+def validar_lote_paralelo(registros, workers: Optional[int] = None,
+                          tamanho_bloco: int = 50000, tamanho_cache: int = 0) -> ResultadoLote:
+    with ExecutorValidacao(workers, tamanho_bloco, tamanho_cache=tamanho_cache) as executor:
+        return executor.validar_lote(registros)
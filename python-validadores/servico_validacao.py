@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Serviço HTTP/JSON local de validação, com asyncio (somente biblioteca padrão).
+
+    python servico_validacao.py --porta 8080 --workers 4
+
+Rotas:
+    GET  /saude              -> {"status": "ok"}
+    GET  /campos             -> padrão e mensagem de erro de cada campo
+    GET  /metricas           -> requisições e histogramas de latência por rota
+                                (e as métricas do validador, com --metricas)
+    GET  /metricas/prometheus -> métricas do validador no formato do Prometheus
+    POST /validar            -> um registro {campo: valor}
+    POST /validar/<campo>    -> {"valor": "..."}
+    POST /lote               -> lista de registros ou colunas {campo: [valores]}
+    POST /lote/ndjson        -> um registro JSON por linha; a resposta (NDJSON)
+                                traz os registros inválidos à medida que são
+                                validados e termina com uma linha de resumo;
+                                cada linha traz o número do registro na entrada
+
+Lotes com pelo menos `limiar_pool` registros (--limiar-pool, padrão 500)
+são validados em um pool de processos (veja processamento_paralelo), para
+não bloquear o laço de eventos; lotes menores, que levam poucos
+milissegundos, são validados no próprio laço. Pela linha de comando o
+pool tem um processo por CPU (--workers 0 desliga o pool). Acima de `max_requisicoes` requisições simultâneas o serviço
+responde 503.
+
+Com `orcamento` (--orcamento), cada lote tem um tempo máximo de validação:
+em /lote os registros restantes voltam em `nao_avaliados`; no NDJSON a
+validação para, o resumo informa `primeiro_nao_avaliado` e a conexão é
+encerrada sem ler o resto do corpo.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from metricas_validacao import HistogramaLatencia
+from processamento_arquivos import ResumoValidacao, colunas_do_bloco, mapeamento_padrao, mensagens_de_erro
+from processamento_paralelo import _iniciar_worker, _validar_bloco
+from validador import interpretar_limites
+from validador_dados import ResultadoLote, ValidadorDados
+
+# Limites superiores (em segundos) dos intervalos dos histogramas de latência
+LIMITES_LATENCIA = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MAX_CABECALHO = 16 * 1024
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+def _json(dados) -> bytes:
+    return json.dumps(dados, ensure_ascii=False).encode('utf-8')
+
+
+def _resultado_json(resultado) -> dict:
+    valido, mensagem = resultado
+    return {'valido': valido, 'mensagem': mensagem}
+
+
+def _lote_json(resultado: ResultadoLote) -> dict:
+    invalidos = resultado.indices_invalidos()
+    return {'total': resultado.total, 'invalidos': len(invalidos), 'nao_avaliados': resultado.nao_avaliados,
+            'indices_invalidos': invalidos, 'falhas': resultado.falhas}
+
+
+class ServicoValidacao:
+    """Servidor HTTP/1.1 (com keep-alive) em torno de um ValidadorDados."""
+
+    def __init__(self, validador: Optional[ValidadorDados] = None, workers: int = 0,
+                 limiar_pool: int = 500, max_requisicoes: int = 1024,
+                 max_corpo: int = 64 * 1024 * 1024, tamanho_bloco: int = 10000,
+                 orcamento: Optional[float] = None):
+        self.validador = validador or ValidadorDados()
+        # Segundos de validação por lote (/lote ou upload NDJSON); None = sem limite
+        self.orcamento = orcamento
+        self.workers = workers
+        self.limiar_pool = limiar_pool
+        self.max_requisicoes = max_requisicoes
+        self.max_corpo = max_corpo
+        self.tamanho_bloco = tamanho_bloco
+        self.em_andamento = 0
+        self.recusadas = 0
+        self.respostas: Dict[int, int] = {}
+        self.latencias: Dict[str, HistogramaLatencia] = {}
+        self._pool = None
+        self._vagas_pool = None
+        self._servidor = None
+
+    async def iniciar(self, host: str = '127.0.0.1', porta: int = 8080) -> asyncio.AbstractServer:
+        if self.workers > 0:
+            cache = self.validador.cache.capacidade if self.validador.cache is not None else 0
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_iniciar_worker,
+                initargs=(cache, self.validador.definicoes_personalizadas(), self.validador.limites_tamanho()))
+            # Limita lotes na fila do pool para manter a memória constante
+            self._vagas_pool = asyncio.Semaphore(self.workers * 2)
+        self._servidor = await asyncio.start_server(self._atender, host, porta, limit=MAX_CABECALHO)
+        return self._servidor
+
+    @property
+    def porta(self) -> int:
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def fechar(self) -> None:
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def metricas(self) -> dict:
+        return {
+            'em_andamento': self.em_andamento,
+            'recusadas': self.recusadas,
+            'respostas': {str(status): total for status, total in sorted(self.respostas.items())},
+            'latencia': {rota: histograma.como_dict('ms') for rota, histograma in self.latencias.items()},
+            'validador': self.validador.metricas.como_dict() if self.validador.metricas is not None else None,
+        }
+
+    # HTTP
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    cabecalho = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    return  # conexão encerrada pelo cliente
+                except asyncio.LimitOverrunError:
+                    self._escrever(writer, 431, _json({'erro': 'Cabeçalho grande demais'}), manter=False)
+                    return
+
+                inicio = time.perf_counter()
+                try:
+                    metodo, caminho, versao, cabecalhos = self._interpretar_cabecalho(cabecalho)
+                except ErroHTTP as e:
+                    self._escrever(writer, e.status, _json({'erro': e.mensagem}), manter=False)
+                    return
+                manter = self._manter_conexao(versao, cabecalhos)
+                rota = self._nome_rota(metodo, caminho)
+
+                if self.em_andamento >= self.max_requisicoes:
+                    self.recusadas += 1
+                    await self._descartar_corpo(reader, cabecalhos)
+                    self._escrever(writer, 503, _json({'erro': 'Servidor ocupado'}), manter,
+                                   extras=(('Retry-After', '1'),))
+                    await writer.drain()
+                    continue
+
+                self.em_andamento += 1
+                try:
+                    status, manter = await self._despachar(metodo, caminho, cabecalhos, reader, writer, manter)
+                finally:
+                    self.em_andamento -= 1
+                self.respostas[status] = self.respostas.get(status, 0) + 1
+                histograma = self.latencias.get(rota)
+                if histograma is None:
+                    histograma = self.latencias[rota] = HistogramaLatencia(LIMITES_LATENCIA)
+                histograma.registrar(time.perf_counter() - inicio)
+
+                await writer.drain()
+                if not manter:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _interpretar_cabecalho(self, bruto: bytes):
+        try:
+            linhas = bruto.decode('latin-1').split('\r\n')
+            metodo, caminho, versao = linhas[0].split(' ')
+        except ValueError:
+            raise ErroHTTP(400, 'Requisição malformada') from None
+        cabecalhos = {}
+        for linha in linhas[1:]:
+            if linha:
+                nome, _, valor = linha.partition(':')
+                cabecalhos[nome.strip().lower()] = valor.strip()
+        return metodo, caminho.split('?', 1)[0], versao, cabecalhos
+
+    @staticmethod
+    def _manter_conexao(versao: str, cabecalhos: Dict[str, str]) -> bool:
+        conexao = cabecalhos.get('connection', '').lower()
+        if versao == 'HTTP/1.0':
+            return conexao == 'keep-alive'
+        return conexao != 'close'
+
+    @staticmethod
+    def _nome_rota(metodo: str, caminho: str) -> str:
+        if caminho.startswith('/validar/'):
+            return f'{metodo} /validar/<campo>'
+        return f'{metodo} {caminho}'
+
+    def _escrever(self, writer: asyncio.StreamWriter, status: int, corpo: bytes, manter: bool = True,
+                  tipo: str = 'application/json', extras: Tuple[Tuple[str, str], ...] = ()) -> None:
+        linhas = [f'HTTP/1.1 {status} {HTTPStatus(status).phrase}',
+                  f'Content-Type: {tipo}; charset=utf-8',
+                  f'Content-Length: {len(corpo)}',
+                  'Access-Control-Allow-Origin: *',
+                  'Connection: keep-alive' if manter else 'Connection: close']
+        linhas.extend(f'{nome}: {valor}' for nome, valor in extras)
+        writer.write(('\r\n'.join(linhas) + '\r\n\r\n').encode('latin-1') + corpo)
+
+    async def _ler_partes(self, reader: asyncio.StreamReader, cabecalhos: Dict[str, str]) -> AsyncIterator[bytes]:
+        """O corpo da requisição em partes (Content-Length ou chunked)."""
+        if cabecalhos.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                linha = await reader.readuntil(b'\r\n')
+                try:
+                    tamanho = int(linha.split(b';', 1)[0], 16)
+                except ValueError:
+                    raise ErroHTTP(400, 'Chunk malformado') from None
+                if tamanho == 0:
+                    while await reader.readuntil(b'\r\n') != b'\r\n':
+                        pass  # trailers
+                    return
+                yield await reader.readexactly(tamanho)
+                await reader.readexactly(2)
+        else:
+            try:
+                restante = int(cabecalhos.get('content-length', 0))
+            except ValueError:
+                raise ErroHTTP(400, 'Content-Length inválido') from None
+            while restante > 0:
+                parte = await reader.read(min(restante, 256 * 1024))
+                if not parte:
+                    raise asyncio.IncompleteReadError(b'', restante)
+                restante -= len(parte)
+                yield parte
+
+    async def _ler_corpo(self, reader: asyncio.StreamReader, cabecalhos: Dict[str, str]) -> bytes:
+        partes = []
+        tamanho = 0
+        async for parte in self._ler_partes(reader, cabecalhos):
+            tamanho += len(parte)
+            if tamanho > self.max_corpo:
+                raise ErroHTTP(413, f'Corpo maior que {self.max_corpo} bytes')
+            partes.append(parte)
+        return b''.join(partes)
+
+    async def _descartar_corpo(self, reader: asyncio.StreamReader, cabecalhos: Dict[str, str]) -> None:
+        async for _ in self._ler_partes(reader, cabecalhos):
+            pass
+
+    async def _ler_json(self, reader: asyncio.StreamReader, cabecalhos: Dict[str, str]):
+        corpo = await self._ler_corpo(reader, cabecalhos)
+        try:
+            return json.loads(corpo)
+        except ValueError as e:
+            raise ErroHTTP(400, f'JSON inválido: {e}') from None
+
+    # Rotas
+
+    async def _despachar(self, metodo: str, caminho: str, cabecalhos: Dict[str, str],
+                         reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                         manter: bool) -> Tuple[int, bool]:
+        """Atende uma requisição; devolve o status e se a conexão continua aberta."""
+        try:
+            if metodo == 'OPTIONS':
+                self._escrever(writer, 204, b'', manter, extras=(
+                    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+                    ('Access-Control-Allow-Headers', 'Content-Type')))
+                return 204, manter
+            if metodo == 'POST' and caminho == '/lote/ndjson':
+                return await self._lote_ndjson(reader, writer, cabecalhos, manter)
+
+            if metodo == 'GET' and caminho == '/metricas/prometheus':
+                await self._descartar_corpo(reader, cabecalhos)
+                metricas = self.validador.metricas
+                texto = metricas.como_prometheus() if metricas is not None else ''
+                self._escrever(writer, 200, texto.encode('utf-8'), manter, tipo='text/plain; version=0.0.4')
+                return 200, manter
+            if metodo == 'GET':
+                await self._descartar_corpo(reader, cabecalhos)
+                resposta = self._rota_get(caminho)
+            elif metodo == 'POST':
+                resposta = await self._rota_post(caminho, await self._ler_json(reader, cabecalhos))
+            else:
+                raise ErroHTTP(405, f'Método {metodo} não suportado')
+            self._escrever(writer, 200, _json(resposta), manter)
+            return 200, manter
+        except ErroHTTP as e:
+            # Depois de um erro o corpo pode não ter sido lido inteiro; encerra a conexão
+            self._escrever(writer, e.status, _json({'erro': e.mensagem}), manter=False)
+            return e.status, False
+
+    def _rota_get(self, caminho: str):
+        if caminho == '/saude':
+            return {'status': 'ok'}
+        if caminho == '/campos':
+            return {campo.nome: {'padrao': campo.padrao.pattern, 'mensagem': campo.mensagem}
+                    for campo in self.validador.campos}
+        if caminho == '/metricas':
+            return self.metricas()
+        raise ErroHTTP(404, f'Rota desconhecida: {caminho}')
+
+    async def _rota_post(self, caminho: str, dados):
+        if caminho == '/validar':
+            if not isinstance(dados, dict):
+                raise ErroHTTP(400, 'Esperado um objeto {campo: valor}')
+            self._exigir_textos(dados.values())
+            resultados = self.validador.validar_todos_campos(dados)
+            return {'valido': resultados.todos_validos(),
+                    'resultados': {campo: _resultado_json(resultado) for campo, resultado in resultados.items()}}
+
+        if caminho.startswith('/validar/'):
+            campo = caminho[len('/validar/'):]
+            if campo not in self.validador.campos:
+                raise ErroHTTP(404, f"Campo desconhecido: '{campo}'")
+            if not isinstance(dados, dict) or 'valor' not in dados:
+                raise ErroHTTP(400, 'Esperado um objeto {"valor": "..."}')
+            self._exigir_textos((dados['valor'],))
+            return _resultado_json(self.validador.validar(campo, dados['valor']))
+
+        if caminho == '/lote':
+            if isinstance(dados, list):
+                if not all(isinstance(registro, dict) for registro in dados):
+                    raise ErroHTTP(400, 'Esperada uma lista de objetos {campo: valor}')
+                # Os campos são os que aparecem em algum registro
+                presentes = set().union(*dados)
+                colunas = colunas_do_bloco(dados, mapeamento_padrao(presentes, self.validador.campos.nomes()))
+            elif isinstance(dados, dict):
+                colunas = {campo: valores for campo, valores in dados.items() if campo in self.validador.campos}
+                if not all(isinstance(valores, list) for valores in colunas.values()):
+                    raise ErroHTTP(400, 'Esperadas colunas {campo: [valores]}')
+            else:
+                raise ErroHTTP(400, 'Esperada uma lista de registros ou colunas {campo: [valores]}')
+            for valores in colunas.values():
+                self._exigir_textos(valores)
+            try:
+                return _lote_json(await self._validar_colunas(colunas, self._prazo()))
+            except ValueError as e:
+                raise ErroHTTP(400, str(e)) from None
+
+        raise ErroHTTP(404, f'Rota desconhecida: {caminho}')
+
+    @staticmethod
+    def _exigir_textos(valores) -> None:
+        for valor in valores:
+            if valor is not None and not isinstance(valor, str):
+                raise ErroHTTP(400, f'Valores devem ser textos, recebido {type(valor).__name__}')
+
+    def _prazo(self) -> Optional[float]:
+        return time.monotonic() + self.orcamento if self.orcamento is not None else None
+
+    async def _validar_colunas(self, colunas: Dict[str, List[str]], prazo: Optional[float] = None) -> ResultadoLote:
+        """Valida as colunas no processo ou no pool; com `prazo` (time.monotonic),
+        os registros que não couberem no tempo voltam como não avaliados."""
+        total = len(next(iter(colunas.values()))) if colunas else 0
+        if self._pool is None or total < self.limiar_pool:
+            if prazo is None:
+                return self.validador.validar_lote(colunas)
+            return self.validador.validar_lote(colunas, orcamento=prazo - time.monotonic())
+        async with self._vagas_pool:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, _validar_bloco, colunas, prazo)
+
+    async def _lote_ndjson(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                           cabecalhos: Dict[str, str], manter: bool) -> Tuple[int, bool]:
+        writer.write(b'HTTP/1.1 200 OK\r\n'
+                     b'Content-Type: application/x-ndjson; charset=utf-8\r\n'
+                     b'Transfer-Encoding: chunked\r\n'
+                     b'Access-Control-Allow-Origin: *\r\n' +
+                     (b'Connection: keep-alive\r\n\r\n' if manter else b'Connection: close\r\n\r\n'))
+
+        def enviar(linhas: List[bytes]) -> None:
+            if linhas:
+                corpo = b''.join(linhas)
+                writer.write(b'%x\r\n%s\r\n' % (len(corpo), corpo))
+
+        campos = self.validador.campos.nomes()
+        mapeamento: Dict[str, str] = {}
+        resumo = ResumoValidacao(())
+        bloco: List[dict] = []
+        numeros: List[int] = []
+        saida: List[bytes] = []
+
+        def adicionar(linha: bytes, numero: int) -> None:
+            nonlocal mapeamento, resumo
+            if not linha.strip():
+                return
+            try:
+                registro = json.loads(linha)
+                if not isinstance(registro, dict):
+                    raise ValueError('esperado um objeto')
+            except ValueError as e:
+                saida.append(_json({'registro': numero, 'erro': f'JSON inválido: {e}'}) + b'\n')
+                return
+            if any(campo in registro and campo not in mapeamento for campo in campos):
+                # União das chaves, como em validar_lote: o campo passa a ser
+                # conferido no bloco em que aparece pela primeira vez
+                mapeamento = mapeamento_padrao(set(mapeamento).union(registro), campos)
+                for campo in mapeamento:
+                    resumo.falhas.setdefault(campo, 0)
+            try:
+                self._exigir_textos(registro.get(coluna) for coluna in mapeamento.values())
+            except ErroHTTP as e:
+                saida.append(_json({'registro': numero, 'erro': e.mensagem}) + b'\n')
+                return
+            bloco.append(registro)
+            numeros.append(numero)
+
+        prazo = self._prazo()
+
+        async def validar_bloco() -> None:
+            resultado = await self._validar_colunas(colunas_do_bloco(bloco, mapeamento), prazo)
+            saida.extend(_json({'registro': numeros[indice],
+                                'erros': mensagens_de_erro(self.validador, bloco[indice], mapeamento)}) + b'\n'
+                         for indice in resumo.acumular(resultado))
+            if resultado.nao_avaliados:
+                resumo.primeiro_nao_avaliado = numeros[resultado.avaliados]
+            bloco.clear()
+            numeros.clear()
+
+        numero = 0
+        resto = b''
+        try:
+            async for parte in self._ler_partes(reader, cabecalhos):
+                linhas = (resto + parte).split(b'\n')
+                resto = linhas.pop()
+                if len(resto) > self.max_corpo:
+                    raise ErroHTTP(413, f'Linha maior que {self.max_corpo} bytes')
+                for linha in linhas:
+                    numero += 1
+                    adicionar(linha, numero)
+                    if len(bloco) >= self.tamanho_bloco:
+                        await validar_bloco()
+                        enviar(saida)
+                        saida.clear()
+                        await writer.drain()
+                        if resumo.primeiro_nao_avaliado is not None:
+                            break
+                if resumo.primeiro_nao_avaliado is not None:
+                    # Orçamento esgotado: o resto do corpo não é lido e a conexão é encerrada
+                    manter = False
+                    break
+            else:
+                adicionar(resto, numero + 1)
+                if bloco:
+                    await validar_bloco()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception as e:
+            # O status 200 já foi enviado: o erro vai como última linha e a conexão é encerrada
+            if isinstance(e, ErroHTTP):
+                status, mensagem = e.status, e.mensagem
+            elif isinstance(e, ValueError):
+                status, mensagem = 400, str(e)
+            else:
+                status, mensagem = 500, f'Erro inesperado ({type(e).__name__}): {e}'
+            saida.append(_json({'erro': mensagem}) + b'\n')
+            enviar(saida)
+            writer.write(b'0\r\n\r\n')
+            return status, False
+
+        final = {'total': resumo.total, 'invalidos': resumo.invalidos, 'falhas': resumo.falhas}
+        if resumo.primeiro_nao_avaliado is not None:
+            final['primeiro_nao_avaliado'] = resumo.primeiro_nao_avaliado
+        saida.append(_json({'resumo': final}) + b'\n')
+        enviar(saida)
+        writer.write(b'0\r\n\r\n')
+        return 200, manter
+
+def executar(host: str = '127.0.0.1', porta: int = 8080, **opcoes) -> None:
+    """Inicia o serviço e atende até receber SIGINT (Ctrl+C) ou SIGTERM.
+
+    Os dois sinais encerram o laço de forma ordenada: o servidor deixa de
+    aceitar conexões e o pool de processos é desligado antes da saída.
+    """
+    async def principal():
+        servico = ServicoValidacao(**opcoes)
+        await servico.iniciar(host, porta)
+        parar = asyncio.Event()
+        laco = asyncio.get_running_loop()
+        for sinal in (signal.SIGINT, signal.SIGTERM):
+            try:
+                laco.add_signal_handler(sinal, parar.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: resta o KeyboardInterrupt
+        print(f"Serviço de validação em http://{host}:{servico.porta} (workers: {servico.workers})", flush=True)
+        try:
+            await parar.wait()
+        finally:
+            await servico.fechar()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Serviço HTTP/JSON local de validação.')
+    parser.add_argument('--host', default='127.0.0.1', help='endereço (padrão: 127.0.0.1)')
+    parser.add_argument('-p', '--porta', type=int, default=8080, help='porta (padrão: 8080)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='processos para lotes grandes (padrão: um por CPU; 0 valida no próprio processo)')
+    parser.add_argument('--limiar-pool', type=int, default=500,
+                        help='registros a partir dos quais um lote vai para o pool; '
+                             'lotes menores são validados no laço de eventos (padrão: 500)')
+    parser.add_argument('--max-requisicoes', type=int, default=1024,
+                        help='requisições simultâneas antes de responder 503 (padrão: 1024)')
+    parser.add_argument('-b', '--tamanho-bloco', type=int, default=10000,
+                        help='registros por bloco no NDJSON (padrão: 10000)')
+    parser.add_argument('-c', '--cache', type=int, default=0, metavar='N',
+                        help='cache LRU de N resultados (padrão: desligado)')
+    parser.add_argument('--cpf-estrito', action='store_true',
+                        help='exige dígitos verificadores válidos no CPF')
+    parser.add_argument('--data-estrita', action='store_true',
+                        help='exige datas e horários existentes em data_horario')
+    parser.add_argument('--data-minima', metavar='DD/MM/AAAA',
+                        help='menor data aceita em data_horario (implica --data-estrita)')
+    parser.add_argument('--data-maxima', metavar='DD/MM/AAAA',
+                        help='maior data aceita em data_horario (implica --data-estrita)')
+    parser.add_argument('--indice-cep', metavar='ARQUIVO',
+                        help='exige que o CEP conste do índice de faixas (gerado por indice_cep.py)')
+    parser.add_argument('--telefone-estrito', action='store_true',
+                        help='exige DDD existente e celular começando com 9 (plano de ddd_brasil.csv)')
+    parser.add_argument('--plano-telefonia', metavar='ARQUIVO',
+                        help='CSV com os DDDs e prefixos aceitos (implica --telefone-estrito)')
+    parser.add_argument('--dominios-permitidos', action='append', metavar='ARQUIVO',
+                        help='aceita só emails destes domínios (lista em texto ou índice; repetível)')
+    parser.add_argument('--dominios-bloqueados', action='append', metavar='ARQUIVO',
+                        help='rejeita emails destes domínios (lista em texto ou índice; repetível)')
+    parser.add_argument('--orcamento', type=float, metavar='SEGUNDOS',
+                        help='tempo máximo de validação por lote; o restante volta como não avaliado')
+    parser.add_argument('--limite-tamanho', action='append', metavar='CAMPO=TAMANHO',
+                        help='tamanho máximo de um campo, conferido antes da regex (repetível; 0 = sem limite)')
+    parser.add_argument('--metricas', action='store_true',
+                        help='coleta métricas por campo do validador (em /metricas e /metricas/prometheus)')
+    args = parser.parse_args(argv)
+
+    try:
+        limites = interpretar_limites(args.limite_tamanho)
+    except ValueError as e:
+        parser.error(str(e))
+    validador = ValidadorDados(tamanho_cache=args.cache, cpf_estrito=args.cpf_estrito, limites_tamanho=limites)
+    try:
+        if args.data_estrita or args.data_minima or args.data_maxima:
+            validador.ativar_data_estrita(args.data_minima, args.data_maxima)
+        if args.indice_cep:
+            validador.usar_indice_cep(args.indice_cep)
+        if args.telefone_estrito or args.plano_telefonia:
+            validador.usar_plano_telefonia(args.plano_telefonia)
+        if args.dominios_permitidos or args.dominios_bloqueados:
+            validador.usar_dominios_email(args.dominios_permitidos, args.dominios_bloqueados)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if args.metricas:
+        validador.ativar_metricas()
+    executar(args.host, args.porta,
+             validador=validador,
+             workers=args.workers,
+             limiar_pool=args.limiar_pool,
+             max_requisicoes=args.max_requisicoes,
+             tamanho_bloco=args.tamanho_bloco,
+             orcamento=args.orcamento)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
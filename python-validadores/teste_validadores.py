@@ -116,5 +116,979 @@ def testar_validadores():
     
     return total_sucessos == total_testes
 
+def testar_lote():
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO VALIDAÇÃO EM LOTE:")
+    print("-" * 70)
+    
+    registros = [
+        {'nome': "Alan Turing", 'cpf': "123.456.789-09", 'cep': "66.645-225"},
+        {'nome': "alan turing", 'cpf': "12345678909", 'cep': "66.645-225"},
+        {'nome': "Ada Lovelace", 'cpf': " 123.456.789-09", 'cep': "66645225"},
+        {'nome': "", 'cpf': "000.111.222-33"},
+    ]
+    
+    resultado = validador.validar_lote(registros)
+    sucesso = resultado.total == len(registros)
+    
+    # O lote deve concordar com os validadores individuais
+    for campo, validos in resultado.validos.items():
+        metodo = getattr(validador, f'validar_{campo}')
+        for indice, registro in enumerate(registros):
+            esperado, _ = metodo(registro.get(campo))
+            if bool(validos[indice]) != esperado:
+                sucesso = False
+                print(f"  ❌ {campo}[{indice}] = {registro.get(campo)!r} divergiu do validador individual")
+    
+    if resultado.indices_invalidos() != [1, 2, 3]:
+        sucesso = False
+        print(f"  ❌ Índices inválidos inesperados: {resultado.indices_invalidos()}")
+    
+    # Campos que só aparecem depois do primeiro registro também são validados
+    parciais = [{'nome': "Alan Turing"}, {'nome': "Ada Lovelace", 'cpf': "12345678909"}]
+    por_campo = validador.validar_lote(iter(parciais)).falhas
+    if por_campo != {'nome': [], 'cpf': [0, 1]}:
+        sucesso = False
+        print(f"  ❌ Campos ausentes do primeiro registro: {por_campo}")
+    
+    print(f"  {'✅' if sucesso else '❌'} Falhas por campo: {resultado.contagem_falhas()}")
+    return sucesso
+
+def testar_arquivos():
+    import json
+    import os
+    import tempfile
+    from processamento_arquivos import EscritorInvalidos, validar_arquivo
+    
+    print("\n📋 TESTANDO VALIDAÇÃO DE ARQUIVOS (CSV/JSONL):")
+    print("-" * 70)
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        entrada_csv = os.path.join(pasta, 'entrada.csv')
+        with open(entrada_csv, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("nome,cpf,obs\nAlan Turing,123.456.789-09,x\nada,12345678909,y\n"
+                          "Ada Lovelace,123.456.789-09,z\n")
+        saida_csv = os.path.join(pasta, 'invalidos.csv')
+        resumo_csv = validar_arquivo(entrada_csv, saida_csv, tamanho_bloco=2)
+        with open(saida_csv, encoding='utf-8') as arquivo:
+            linhas_csv = arquivo.read().splitlines()
+        
+        entrada_jsonl = os.path.join(pasta, 'entrada.jsonl')
+        with open(entrada_jsonl, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('{"numero_flutuante": "1,5", "cpf": "123.456.789-09"}\n'
+                          '{"numero_flutuante": 1.5, "cpf": ["x"]}\n\n'
+                          '{"numero_flutuante": "2.0", "cpf": null}\n')
+        saida_jsonl = os.path.join(pasta, 'invalidos.jsonl')
+        resumo_jsonl = validar_arquivo(entrada_jsonl, saida_jsonl)
+        with open(saida_jsonl, encoding='utf-8') as arquivo:
+            invalidos_jsonl = [json.loads(linha) for linha in arquivo]
+        
+        # Linha com mais células que o cabeçalho: as extras vão para COLUNA_EXTRAS
+        entrada_irregular = os.path.join(pasta, 'irregular.csv')
+        with open(entrada_irregular, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("nome,cpf\nAlan Turing,x,a,b\nAda Lovelace,123.456.789-09\n")
+        saida_irregular = os.path.join(pasta, 'irregular_invalidos.csv')
+        resumo_irregular = validar_arquivo(entrada_irregular, saida_irregular)
+        with open(saida_irregular, encoding='utf-8') as arquivo:
+            linhas_irregulares = arquivo.read().splitlines()
+        
+        # Registros com chaves diferentes: campos ausentes do primeiro registro também são conferidos
+        entrada_chaves = os.path.join(pasta, 'chaves.jsonl')
+        with open(entrada_chaves, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('{"nome": "Alan Turing"}\n{"nome": "Ada Lovelace", "cpf": "x"}\n'
+                          '{"nome": "Ada Lovelace", "cpf": "123.456.789-09", "email": "BAD"}\n')
+        saida_chaves = os.path.join(pasta, 'chaves_invalidos.jsonl')
+        resumo_chaves = validar_arquivo(entrada_chaves, saida_chaves, tamanho_bloco=1)
+        with open(saida_chaves, encoding='utf-8') as arquivo:
+            invalidos_chaves = {linha['registro']: set(linha['erros']) for linha in map(json.loads, arquivo)}
+        
+        # JSONL com colunas diferentes por registro, gravado em CSV
+        saida_mista = os.path.join(pasta, 'mista.csv')
+        validar_arquivo(entrada_jsonl, saida_mista, mapeamento={'cpf': 'cpf'})
+        with open(saida_mista, encoding='utf-8') as arquivo:
+            linhas_mistas = arquivo.read().splitlines()
+        saida_escritor = os.path.join(pasta, 'escritor.csv')
+        with EscritorInvalidos(saida_escritor) as escritor:
+            escritor.escrever(1, {'cpf': "x"}, {'cpf': "CPF inválido"})
+            escritor.escrever(4, {'rg': "y", 'cpf': "z"}, {'rg': "RG inválido", 'cpf': "CPF inválido"})
+        with open(saida_escritor, encoding='utf-8') as arquivo:
+            linhas_escritor = arquivo.read().splitlines()
+        
+        lista = os.path.join(pasta, 'lista.jsonl')
+        with open(lista, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('{"cpf": "123.456.789-09"}\n["cpf"]\n')
+        try:
+            validar_arquivo(lista, os.path.join(pasta, 'lista_invalidos.jsonl'))
+            linha_rejeitada = False
+        except ValueError as e:
+            linha_rejeitada = 'Linha 2' in str(e)
+    
+    verificacoes = [
+        ("CSV: total e falhas", resumo_csv.total == 3 and resumo_csv.invalidos == 1
+         and resumo_csv.falhas == {'nome': 1, 'cpf': 1}),
+        ("CSV: inválido com colunas originais e erros", linhas_csv[0] == "registro,nome,cpf,obs,erros"
+         and linhas_csv[1].startswith("2,ada,12345678909,y,") and len(linhas_csv) == 2),
+        ("JSONL: valores que não são texto são inválidos", resumo_jsonl.total == 3
+         and [linha['registro'] for linha in invalidos_jsonl] == [2, 3]),
+        ("JSONL: mensagem de tipo", invalidos_jsonl[0]['erros'] == {
+            'numero_flutuante': "Valor deve ser texto (recebido float)",
+            'cpf': "Valor deve ser texto (recebido list)"}),
+        ("JSONL: linha que não é objeto rejeitada com o número", linha_rejeitada),
+        ("CSV: linha com células a mais", resumo_irregular.invalidos == 1
+         and linhas_irregulares[0] == "registro,nome,cpf,_extras,erros"
+         and linhas_irregulares[1].startswith("1,Alan Turing,x,\"['a', 'b']\",cpf:")),
+        ("JSONL: campos ausentes do primeiro registro", invalidos_chaves == {2: {'cpf'}, 3: {'email'}}
+         and resumo_chaves.falhas == {'nome': 0, 'cpf': 1, 'email': 1}),
+        ("Escritor CSV: união das colunas de todos os registros",
+         linhas_escritor == ["registro,cpf,rg,erros", "1,x,,cpf: CPF inválido",
+                             "4,z,y,rg: RG inválido; cpf: CPF inválido"]),
+        ("JSONL gravado em CSV sem perder colunas", linhas_mistas[0] == "registro,numero_flutuante,cpf,erros"
+         and len(linhas_mistas) == 3),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_linha_comando():
+    import contextlib
+    import io
+    import os
+    import tempfile
+    import validador
+    
+    print("\n📋 TESTANDO CÓDIGOS DE SAÍDA DA LINHA DE COMANDO:")
+    print("-" * 70)
+    
+    def executar(*argumentos):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return validador.main(list(argumentos))
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        validos = os.path.join(pasta, 'validos.csv')
+        invalidos = os.path.join(pasta, 'invalidos.csv')
+        saida = os.path.join(pasta, 'saida.csv')
+        with open(validos, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("nome,cpf\nAlan Turing,123.456.789-09\n")
+        with open(invalidos, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("nome,cpf\nalan,123\n")
+        
+        original = validador.validar_arquivo
+        def falhar(*args, **kwargs):
+            raise TypeError("falha inesperada")
+        validador.validar_arquivo = falhar
+        try:
+            inesperado = executar(validos, saida)
+        finally:
+            validador.validar_arquivo = original
+        
+        verificacoes = [
+            ("0 = todos válidos", executar(validos, saida) == validador.SAIDA_OK),
+            ("1 = há inválidos", executar(invalidos, saida) == validador.SAIDA_INVALIDOS),
+            ("2 = arquivo inexistente", executar(os.path.join(pasta, 'nada.csv'), saida) == validador.SAIDA_ERRO),
+            ("2 = erro inesperado, nunca 1", inesperado == validador.SAIDA_ERRO),
+            ("3 = orçamento esgotado", executar(validos, saida, '--orcamento', '0') == validador.SAIDA_INCOMPLETO),
+        ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_prefiltros():
+    import random
+    from validador_dados import CAMPOS, MENSAGEM_VAZIO, MENSAGENS
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO PREFILTROS (comparação com a validação original):")
+    print("-" * 70)
+    
+    def original(campo, valor):
+        # Validação anterior aos prefiltros: espaços nas pontas e a regex
+        if not valor or valor.startswith(' ') or valor.endswith(' '):
+            return False, MENSAGEM_VAZIO
+        if validador.patterns[campo].match(valor):
+            return True, "Válido"
+        return False, MENSAGENS[campo]
+    
+    exemplos = {'nome': "Alan Turing", 'email': "bes@uepa.br", 'senha': "518R2r5e", 'cpf': "123.456.789-09",
+                'rg': "875467-2", 'telefone': "(91) 99999-9999", 'cep': "66.645-225",
+                'data_horario': "02/09/2025 23:59:59", 'numero_flutuante': "-25.467"}
+    rng = random.Random(6)
+    alfabeto = "aZ09.-/() :@,+\n٣x"
+    sucesso = True
+    
+    for campo in CAMPOS:
+        exemplo = exemplos[campo]
+        casos = ["", " ", exemplo, exemplo + "\n", exemplo + "\n\n", " " + exemplo, exemplo * 3, "x" * 40]
+        for _ in range(5000):
+            base = list(exemplo)
+            for _ in range(rng.randint(0, 2)):
+                base[rng.randrange(len(base))] = rng.choice(alfabeto)
+            corte = rng.randint(max(0, len(base) - 2), len(base))
+            casos.append(''.join(base[:corte]) + rng.choice(['', '', '1', 'a', '\n']))
+        
+        lote = validador.validar_lote({campo: casos}).validos[campo]
+        divergencias = [caso for indice, caso in enumerate(casos)
+                        if tuple(validador.validar(campo, caso)) != original(campo, caso)
+                        or bool(lote[indice]) != original(campo, caso)[0]]
+        if divergencias:
+            sucesso = False
+            print(f"  ❌ {campo}: {len(divergencias)} divergências, ex.: {divergencias[:3]!r}")
+        else:
+            print(f"  ✅ {campo}: {len(casos)} entradas com o mesmo resultado")
+    
+    return sucesso
+
+def testar_paralelo():
+    import random
+    from processamento_paralelo import ExecutorValidacao, validar_lote_paralelo
+    from validador_dados import ResultadoLote
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO VALIDAÇÃO EM PARALELO (ordem e combinação):")
+    print("-" * 70)
+    
+    rng = random.Random(3)
+    opcoes = {'nome': ["Alan Turing", "alan turing", ""], 'cpf': ["123.456.789-09", "12345678909"],
+              'cep': ["66.645-225", "66645225", None]}
+    registros = [{campo: rng.choice(valores) for campo, valores in opcoes.items()} for _ in range(1000)]
+    sequencial = validador.validar_lote(registros)
+    
+    with ExecutorValidacao(workers=2, tamanho_bloco=37, validador=validador) as executor:
+        paralelo = executor.validar_lote(registros)
+        colunas = {'cpf': [registro['cpf'] for registro in registros]}
+        blocos = [{'cpf': colunas['cpf'][inicio:inicio + 100]} for inicio in range(0, 1000, 100)]
+        por_bloco = list(executor.validar_blocos(blocos))
+    
+    combinado = ResultadoLote(0, {}, {})
+    for parcial in por_bloco:
+        combinado.estender(parcial)
+    
+    verificacoes = [
+        ("Mesmo resultado do modo sequencial", paralelo.total == 1000 and paralelo.validos == sequencial.validos
+         and paralelo.falhas == sequencial.falhas),
+        ("Índices inválidos na ordem da entrada", paralelo.indices_invalidos() == sequencial.indices_invalidos()),
+        ("Um resultado por bloco, em ordem", [parcial.validos['cpf'] for parcial in por_bloco]
+         == [validador.validar_lote(bloco).validos['cpf'] for bloco in blocos]),
+        ("Blocos combinados com índices deslocados", combinado.falhas['cpf'] == sequencial.falhas['cpf']),
+        ("Colunas {campo: [valores]}", validar_lote_paralelo(colunas, workers=2, tamanho_bloco=300).falhas['cpf']
+         == sequencial.falhas['cpf']),
+        ("Campos ausentes do primeiro registro", validar_lote_paralelo(
+            [{'nome': "Alan Turing"}, {'cpf': "x"}], workers=2, tamanho_bloco=1).falhas == {'nome': [1], 'cpf': [0, 1]}),
+    ]
+    for descricao, argumentos in (("Bloco vazio recusado", {'tamanho_bloco': 0}),
+                                  ("Workers negativos recusados", {'workers': -1})):
+        try:
+            ExecutorValidacao(**argumentos)
+            verificacoes.append((descricao, False))
+        except ValueError:
+            verificacoes.append((descricao, True))
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_cache():
+    from processamento_paralelo import ExecutorValidacao
+    
+    print("\n📋 TESTANDO CACHE DE RESULTADOS (LRU):")
+    print("-" * 70)
+    
+    validador = ValidadorDados(tamanho_cache=2)
+    sem_cache = ValidadorDados()
+    cpf_a, cpf_b, cep = "123.456.789-09", "12345678909", "66.645-225"
+    
+    validador.validar('cpf', cpf_a)                 # falta
+    validador.validar('cpf', cpf_a)                 # acerto
+    validador.validar('cpf', cpf_b)                 # falta
+    validador.validar('cpf', cpf_a)                 # acerto: cpf_b passa a ser o mais antigo
+    validador.validar('cep', cep)                   # falta, despeja cpf_b
+    apos_despejo = validador.estatisticas_cache()
+    validador.validar('cpf', cpf_a)                 # acerto: continua no cache
+    validador.validar('cpf', cpf_b)                 # falta: foi despejado
+    final = validador.estatisticas_cache()
+    
+    lote = ValidadorDados(tamanho_cache=100)
+    coluna = [cpf_a, cpf_b, "x"] * 1000
+    resultado = lote.validar_lote({'cpf': coluna})
+    estatisticas_lote = lote.estatisticas_cache()
+    lote.registrar_campo('placa', r'^[A-Z]{3}[0-9]{4}$', "Formato de placa inválido")
+    with ExecutorValidacao(workers=2, tamanho_bloco=500, validador=lote, tamanho_cache=100) as executor:
+        paralelo = executor.validar_lote({'cpf': coluna})
+    
+    verificacoes = [
+        ("Acertos, faltas e despejos", apos_despejo == {'acertos': 2, 'faltas': 3, 'despejos': 1,
+                                                         'tamanho': 2, 'capacidade': 2}),
+        ("Despeja o menos usado recentemente", final['acertos'] == 3 and final['faltas'] == 4
+         and final['despejos'] == 2),
+        ("Mesmo resultado sem cache", all(validador.validar('cpf', valor) == sem_cache.validar('cpf', valor)
+                                          for valor in (cpf_a, cpf_b, "", " x"))),
+        ("Lote usa o cache", estatisticas_lote['faltas'] == 3 and estatisticas_lote['acertos'] == 2997
+         and resultado.falhas == sem_cache.validar_lote({'cpf': coluna}).falhas),
+        ("Registrar campo limpa o cache", lote.estatisticas_cache()['tamanho'] == 0),
+        ("Modo paralelo com cache", paralelo.falhas == resultado.falhas),
+        ("Sem cache por padrão", sem_cache.estatisticas_cache() is None),
+    ]
+    try:
+        ValidadorDados(tamanho_cache=-1)
+        verificacoes.append(("Capacidade negativa recusada", False))
+    except ValueError:
+        verificacoes.append(("Capacidade negativa recusada", True))
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_resultados():
+    from validador_dados import FORMATO_INVALIDO, VALIDO, ResultadoRegistro
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO RESULTADOS (Mapping e compatibilidade com tuplas):")
+    print("-" * 70)
+    
+    registro = {'nome': "Alan Turing", 'cpf': "12345678909", 'cep': "66.645-225"}
+    resultados = validador.validar_todos_campos(registro)
+    valido, mensagem = validador.validar_cpf("123.456.789-09")
+    
+    # Uso das interfaces: len(), .items() com desempacotamento da tupla
+    desempacotados = {campo: (valido_campo, mensagem_campo)
+                      for campo, (valido_campo, mensagem_campo) in resultados.items()}
+    try:
+        resultados['rg']
+        chave_ausente = False
+    except KeyError:
+        chave_ausente = True
+    
+    verificacoes = [
+        ("Resultado é uma tupla (valido, mensagem)", (valido, mensagem) == (True, "Válido")
+         and isinstance(validador.validar_cpf("x"), tuple) and validador.validar_cpf("x")[0] is False),
+        ("Resultados pré-alocados", validador.validar_cpf("123.456.789-09") is VALIDO
+         and validador.validar_cpf("x") is FORMATO_INVALIDO['cpf']),
+        ("Registro é um Mapping", isinstance(resultados, ResultadoRegistro) and len(resultados) == 3
+         and list(resultados) == ['nome', 'cpf', 'cep'] and 'cpf' in resultados and 'rg' not in resultados),
+        ("Consulta por campo", resultados['cpf'] == (False, FORMATO_INVALIDO['cpf'].mensagem)
+         and resultados.get('rg') is None and chave_ausente),
+        ("items(), keys() e values()", desempacotados == {campo: tuple(resultado) for campo, resultado
+                                                          in dict(resultados).items()}
+         and list(resultados.keys()) == list(registro) and len(list(resultados.values())) == 3),
+        ("Igual ao dict equivalente", resultados == {'nome': VALIDO, 'cpf': FORMATO_INVALIDO['cpf'], 'cep': VALIDO}),
+        ("todos_validos", not resultados.todos_validos()
+         and validador.validar_todos_campos({'cep': "66.645-225"}).todos_validos()),
+        ("Sem __dict__ (__slots__)", not hasattr(resultados, '__dict__')),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_mascaras():
+    import random
+    from validador_dados import MASCARAS, compilar_mascara
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO MÁSCARAS POSICIONAIS (comparação com a regex):")
+    print("-" * 70)
+    
+    # Entradas aleatórias próximas das máscaras, incluindo '\n' final e dígitos não ASCII
+    rng = random.Random(2025)
+    alfabeto = "0123456789.-/() :dx\n٣"
+    sucesso = True
+    
+    for campo, mascara in MASCARAS.items():
+        padrao = validador.patterns[campo]
+        casar = compilar_mascara(mascara, padrao)
+        
+        casos = [mascara.replace('d', '7'), mascara, mascara.replace('d', '٣'),
+                 mascara.replace('d', '1') + "\n", mascara.replace('d', '1') + "\n\n"]
+        for _ in range(20000):
+            base = list(mascara.replace('d', '5'))
+            for _ in range(rng.randint(0, 2)):
+                base[rng.randrange(len(base))] = rng.choice(alfabeto)
+            casos.append(''.join(base)[:rng.randint(len(base) - 1, len(base))] + rng.choice(['', '', '\n', '1']))
+        
+        divergencias = [caso for caso in casos if casar(caso) != bool(padrao.match(caso))]
+        if divergencias:
+            sucesso = False
+            print(f"  ❌ {campo}: {len(divergencias)} divergências, ex.: {divergencias[:3]!r}")
+        else:
+            print(f"  ✅ {campo}: {len(casos)} entradas idênticas à regex")
+    
+    return sucesso
+
+def testar_numpy():
+    import validacao_numpy
+    
+    print("\n📋 TESTANDO BACKEND NUMPY (comparação com validar_lote):")
+    print("-" * 70)
+    
+    if not validacao_numpy.disponivel():
+        print("  ⚠️ numpy não instalado; teste ignorado")
+        return True
+    
+    coluna = ["123.456.789-09", "529.982.247-25", "12345678909", "111.111.111-11", "123.456.789-0", ""]
+    padrao = ValidadorDados()
+    estrito = ValidadorDados(cpf_estrito=True)
+    proprio = ValidadorDados()
+    proprio.registrar_campo('cpf', r'^\d{11}$', "CPF deve ter 11 dígitos", substituir=True)
+    
+    verificacoes = []
+    for descricao, validador in (("Máscara padrão", padrao), ("CPF estrito", estrito), ("Regex registrada", proprio)):
+        vetorizado = validador.validar_coluna_numpy('cpf', coluna).tolist()
+        verificacoes.append((descricao, vetorizado == list(map(bool, validador.validar_lote({'cpf': coluna}).validos['cpf']))))
+    verificacoes.append(("Regex registrada não usa a máscara", not validacao_numpy.vetorizavel(proprio, 'cpf')
+                         and proprio.validar_coluna_numpy('cpf', coluna).tolist()[2]))
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_detectar_tipos():
+    import random
+    from validador_dados import CAMPOS
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO DETECÇÃO DE TIPOS (autômato produto):")
+    print("-" * 70)
+    
+    rng = random.Random(2025)
+    alfabeto = "0123456789.-/() :+,aAzZbr@\n٣Ü"
+    casos = ["Alan Turing", "bes@uepa.br", "518R2r5e", "123.456.789-09", "875467-2",
+             "(91) 99999-9999", "66.645-225", "02/09/2025 23:59:59", "-25.467", "12345678", ""]
+    casos += [''.join(rng.choice(alfabeto) for _ in range(rng.randint(0, 20))) for _ in range(20000)]
+    
+    divergencias = []
+    for caso in casos:
+        esperado = tuple(campo for campo in CAMPOS if getattr(validador, f'validar_{campo}')(caso)[0])
+        if validador.detectar_tipos(caso) != esperado:
+            divergencias.append(caso)
+    
+    if divergencias:
+        print(f"  ❌ {len(divergencias)} divergências, ex.: {divergencias[:3]!r}")
+    else:
+        print(f"  ✅ {len(casos)} entradas idênticas aos validadores individuais")
+    
+    # Os nove campos padrão precisam estar no autômato, não na conferência um a um
+    todos_no_automato = validador._fora_do_automato == ()
+    print(f"  {'✅' if todos_no_automato else '❌'} Campos padrão no autômato "
+          f"(fora: {validador._fora_do_automato!r})")
+    
+    coluna = ["123.456.789-09", "000.111.222-33", "987.654.321-00", "lixo"]
+    tipo = validador.inferir_tipo_coluna(coluna, limiar=0.7)
+    print(f"  {'✅' if tipo == 'cpf' else '❌'} Tipo inferido da coluna: {tipo}")
+    
+    return not divergencias and todos_no_automato and tipo == 'cpf'
+
+def testar_registro_campos():
+    import re
+    from processamento_paralelo import ExecutorValidacao
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO REGISTRO DE CAMPOS:")
+    print("-" * 70)
+    
+    validador.registrar_campo('placa', r'^[A-Z]{3}[0-9][A-Z0-9][0-9]{2}$', "Formato de placa inválido")
+    validador.registrar_campo('sigla', r'^(?i:[a-z]{2})$', "Formato de sigla inválido")
+    
+    verificacoes = [
+        ("Placa válida", validador.validar('placa', 'ABC1D23').valido),
+        ("Placa inválida", not validador.validar('placa', 'abc1d23').valido),
+        ("Registro completo", validador.validar_todos_campos({'cpf': '123.456.789-09', 'placa': 'ABC1234'}).todos_validos()),
+        ("Lote", validador.validar_lote({'placa': ['ABC1234', 'x']}).indices_invalidos() == [1]),
+        ("Detecção", validador.detectar_tipos('PA') == ('sigla',)),
+    ]
+    
+    # Flags da regex compilada (re.I) valem também nos workers
+    validador.registrar_campo('uf', re.compile(r'^[a-z]{2}$', re.I), "Formato de UF inválido")
+    with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=validador) as executor:
+        paralelo = executor.validar_lote({'uf': ['PA', 'pa', 'P4']})
+    verificacoes.append(("Flags da regex no modo paralelo", paralelo.falhas['uf'] == [2]
+                         and validador.validar_lote({'uf': ['PA', 'pa', 'P4']}).falhas['uf'] == [2]))
+    try:
+        validador.registrar_campo('cpf', r'^\d+$', "Duplicado")
+        verificacoes.append(("Duplicado recusado", False))
+    except ValueError:
+        verificacoes.append(("Duplicado recusado", True))
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_plano():
+    from validador_dados import CAMPOS
+    
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO PLANO PRÉ-COMPILADO:")
+    print("-" * 70)
+    
+    valido = {'nome': "Alan Turing", 'email': "bes@uepa.br", 'senha': "518R2r5e",
+              'cpf': "123.456.789-09", 'rg': "875467-2", 'telefone': "(91) 99999-9999",
+              'cep': "66.645-225", 'data_horario': "02/09/2025 23:59:59", 'numero_flutuante': "-25.467"}
+    registros = [valido, dict(valido, cpf="123.456.789-0"), dict(valido, senha=""), {'cpf': "123.456.789-09"}]
+    plano = validador.compilar_plano(CAMPOS)
+    
+    iguais = all(dict(plano(r)) == dict(validador.validar_todos_campos(r)) for r in registros[:3])
+    validades = [plano.valido(r) for r in registros]
+    verificacoes = [
+        ("Mesmo resultado de validar_todos_campos", iguais),
+        ("Apenas pass/fail", validades == [True, False, False, False]),
+        ("Filtrar válidos", list(plano.filtrar_validos(registros)) == [valido]),
+        # Campos do plano são obrigatórios; registro_valido ignora os ausentes
+        ("Campo ausente reprova só no plano", not plano.valido(registros[3]) and validador.registro_valido(registros[3])
+         and plano(registros[3]).campos == CAMPOS and validador.validar_todos_campos(registros[3]).campos == ('cpf',)),
+    ]
+    try:
+        validador.compilar_plano(['cpf', 'inexistente'])
+        verificacoes.append(("Campo desconhecido recusado", False))
+    except ValueError:
+        verificacoes.append(("Campo desconhecido recusado", True))
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_falha_rapida():
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO MODO FAIL-FAST:")
+    print("-" * 70)
+    
+    valido = {'nome': "Alan Turing", 'senha': "518R2r5e", 'cpf': "123.456.789-09", 'cep': "66.645-225"}
+    # Senha quase sempre inválida: a ordem adaptativa deve passar a conferi-la primeiro
+    registros = [dict(valido, senha="fraca") for _ in range(3000)] + [valido]
+    
+    iguais = all(validador.registro_valido(r) == validador.validar_todos_campos(r).todos_validos()
+                 for r in registros)
+    falha = validador.primeira_falha({'cpf': "x", 'cep': "66.645-225"})
+    estatisticas = validador.estatisticas_falha_rapida()
+    verificacoes = [
+        ("Mesma validade de validar_todos_campos", iguais),
+        ("Primeira falha informada", falha is not None and falha[0] == 'cpf' and not falha[1].valido),
+        ("Ordem adaptada (senha primeiro)", [c for c in estatisticas['ordem'] if c in valido][0] == 'senha'),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_metricas():
+    import json
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO MÉTRICAS:")
+    print("-" * 70)
+    
+    validador.validar_cpf("123.456.789-09")
+    desligadas = validador.metricas is None
+    metricas = validador.ativar_metricas()
+    validador.validar_cpf("123.456.789-09")
+    validador.validar_cpf("x")
+    validador.validar_lote({'cpf': ["123.456.789-09", "x", "y"]})
+    cpf = metricas.como_dict()['campos']['cpf']
+    prometheus = metricas.como_prometheus()
+    validador.desativar_metricas()
+    validador.validar_cpf("x")
+    
+    verificacoes = [
+        ("Desligadas por padrão", desligadas),
+        ("Contagens por campo", (cpf['chamadas'], cpf['validos'], cpf['invalidos']) == (2, 1, 1)),
+        ("Contagens em lote", (cpf['lote']['valores'], cpf['lote']['invalidos']) == (3, 2)),
+        ("Percentis", cpf['latencia']['p99_us'] > 0),
+        ("Formato Prometheus", 'validador_latencia_segundos_count{campo="cpf"} 2' in prometheus),
+        ("JSON", json.loads(metricas.como_json())['campos']['cpf']['chamadas'] == 2),
+        ("Desativar para de medir", metricas.como_dict()['campos']['cpf']['chamadas'] == 2),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_ganchos():
+    validador = ValidadorDados()
+    
+    print("\n📋 TESTANDO GANCHOS:")
+    print("-" * 70)
+    
+    chamadas = []
+    gancho = validador.adicionar_gancho(antes=lambda campo, valor: chamadas.append(('antes', campo)),
+                                        depois=lambda campo, valor, resultado, segundos:
+                                        chamadas.append(('depois', campo, resultado.valido)))
+    validador.validar_cpf("123.456.789-09")
+    validador.validar_lote({'rg': ["875467-2", "x"]})
+    validador.remover_gancho(gancho)
+    validador.validar_cpf("x")
+    
+    lentas = validador.registrar_lentas(limiar_us=0, destino=lambda registro: None)
+    validador.validar_numero_flutuante("1" * 5000 + "x")
+    validador.remover_gancho(lentas.gancho)
+    
+    verificacoes = [
+        ("Antes e depois", chamadas[:2] == [('antes', 'cpf'), ('depois', 'cpf', True)]),
+        ("Lote valor a valor", chamadas[2:] == [('antes', 'rg'), ('depois', 'rg', True),
+                                                ('antes', 'rg'), ('depois', 'rg', False)]),
+        ("Chamadas lentas", len(lentas.lentas) == 1 and lentas.lentas[0]['tamanho'] == 5001),
+        ("Sem ganchos, sem instrumentação", '_validar' not in vars(validador)),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_servico():
+    import asyncio
+    import http.client
+    import json
+    import threading
+    from servico_validacao import ServicoValidacao
+    
+    print("\n📋 TESTANDO SERVIÇO HTTP:")
+    print("-" * 70)
+    
+    servico = ServicoValidacao()
+    laco = asyncio.new_event_loop()
+    laco.run_until_complete(servico.iniciar('127.0.0.1', 0))
+    threading.Thread(target=laco.run_forever, daemon=True).start()
+    conexao = http.client.HTTPConnection('127.0.0.1', servico.porta, timeout=10)
+    
+    def requisitar(caminho, dados):
+        conexao.request('POST', caminho, body=dados if isinstance(dados, bytes) else json.dumps(dados))
+        resposta = conexao.getresponse()
+        return resposta.status, resposta.read()
+    
+    try:
+        status, corpo = requisitar('/validar/cpf', {'valor': "123.456.789-09"})
+        verificacoes = [("Campo único", status == 200 and json.loads(corpo)['valido'])]
+        status, corpo = requisitar('/validar', {'cpf': "123.456.789-09", 'nome': "alan"})
+        verificacoes.append(("Registro", status == 200 and not json.loads(corpo)['valido']))
+        status, corpo = requisitar('/lote', {'cpf': ["x", "123.456.789-09", "y"]})
+        verificacoes.append(("Lote", json.loads(corpo)['indices_invalidos'] == [0, 2]))
+        status, corpo = requisitar('/lote', [{'nome': "Alan Turing"}, {'cpf': "x"}])
+        verificacoes.append(("Lote com campos ausentes do primeiro registro",
+                             json.loads(corpo)['falhas'] == {'nome': [1], 'cpf': [0, 1]}))
+        status, corpo = requisitar('/lote/ndjson', b'{"cpf": "123.456.789-09"}\n{"cpf": "x"}\n')
+        linhas = [json.loads(linha) for linha in corpo.splitlines()]
+        verificacoes.append(("NDJSON", linhas[0]['registro'] == 2 and linhas[-1]['resumo']['invalidos'] == 1))
+        status, corpo = requisitar('/lote/ndjson', b'{"cpf": 12345678909}\n{"cpf": "x"}\n{"cpf": "123.456.789-09"}\n')
+        linhas = [json.loads(linha) for linha in corpo.splitlines()]
+        verificacoes.append(("NDJSON com valor que não é texto",
+                             status == 200 and 'texto' in linhas[0]['erro'] and linhas[0]['registro'] == 1
+                             and linhas[1]['registro'] == 2 and linhas[-1]['resumo']['total'] == 2))
+        status, corpo = requisitar('/lote/ndjson', b'{"nome": "Alan Turing"}\n{"cpf": "x"}\n')
+        linhas = [json.loads(linha) for linha in corpo.splitlines()]
+        verificacoes.append(("NDJSON com campos ausentes do primeiro registro",
+                             [set(linha['erros']) for linha in linhas[:-1]] == [{'cpf'}, {'nome', 'cpf'}]
+                             and linhas[-1]['resumo']['falhas'] == {'nome': 1, 'cpf': 2}))
+        status, _ = requisitar('/validar/inexistente', {'valor': "x"})
+        verificacoes.append(("Campo desconhecido (404)", status == 404))
+    finally:
+        conexao.close()
+        asyncio.run_coroutine_threadsafe(servico.fechar(), laco).result()
+        laco.call_soon_threadsafe(laco.stop)
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_limites():
+    from validador_dados import LIMITES_TAMANHO, ResultadoLote
+    
+    print("\n📋 TESTANDO LIMITES DE TAMANHO E ORÇAMENTO DE TEMPO:")
+    print("-" * 70)
+    
+    validador = ValidadorDados(limites_tamanho={'nome': 11})
+    email_enorme = "a" * 1_000_000 + "@uepa.br"
+    colunas = {'cpf': ["123.456.789-09"] * 5000, 'rg': ["x"] * 5000}
+    esgotado = validador.validar_lote(colunas, orcamento=0)
+    completo = validador.validar_lote(colunas, orcamento=60)
+    combinado = ResultadoLote(0, {}, {})
+    for parcial in (completo, esgotado, completo):
+        combinado.estender(parcial)
+    validador.limitar_tamanho('email', None)
+    
+    verificacoes = [
+        ("Nome no limite", validador.validar_nome("Alan Turing").valido),
+        ("Nome acima do limite", not validador.validar_nome("Alan Turingg").valido),
+        ("Limite não afrouxa máscara", validador.campos['cpf'].prefiltro.maximo == 15),
+        ("Email enorme sem limite", validador.validar_email(email_enorme).valido),
+        ("Sem limites por padrão", ValidadorDados().validar_nome("Alan " + "T" + "u" * 300).valido),
+        ("Email enorme com limites recomendados",
+         not ValidadorDados(limites_tamanho=LIMITES_TAMANHO).validar_email(email_enorme).valido),
+        ("Orçamento esgotado", esgotado.avaliados == 0 and esgotado.nao_avaliados == 5000
+         and not esgotado.todos_validos()),
+        ("Orçamento suficiente", completo.nao_avaliados == 0 and completo.falhas == validador.validar_lote(colunas).falhas),
+        ("Estender após não avaliados", combinado.total == 15000 and combinado.avaliados == 5000),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_cpf_estrito():
+    from processamento_paralelo import ExecutorValidacao
+    from validador_dados import digitos_verificadores_cpf
+    
+    print("\n📋 TESTANDO CPF ESTRITO (DÍGITOS VERIFICADORES):")
+    print("-" * 70)
+    
+    validador = ValidadorDados(cpf_estrito=True)
+    coluna = ["123.456.789-09", "123.456.789-00", "111.111.111-11", "529.982.247-25", "529.982.24725"]
+    with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=validador) as executor:
+        paralelo = executor.validar_lote({'cpf': coluna})
+    
+    verificacoes = [
+        ("Dígitos corretos", validador.validar_cpf("529.982.247-25").valido),
+        ("Dígitos errados", not validador.validar_cpf("123.456.789-00").valido),
+        ("Sequência repetida", not validador.validar_cpf("111.111.111-11").valido),
+        ("Modo padrão só confere o formato", ValidadorDados().validar_cpf("123.456.789-00").valido),
+        ("Cálculo dos verificadores", digitos_verificadores_cpf("529982247") == "25"),
+        ("Lote", validador.validar_lote({'cpf': coluna}).falhas['cpf'] == [1, 2, 4]),
+        ("Lote em paralelo", paralelo.falhas['cpf'] == [1, 2, 4]),
+        ("Detecção de tipos", validador.detectar_tipos("123.456.789-00") == ()),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_data_estrita():
+    import datetime
+    from processamento_paralelo import ExecutorValidacao
+    
+    print("\n📋 TESTANDO DATA/HORÁRIO ESTRITO (CALENDÁRIO):")
+    print("-" * 70)
+    
+    validador = ValidadorDados(data_estrita=True)
+    limitado = ValidadorDados()
+    limitado.ativar_data_estrita(datetime.date(2020, 1, 1), '31/12/2024')
+    coluna = ["29/02/2024 23:59:59", "31/02/2025 25:61:99", "29/02/1900 12:00:00", "01/01/2000 00:00:00"]
+    with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=limitado) as executor:
+        paralelo = executor.validar_lote({'data_horario': coluna})
+    
+    verificacoes = [
+        ("Dia bissexto", validador.validar_data_horario("29/02/2000 12:00:00").valido),
+        ("31 de fevereiro e 25:61:99", not validador.validar_data_horario("31/02/2025 25:61:99").valido),
+        ("1900 não é bissexto", not validador.validar_data_horario("29/02/1900 12:00:00").valido),
+        ("31 de abril", not validador.validar_data_horario("31/04/2025 08:00:00").valido),
+        ("Modo padrão só confere o formato", ValidadorDados().validar_data_horario("31/02/2025 25:61:99").valido),
+        ("Limite máximo inclui o dia todo", limitado.validar_data_horario("31/12/2024 23:59:59").valido),
+        ("Fora dos limites", not limitado.validar_data_horario("01/01/2025 00:00:00").valido),
+        ("Lote", validador.validar_lote({'data_horario': coluna}).falhas['data_horario'] == [1, 2]),
+        ("Lote em paralelo com limites", paralelo.falhas['data_horario'] == [1, 2, 3]),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_backtracking():
+    import re
+    from analise_backtracking import analisar_padrao, avisos_estaticos, estimar_expoente, gerar_candidatos
+    
+    print("\n📋 TESTANDO ANÁLISE DE BACKTRACKING:")
+    print("-" * 70)
+    
+    validador = ValidadorDados()
+    opcoes = {'max_tamanho': 2048, 'tempo_limite': 20}
+    flutuante = analisar_padrao(validador.campos['numero_flutuante'].padrao.pattern, 'numero_flutuante', **opcoes)
+    catastrofico = analisar_padrao(r'^(a+)+$', 'catastrofico', **opcoes)
+    
+    verificacoes = [
+        ("Expoente de série linear", abs(estimar_expoente([(n, n * 1e-9) for n in (256, 512, 1024)]) - 1) < 1e-9),
+        ("Expoente de série quadrática", abs(estimar_expoente([(n, n * n * 1e-9) for n in (256, 512, 1024)]) - 2) < 1e-9),
+        ("numero_flutuante linear", flutuante.aprovado),
+        ("^(a+)+$ reprovado", not catastrofico.aprovado and catastrofico.classe == 'exponencial'),
+        ("Aviso de quantificador aninhado", bool(avisos_estaticos(r'^(a+)+$')) and not avisos_estaticos(r'^\d+$')),
+        ("Flags do padrão compilado (re.VERBOSE)", all(
+            ' ' not in prefixo + bomba for prefixo, bomba, _ in gerar_candidatos(re.compile(r'^ \d{3} - \d $', re.X)))),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_indice_cep():
+    import os
+    import pickle
+    import tempfile
+    from indice_cep import IndiceCEP, construir_indice
+    from processamento_paralelo import ExecutorValidacao
+    
+    print("\n📋 TESTANDO ÍNDICE DE CEPS:")
+    print("-" * 70)
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        faixas = os.path.join(pasta, 'faixas.csv')
+        caminho = os.path.join(pasta, 'ceps.idx')
+        with open(faixas, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("cep_inicial;cep_final\n"
+                          "66645-000;66645-499\n66645-500;66645-999\n"
+                          "01000-000;01099-999\n01050-000;01060-000\n99999-999;99999-999\n")
+        quantidade = construir_indice(faixas, caminho, delimitador=';')
+        invalido = os.path.join(pasta, 'invalido.idx')
+        with open(invalido, 'wb') as arquivo:
+            arquivo.write(b'nao e um indice')
+        try:
+            IndiceCEP(invalido)
+            rejeitado = False
+        except ValueError:
+            rejeitado = True
+        
+        validador = ValidadorDados(indice_cep=caminho)
+        indice = validador.campos['cep'].casador.indice
+        coluna = ["66.645-225", "66.646-000", "01.099-999", "00.000-000", "99.999-999", "6664-5225"]
+        with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=validador) as executor:
+            paralelo = executor.validar_lote({'cep': coluna})
+        
+        verificacoes = [
+            ("Faixas contíguas e sobrepostas fundidas", quantidade == 3),
+            ("CEP dentro de uma faixa", validador.validar_cep("66.645-225").valido),
+            ("CEP fora das faixas", not validador.validar_cep("66.646-000").valido),
+            ("Extremos das faixas", validador.validar_cep("01.000-000").valido
+             and validador.validar_cep("99.999-999").valido and not validador.validar_cep("00.999-999").valido),
+            ("Formato continua conferido", not validador.validar_cep("66645-225").valido),
+            ("Consulta direta no índice", "66645-999" in indice and 1099999 in indice and 100000000 not in indice),
+            ("Serializado leva só o caminho", pickle.loads(pickle.dumps(indice)).contem(66645225)),
+            ("Lote", validador.validar_lote({'cep': coluna}).falhas['cep'] == [1, 3, 5]),
+            ("Lote em paralelo", paralelo.falhas['cep'] == [1, 3, 5]),
+            ("Arquivo inválido rejeitado", rejeitado),
+        ]
+        indice.fechar()
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_telefone_estrito():
+    import os
+    import tempfile
+    from plano_telefonia import ler_plano
+    from processamento_paralelo import ExecutorValidacao
+    
+    print("\n📋 TESTANDO TELEFONE ESTRITO (PLANO DE DDDs):")
+    print("-" * 70)
+    
+    validador = ValidadorDados(telefone_estrito=True)
+    plano = ler_plano()
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'plano.csv')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("ddd;prefixos\n91;9\n61;2389\n")
+        proprio = ValidadorDados()
+        proprio.usar_plano_telefonia(ler_plano(caminho, delimitador=';'))
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("ddd,prefixos\n91,9\n91,8\n")
+        try:
+            ler_plano(caminho)
+            repetido = False
+        except ValueError:
+            repetido = True
+    coluna = ["(91) 99999-9999", "(00) 99999-9999", "(11) 88765-4321", "(20) 91234-5678", "(61) 91234-5678"]
+    with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=proprio) as executor:
+        paralelo = executor.validar_lote({'telefone': coluna})
+    
+    verificacoes = [
+        ("67 DDDs no plano nacional", len(plano) == 67 and 11 in plano and 20 not in plano),
+        ("Celular com DDD existente", validador.validar_telefone("(11) 98765-4321").valido),
+        ("DDD (00) rejeitado", not validador.validar_telefone("(00) 99999-9999").valido),
+        ("Celular sem o 9 rejeitado", not validador.validar_telefone("(91) 89999-9999").valido),
+        ("Formato continua conferido", not validador.validar_telefone("(91)99999-9999").valido),
+        ("Modo padrão só confere o formato", ValidadorDados().validar_telefone("(00) 99999-9999").valido),
+        ("Plano próprio com prefixos", proprio.validar_telefone("(61) 31234-5678").valido
+         and not proprio.validar_telefone("(11) 98765-4321").valido),
+        ("DDD repetido no arquivo rejeitado", repetido),
+        ("Lote", validador.validar_lote({'telefone': coluna}).falhas['telefone'] == [1, 2, 3]),
+        ("Lote em paralelo com plano próprio", paralelo.falhas['telefone'] == [1, 2, 3]),
+    ]
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
+def testar_dominios_email():
+    import os
+    import pickle
+    import tempfile
+    from dominios_email import ConjuntoDominios, IndiceDominios, abrir_dominios, construir_indice
+    from processamento_paralelo import ExecutorValidacao
+    from validador_dados import MENSAGEM_EMAIL_BLOQUEADO, MENSAGEM_EMAIL_PERMITIDO
+    
+    print("\n📋 TESTANDO LISTAS DE DOMÍNIOS DE EMAIL:")
+    print("-" * 70)
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        bloqueados = os.path.join(pasta, 'descartaveis.txt')
+        permitidos = os.path.join(pasta, 'permitidos.txt')
+        indice = os.path.join(pasta, 'permitidos.idx')
+        with open(bloqueados, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("# domínios descartáveis\n@Lixo.BR\n*.temporario.br\n")
+        with open(permitidos, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("uepa.br\nufpa.br  # federal\nlixo.br\n")
+        construir_indice([permitidos], indice)
+        
+        lista = ConjuntoDominios.carregar(bloqueados)
+        aberto = abrir_dominios(indice)
+        validador = ValidadorDados(dominios_bloqueados=bloqueados)
+        restrito = ValidadorDados(dominios_permitidos=indice, dominios_bloqueados=bloqueados)
+        coluna = ["bes@uepa.br", "a@lixo.br", "b@gmail.br", "c@ufpa.br", "d@temporario.br"]
+        with ExecutorValidacao(workers=2, tamanho_bloco=2, validador=restrito) as executor:
+            paralelo = executor.validar_lote({'email': coluna})
+        
+        verificacoes = [
+            ("Lista em texto normalizada", sorted(lista.dominios) == ['lixo.br', 'temporario.br']),
+            ("Subdomínio de domínio da lista", 'x.lixo.br' in lista and 'lixo.br' in aberto
+             and 'xlixo.br' not in lista),
+            ("Índice mapeado em memória", isinstance(aberto, IndiceDominios) and len(aberto) == 3
+             and 'ufpa.br' in aberto and 'ufra.br' not in aberto),
+            ("Índice serializado leva só o caminho", pickle.loads(pickle.dumps(aberto)).contem('uepa.br')),
+            ("Domínio bloqueado", not validador.validar_email("a@lixo.br").valido),
+            ("Domínio não bloqueado", validador.validar_email("bes@uepa.br").valido),
+            ("Formato continua conferido", not validador.validar_email("Bes@uepa.br").valido),
+            ("Lista de permitidos", not restrito.validar_email("b@gmail.br").valido
+             and restrito.validar_email("c@ufpa.br").valido),
+            ("Bloqueio vale sobre a lista de permitidos",
+             tuple(restrito.validar_email("a@lixo.br")) == (False, MENSAGEM_EMAIL_BLOQUEADO)
+             and restrito.compilar_plano(['email'])({'email': "a@lixo.br"})['email'].mensagem
+             == MENSAGEM_EMAIL_BLOQUEADO),
+            ("Mensagem de domínio não permitido",
+             restrito.validar_email("b@gmail.br").mensagem == MENSAGEM_EMAIL_PERMITIDO),
+            ("Lote", restrito.validar_lote({'email': coluna}).falhas['email'] == [1, 2, 4]),
+            ("Lote em paralelo", paralelo.falhas['email'] == [1, 2, 4]),
+        ]
+        aberto.fechar()
+    
+    for descricao, ok in verificacoes:
+        print(f"  {'✅' if ok else '❌'} {descricao}")
+    return all(ok for _, ok in verificacoes)
+
 if __name__ == "__main__":
-    testar_validadores()
\ No newline at end of file
+    testar_validadores()
+    testar_lote()
+    testar_arquivos()
+    testar_linha_comando()
+    testar_paralelo()
+    testar_prefiltros()
+    testar_cache()
+    testar_resultados()
+    testar_mascaras()
+    testar_numpy()
+    testar_detectar_tipos()
+    testar_registro_campos()
+    testar_plano()
+    testar_falha_rapida()
+    testar_metricas()
+    testar_ganchos()
+    testar_servico()
+    testar_limites()
+    testar_cpf_estrito()
+    testar_data_estrita()
+    testar_backtracking()
+    testar_indice_cep()
+    testar_telefone_estrito()
+    testar_dominios_email()
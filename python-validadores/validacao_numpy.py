@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Backend NumPy (opcional) para validar colunas inteiras de campos de layout fixo.
+
+Uma coluna de CPFs carregada como array `S14` (ou `U14`) é vista como uma
+matriz de códigos de caractere, e cada posição da máscara ('ddd.ddd.ddd-dd')
+vira uma comparação vetorizada sobre a coluna toda. Campos de tamanho
+variável (nome, email, senha, numero_flutuante), e campos de layout fixo
+registrados com outra regex ou outro casador, usam validar_lote. No modo
+CPF estrito, os dígitos verificadores também são calculados para a coluna
+toda, com um produto matricial pelos pesos do módulo 11; no modo estrito de
+data_horario, o calendário usa as mesmas tabelas do validador, e com um
+índice de CEPs cada CEP é procurado nas faixas com np.searchsorted; com o
+plano de telefonia, DDD e prefixo são uma consulta à tabela de 100 DDDs.
+
+Limitação: arrays de strings do NumPy descartam '\\x00' no fim dos valores,
+então um valor terminado em NUL é tratado como se não o tivesse.
+"""
+
+from typing import Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from validador_dados import (MASCARAS, TIPO_ANO, ULTIMO_DIA, VerificadorCEP, VerificadorDataHorario,
+                             VerificadorTelefone, casar_cpf_estrito)
+
+DIGITO_0 = ord('0')
+DIGITO_9 = ord('9')
+QUEBRA = ord('\n')
+
+# Posições dos oito dígitos do CEP ('dd.ddd-ddd')
+POSICOES_CEP = (0, 1, 3, 4, 5, 7, 8, 9)
+
+# Posições dos nove dígitos do CPF e pesos dos dois dígitos verificadores
+POSICOES_CPF = (0, 1, 2, 4, 5, 6, 8, 9, 10)
+PESOS_CPF_1 = tuple(range(10, 1, -1))
+PESOS_CPF_2 = tuple(range(11, 2, -1))
+
+# Verificadores estritos que validar_mascara reproduz de forma vetorizada
+VERIFICADORES = {'data_horario': VerificadorDataHorario, 'cep': VerificadorCEP, 'telefone': VerificadorTelefone}
+
+
+def disponivel() -> bool:
+    return np is not None
+
+
+def _exigir_numpy() -> None:
+    if np is None:
+        raise ImportError("O backend NumPy requer o pacote numpy (pip install numpy)")
+
+
+def _como_array(coluna):
+    if isinstance(coluna, np.ndarray):
+        if coluna.ndim != 1:
+            raise ValueError("A coluna deve ser um array unidimensional")
+        if coluna.dtype.kind not in 'SU':
+            raise TypeError(f"Tipo de array não suportado: {coluna.dtype} (use S ou U)")
+        return np.ascontiguousarray(coluna)
+    return np.array(['' if valor is None else valor for valor in coluna], dtype=str)
+
+
+def _codigos(array):
+    """Matriz (registros x posições) com o código de cada caractere."""
+    tipo = np.uint8 if array.dtype.kind == 'S' else np.uint32
+    largura = array.dtype.itemsize // np.dtype(tipo).itemsize
+    return array.view(tipo).reshape(len(array), largura)
+
+
+def _texto(valor) -> str:
+    return valor.decode('utf-8', 'replace') if isinstance(valor, bytes) else str(valor)
+
+
+def vetorizavel(validador, campo: str) -> bool:
+    """Se o campo usa a máscara padrão (ou um verificador estrito dela), que
+    validar_mascara reproduz; regex e casadores registrados por fora, não."""
+    if campo not in MASCARAS or validador.campos[campo].prefiltro.maximo <= len(MASCARAS[campo]):
+        return False
+    definicao = next((d for d in validador.definicoes_personalizadas() if d['nome'] == campo), None)
+    if definicao is None:
+        return True
+    casador = definicao['casador']
+    if campo == 'cpf':
+        return casador is casar_cpf_estrito
+    return campo in VERIFICADORES and isinstance(casador, VERIFICADORES[campo])
+
+
+def _validar_por_lote(validador, campo: str, array) -> 'np.ndarray':
+    valores = [_texto(valor) for valor in array.tolist()]
+    validos = validador.validar_lote({campo: valores}).validos[campo]
+    return np.frombuffer(bytes(validos), dtype=np.uint8).astype(bool)
+
+
+def validar_mascara(validador, campo: str, array) -> 'np.ndarray':
+    if not vetorizavel(validador, campo):
+        return _validar_por_lote(validador, campo, array)
+    mascara = MASCARAS[campo]
+    tamanho = len(mascara)
+    codigos = _codigos(array)
+    largura = codigos.shape[1]
+
+    if largura < tamanho:
+        validos = np.zeros(len(array), dtype=bool)
+    else:
+        validos = np.ones(len(array), dtype=bool)
+        for posicao, caractere in enumerate(mascara):
+            coluna = codigos[:, posicao]
+            if caractere == 'd':
+                validos &= (coluna >= DIGITO_0) & (coluna <= DIGITO_9)
+            else:
+                validos &= coluna == ord(caractere)
+
+        if largura > tamanho:
+            # O valor termina na máscara ou, como `$` permite, com um único '\n'
+            resto = codigos[:, tamanho:]
+            termina = ~resto.any(axis=1)
+            com_quebra = (resto[:, 0] == QUEBRA) & ~resto[:, 1:].any(axis=1)
+            validos &= termina | com_quebra
+
+    if campo == 'cpf' and validador.campos['cpf'].casador is casar_cpf_estrito and largura >= tamanho:
+        validos &= digitos_cpf_validos(codigos)
+    verificador = validador.campos[campo].casador
+    if isinstance(verificador, VerificadorDataHorario) and largura >= tamanho:
+        validos &= datas_validas(codigos, verificador)
+    if isinstance(verificador, VerificadorCEP) and largura >= tamanho:
+        validos &= ceps_existentes(codigos, verificador.indice)
+    if isinstance(verificador, VerificadorTelefone) and largura >= tamanho:
+        validos &= telefones_no_plano(codigos, verificador.plano)
+
+    # Dígitos não ASCII (aceitos por `\d`) são conferidos pelo caminho normal
+    suspeitos = ~validos & (codigos >= 128).any(axis=1)
+    if suspeitos.any():
+        for indice in np.flatnonzero(suspeitos):
+            validos[indice] = validador.validar(campo, _texto(array[indice]))[0]
+
+    return validos
+
+
+def digitos_cpf_validos(codigos) -> 'np.ndarray':
+    """Dígitos verificadores de cada linha de uma matriz de códigos de CPF.
+
+    Linhas que não são CPFs bem formados dão resultados sem sentido; combine
+    com a verificação da máscara.
+    """
+    digitos = codigos[:, POSICOES_CPF].astype(np.int64) - DIGITO_0
+    verificadores = codigos[:, 12:14].astype(np.int64) - DIGITO_0
+    primeiro = 11 - digitos @ np.array(PESOS_CPF_1) % 11
+    primeiro[primeiro >= 10] = 0
+    segundo = 11 - (digitos @ np.array(PESOS_CPF_2) + 2 * primeiro) % 11
+    segundo[segundo >= 10] = 0
+    repetidos = (digitos == digitos[:, :1]).all(axis=1)
+    return (verificadores[:, 0] == primeiro) & (verificadores[:, 1] == segundo) & ~repetidos
+
+
+def datas_validas(codigos, verificador: VerificadorDataHorario) -> 'np.ndarray':
+    """Calendário, horário e limites de cada linha de uma matriz de códigos de data_horario.
+
+    Como em digitos_cpf_validos, combine com a verificação da máscara.
+    """
+    d = codigos[:, :19].astype(np.int64) - DIGITO_0
+    dia = d[:, 0] * 10 + d[:, 1]
+    mes = d[:, 3] * 10 + d[:, 4]
+    ano = d[:, 6] * 1000 + d[:, 7] * 100 + d[:, 8] * 10 + d[:, 9]
+    hora = d[:, 11] * 10 + d[:, 12]
+    minuto = d[:, 14] * 10 + d[:, 15]
+    segundo = d[:, 17] * 10 + d[:, 18]
+
+    # Linhas fora da máscara podem ter "dígitos" fora das tabelas
+    tipos = np.frombuffer(TIPO_ANO, dtype=np.uint8)[np.clip(ano, 0, len(TIPO_ANO) - 1)]
+    ultimos = np.frombuffer(b''.join(ULTIMO_DIA), dtype=np.uint8).reshape(len(ULTIMO_DIA), -1)
+    ultimo = ultimos[tipos, np.clip(mes, 0, ultimos.shape[1] - 1)]
+    validos = (dia > 0) & (dia <= ultimo) & (hora < 24) & (minuto < 60) & (segundo < 60)
+
+    if verificador.minimo is not None or verificador.maximo is not None:
+        chave = ((((ano * 100 + mes) * 100 + dia) * 100 + hora) * 100 + minuto) * 100 + segundo
+        if verificador.minimo is not None:
+            validos &= chave >= verificador.minimo
+        if verificador.maximo is not None:
+            validos &= chave <= verificador.maximo
+    return validos
+
+
+def ceps_existentes(codigos, indice) -> 'np.ndarray':
+    """Se o CEP de cada linha de uma matriz de códigos de cep está numa faixa do IndiceCEP.
+
+    Os vetores do índice são lidos direto do mapa em memória, sem cópia.
+    Como em digitos_cpf_validos, combine com a verificação da máscara.
+    """
+    d = codigos[:, POSICOES_CEP].astype(np.int64) - DIGITO_0
+    numeros = d @ (10 ** np.arange(7, -1, -1, dtype=np.int64))
+    inicios = np.frombuffer(indice.inicios, dtype=np.uint32)
+    fins = np.frombuffer(indice.fins, dtype=np.uint32)
+    posicoes = np.searchsorted(inicios, numeros, side='right') - 1
+    if not len(fins):
+        return np.zeros(len(numeros), dtype=bool)
+    return (posicoes >= 0) & (numeros <= fins[np.maximum(posicoes, 0)])
+
+
+def telefones_no_plano(codigos, plano) -> 'np.ndarray':
+    """DDD existente e primeiro dígito aceito em cada linha de uma matriz de códigos de telefone.
+
+    Como em digitos_cpf_validos, combine com a verificação da máscara.
+    """
+    d = codigos[:, [1, 2, 5]].astype(np.int64) - DIGITO_0
+    ddd = np.clip(d[:, 0] * 10 + d[:, 1], 0, len(plano.prefixos) - 1)
+    primeiro = np.clip(d[:, 2], 0, 9)
+    return (np.array(plano.prefixos, dtype=np.int64)[ddd] >> primeiro & 1).astype(bool)
+
+
+def validar_coluna(validador, campo: str, coluna: Union['np.ndarray', Sequence[str]]) -> 'np.ndarray':
+    """Valida uma coluna inteira e devolve um array booleano (True = válido)."""
+    _exigir_numpy()
+    array = _como_array(coluna)
+
+    if campo in MASCARAS:
+        return validar_mascara(validador, campo, array)
+    return _validar_por_lote(validador, campo, array)
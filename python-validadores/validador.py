@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🎓 Validador de Dados Formal - UEPA
+Modo de linha de comando (não interativo) para validar arquivos em lote.
+
+Exemplo:
+    python -m validador clientes.csv invalidos.jsonl -m cpf=documento -w 8
+
+Códigos de saída: 0 = todos os registros válidos, 1 = há registros
+inválidos, 2 = erro de uso ou de leitura/escrita, 3 = o orçamento de
+tempo (--orcamento) acabou antes do fim do arquivo.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Dict, List, Optional
+
+from ganchos_validacao import MODOS_CAPTURA, VARIAVEL_CAPTURA
+from processamento_arquivos import FORMATOS, validar_arquivo
+from validador_dados import CAMPOS, ValidadorDados
+
+SAIDA_OK = 0
+SAIDA_INVALIDOS = 1
+SAIDA_ERRO = 2
+SAIDA_INCOMPLETO = 3
+
+
+def interpretar_mapeamento(itens: List[str]) -> Optional[Dict[str, str]]:
+    """Converte ['cpf=documento', 'nome=cliente'] em {'cpf': 'documento', 'nome': 'cliente'}."""
+    if not itens:
+        return None
+
+    mapeamento = {}
+    for item in itens:
+        for par in item.split(','):
+            campo, separador, coluna = par.partition('=')
+            campo = campo.strip()
+            if campo not in CAMPOS:
+                raise ValueError(f"Campo desconhecido '{campo}' (campos: {', '.join(CAMPOS)})")
+            mapeamento[campo] = coluna.strip() if separador else campo
+    return mapeamento
+
+
+def interpretar_limites(itens: List[str]) -> Dict[str, Optional[int]]:
+    """Converte ['nome=100', 'email=0'] em {'nome': 100, 'email': None} (0 = sem limite)."""
+    limites = {}
+    for item in itens or ():
+        for par in item.split(','):
+            campo, separador, tamanho = par.partition('=')
+            campo = campo.strip()
+            if campo not in CAMPOS:
+                raise ValueError(f"Campo desconhecido '{campo}' (campos: {', '.join(CAMPOS)})")
+            if not separador or not tamanho.strip().isdigit():
+                raise ValueError(f"Use CAMPO=TAMANHO em --limite-tamanho: '{par}'")
+            limites[campo] = int(tamanho) or None
+    return limites
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m validador',
+        description='Valida arquivos CSV/JSONL e grava apenas os registros inválidos.')
+    parser.add_argument('entrada', help='arquivo de entrada (.csv, .jsonl)')
+    parser.add_argument('saida', help='arquivo de saída com os registros inválidos (.csv, .jsonl)')
+    parser.add_argument('-m', '--mapear', action='append', metavar='CAMPO=COLUNA',
+                        help='associa um campo a uma coluna (repetível ou separado por vírgulas); '
+                             'padrão: colunas com o nome do campo')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='número de processos em paralelo (padrão: 1)')
+    parser.add_argument('-b', '--tamanho-bloco', type=int, default=10000,
+                        help='registros por bloco (padrão: 10000)')
+    parser.add_argument('-c', '--cache', type=int, default=0, metavar='N',
+                        help='cache LRU de N resultados por processo, para valores repetidos (padrão: desligado)')
+    parser.add_argument('--cpf-estrito', action='store_true',
+                        help='exige dígitos verificadores válidos no CPF')
+    parser.add_argument('--data-estrita', action='store_true',
+                        help='exige datas e horários existentes em data_horario')
+    parser.add_argument('--data-minima', metavar='DD/MM/AAAA',
+                        help='menor data aceita em data_horario (implica --data-estrita)')
+    parser.add_argument('--data-maxima', metavar='DD/MM/AAAA',
+                        help='maior data aceita em data_horario (implica --data-estrita)')
+    parser.add_argument('--indice-cep', metavar='ARQUIVO',
+                        help='exige que o CEP conste do índice de faixas (gerado por indice_cep.py)')
+    parser.add_argument('--telefone-estrito', action='store_true',
+                        help='exige DDD existente e celular começando com 9 (plano de ddd_brasil.csv)')
+    parser.add_argument('--plano-telefonia', metavar='ARQUIVO',
+                        help='CSV com os DDDs e prefixos aceitos (implica --telefone-estrito)')
+    parser.add_argument('--dominios-permitidos', action='append', metavar='ARQUIVO',
+                        help='aceita só emails destes domínios (lista em texto ou índice; repetível)')
+    parser.add_argument('--dominios-bloqueados', action='append', metavar='ARQUIVO',
+                        help='rejeita emails destes domínios (lista em texto ou índice; repetível)')
+    parser.add_argument('--limite-tamanho', action='append', metavar='CAMPO=TAMANHO',
+                        help='tamanho máximo de um campo, conferido antes da regex (repetível; 0 = sem limite)')
+    parser.add_argument('--orcamento', type=float, metavar='SEGUNDOS',
+                        help='tempo máximo de validação; os registros restantes ficam sem avaliação')
+    parser.add_argument('--lentas', type=float, metavar='MICROSSEGUNDOS',
+                        help='registra em stderr as validações mais lentas que o limiar (com workers=1)')
+    parser.add_argument('--amostragem', type=float, default=1.0,
+                        help='fração das validações lentas registradas (padrão: 1.0)')
+    parser.add_argument('--captura', choices=MODOS_CAPTURA,
+                        help=f'perfila a execução com cProfile ou tracemalloc (ou defina {VARIAVEL_CAPTURA})')
+    parser.add_argument('--captura-saida', metavar='ARQUIVO',
+                        help='grava o perfil completo neste arquivo')
+    parser.add_argument('--formato-entrada', choices=FORMATOS, help='ignora a extensão da entrada')
+    parser.add_argument('--formato-saida', choices=FORMATOS, help='ignora a extensão da saída')
+    return parser
+
+
+def imprimir_relatorio(resumo, tempo: float) -> None:
+    taxa = resumo.total / tempo if tempo > 0 else 0.0
+    print(f"Registros: {resumo.total}")
+    print(f"Inválidos: {resumo.invalidos}")
+    print(f"Tempo: {tempo:.3f}s")
+    print(f"Registros/s: {taxa:.0f}")
+    print("Falhas por campo:")
+    for campo, quantidade in resumo.falhas.items():
+        print(f"  {campo}: {quantidade}")
+    if resumo.primeiro_nao_avaliado is not None:
+        print(f"Orçamento de tempo esgotado: registros a partir do {resumo.primeiro_nao_avaliado} não avaliados")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        mapeamento = interpretar_mapeamento(args.mapear)
+        validador = ValidadorDados(tamanho_cache=args.cache,
+                                   limites_tamanho=interpretar_limites(args.limite_tamanho),
+                                   cpf_estrito=args.cpf_estrito,
+                                   indice_cep=args.indice_cep)
+        if args.telefone_estrito or args.plano_telefonia:
+            validador.usar_plano_telefonia(args.plano_telefonia)
+        if args.dominios_permitidos or args.dominios_bloqueados:
+            validador.usar_dominios_email(args.dominios_permitidos, args.dominios_bloqueados)
+        if args.data_estrita or args.data_minima or args.data_maxima:
+            validador.ativar_data_estrita(args.data_minima, args.data_maxima)
+        if args.lentas is not None:
+            logging.basicConfig(format='%(message)s')
+            validador.registrar_lentas(args.lentas, args.amostragem)
+        inicio = time.perf_counter()
+        resumo = validar_arquivo(args.entrada, args.saida,
+                                 mapeamento=mapeamento,
+                                 formato_entrada=args.formato_entrada,
+                                 formato_saida=args.formato_saida,
+                                 tamanho_bloco=args.tamanho_bloco,
+                                 validador=validador,
+                                 workers=args.workers,
+                                 captura=args.captura,
+                                 captura_saida=args.captura_saida,
+                                 orcamento=args.orcamento)
+        tempo = time.perf_counter() - inicio
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return SAIDA_ERRO
+    except Exception as e:
+        # O código 1 significa "há registros inválidos"; qualquer outra falha é erro
+        print(f"Erro inesperado ({type(e).__name__}): {e}", file=sys.stderr)
+        return SAIDA_ERRO
+
+    imprimir_relatorio(resumo, tempo)
+    if validador.cache is not None and args.workers == 1:
+        estatisticas = validador.estatisticas_cache()
+        print(f"Cache: {estatisticas['acertos']} acertos, {estatisticas['faltas']} faltas, "
+              f"{estatisticas['despejos']} despejos")
+    if resumo.invalidos:
+        return SAIDA_INVALIDOS
+    return SAIDA_INCOMPLETO if resumo.primeiro_nao_avaliado is not None else SAIDA_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,805 @@
+import datetime
 import re
-from typing import Dict, Tuple
+import string
+import sys
+import time
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from automato_campos import AFD, AutomatoProduto, _separar_lookaheads
+from dominios_email import FonteDominios, ListaDominios, abrir_dominios
+from ganchos_validacao import Gancho, RegistroLentas
+from indice_cep import IndiceCEP
+from metricas_validacao import MetricasValidacao
+from plano_telefonia import PlanoTelefonia, ler_plano
+
+# Ordem em que os campos são validados em validar_todos_campos e validar_lote
+CAMPOS = ('nome', 'email', 'senha', 'cpf', 'rg', 'telefone', 'cep',
+          'data_horario', 'numero_flutuante')
+
+MENSAGEM_VAZIO = "Campo não pode estar vazio ou ter espaços no início/fim"
+
+# Mensagem de erro de formato de cada campo
+MENSAGENS = {
+    'nome': "Nome deve ter formato 'Nome Sobrenome' com primeira letra maiúscula",
+    'email': "Email deve ter formato 'usuario@dominio.br' (apenas letras minúsculas)",
+    'senha': "Senha deve ter 8 caracteres com pelo menos 1 maiúscula e 1 número",
+    'cpf': "CPF deve ter formato '123.456.789-09'",
+    'rg': "RG deve ter formato '123456-7'",
+    'telefone': "Telefone deve ter formato '(91) 99999-9999'",
+    'cep': "CEP deve ter formato '66.645-225'",
+    'data_horario': "Data/horário deve ter formato 'dd/mm/aaaa hh:mm:ss'",
+    'numero_flutuante': "Número deve ter formato '+/-123.45' ou '123,45' (com ou sem sinal)",
+}
+
+
+
+class ResultadoValidacao(NamedTuple):
+    """Resultado de um validar_*; continua sendo uma tupla (valido, mensagem)."""
+    valido: bool
+    mensagem: str
+
+
+# Resultados pré-alocados: os validadores devolvem sempre estes objetos,
+# sem criar uma tupla nova por chamada
+VALIDO = ResultadoValidacao(True, "Válido")
+VAZIO = ResultadoValidacao(False, MENSAGEM_VAZIO)
+FORMATO_INVALIDO = {campo: ResultadoValidacao(False, mensagem) for campo, mensagem in MENSAGENS.items()}
+
+
+class ResultadoRegistro(Mapping):
+    """Resultados de validar_todos_campos: um mapeamento somente leitura
+    {campo: ResultadoValidacao}, guardado em duas tuplas em vez de um dict."""
+
+    __slots__ = ('campos', 'resultados')
+
+    def __init__(self, campos: Tuple[str, ...], resultados: Tuple[ResultadoValidacao, ...]):
+        self.campos = campos
+        self.resultados = resultados
+
+    def __getitem__(self, campo: str) -> ResultadoValidacao:
+        try:
+            return self.resultados[self.campos.index(campo)]
+        except ValueError:
+            raise KeyError(campo) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.campos)
+
+    def __len__(self) -> int:
+        return len(self.campos)
+
+    def __contains__(self, campo) -> bool:
+        return campo in self.campos
+
+    def items(self):
+        return zip(self.campos, self.resultados)
+
+    def values(self):
+        return self.resultados
+
+    def todos_validos(self) -> bool:
+        return all(resultado[0] for resultado in self.resultados)
+
+    def __repr__(self) -> str:
+        return f"ResultadoRegistro({dict(self.items())!r})"
+
+
+SEM_LIMITE = sys.maxsize
+
+MAIUSCULAS_ASCII = string.ascii_uppercase
+MINUSCULAS_ASCII = string.ascii_lowercase
+ALFANUMERICOS_ASCII = string.ascii_letters + string.digits
+
+
+class Prefiltro(NamedTuple):
+    """Rejeição barata testada antes da regex.
+
+    Um valor só chega à regex se `minimo <= len(valor) <= maximo` e se o
+    caractere em `posicao` estiver em `aceitos` (quando definido). Os testes
+    são feitos em linha, sem chamada de função, para não encarecer os
+    valores válidos. `maximo` inclui um caractere a mais porque `$` aceita
+    um '\\n' final; a regex decide esses casos.
+    """
+    minimo: int
+    maximo: int = SEM_LIMITE
+    posicao: int = 0
+    aceitos: Optional[str] = None
+
+
+# Limites derivados de cada regex em _compile_patterns
+PREFILTROS = {
+    'nome': Prefiltro(5, aceitos=MAIUSCULAS_ASCII),
+    'email': Prefiltro(6, aceitos=MINUSCULAS_ASCII),
+    'senha': Prefiltro(8, 9, 0, ALFANUMERICOS_ASCII),
+    'cpf': Prefiltro(14, 15, 3, '.'),
+    'rg': Prefiltro(8, 9, 6, '-'),
+    'telefone': Prefiltro(15, 16, 0, '('),
+    'cep': Prefiltro(10, 11, 2, '.'),
+    'data_horario': Prefiltro(19, 20, 2, '/'),
+    'numero_flutuante': Prefiltro(1),
+}
+
+# Tamanhos máximos recomendados para dados não confiáveis, conferidos antes
+# de qualquer casamento: um valor enorme é rejeitado sem percorrer a regex.
+# Por padrão nenhum campo é limitado; ative com
+# ValidadorDados(limites_tamanho=LIMITES_TAMANHO) ou limitar_tamanho.
+LIMITES_TAMANHO = {
+    'nome': 200,
+    'email': 254,
+    'numero_flutuante': 100,
+}
+
+# Registros validados entre verificações do orçamento de tempo de validar_lote
+BLOCO_ORCAMENTO = 1024
+
+# Campos de layout fixo: 'd' é um dígito, qualquer outro caractere é literal
+MASCARAS = {
+    'cpf': 'ddd.ddd.ddd-dd',
+    'rg': 'dddddd-d',
+    'telefone': '(dd) ddddd-dddd',
+    'cep': 'dd.ddd-ddd',
+    'data_horario': 'dd/dd/dddd dd:dd:dd',
+}
+
+# Dígitos ASCII viram 0x80, byte que nunca aparece em texto ASCII codificado
+_TABELA_DIGITOS = bytes.maketrans(b'0123456789', b'\x80' * 10)
+
+
+def formas_mascara(mascara: str) -> Tuple[bytes, bytes]:
+    """As duas formas aceitas de um valor com a máscara, depois de codificado
+    em ASCII e traduzido por _TABELA_DIGITOS: sem e com o '\\n' final que `$`
+    aceita.
+
+    Os casadores estritos (CPF, data_horario, cep, telefone) comparam o valor
+    traduzido com estas formas e, ao contrário de `\\d`, só aceitam dígitos
+    ASCII; compilar_mascara manda os valores não ASCII para a regex.
+    """
+    esperado = bytes(0x80 if c == 'd' else ord(c) for c in mascara)
+    return esperado, esperado + b'\n'
+
+
+def compilar_mascara(mascara: str, reserva: re.Pattern) -> Callable[[str], bool]:
+    """Compila uma máscara como 'ddd.ddd.ddd-dd' em uma verificação posicional.
+
+    O valor é codificado em ASCII e traduzido byte a byte (dígitos viram um
+    marcador), então a comparação com a máscara é uma única operação em C.
+    Valores não ASCII (ex.: dígitos de outros alfabetos, aceitos por `\\d`)
+    vão para a regex `reserva`, e o '\\n' final aceito por `$` também é
+    respeitado, de modo que o resultado é idêntico ao da regex.
+    """
+    esperado, com_quebra = formas_mascara(mascara)
+    casar_reserva = reserva.match
+
+    def casar(valor: str) -> bool:
+        try:
+            traduzido = valor.encode('ascii').translate(_TABELA_DIGITOS)
+        except UnicodeEncodeError:
+            return casar_reserva(valor) is not None
+        return traduzido == esperado or traduzido == com_quebra
+
+    return casar
+
+
+# Dígitos verificadores do CPF (módulo 11). O primeiro usa os pesos 10..2
+# sobre os nove dígitos; o segundo, os pesos 11..3 mais 2 * o primeiro, ou
+# seja, a mesma soma ponderada mais a soma simples dos dígitos. Cada tabela
+# leva o código ASCII do dígito da sua posição em (soma ponderada << 7) +
+# dígito, então uma única soma de nove consultas dá as duas parcelas.
+_POSICOES_CPF = (0, 1, 2, 4, 5, 6, 8, 9, 10)
+_TABELAS_CPF = tuple(tuple(((codigo - 48) * (10 - ordem) << 7) + codigo - 48 if codigo >= 48 else 0
+                           for codigo in range(58))
+                     for ordem in range(9))
+# Resto da divisão por 11 -> código ASCII do dígito verificador
+_DV_CPF = tuple(48 if resto < 2 else 48 + 11 - resto for resto in range(11))
+# Sequências repetidas passam no módulo 11, mas não são CPFs emitidos
+_CPFS_REPETIDOS = frozenset((f"{d * 3}.{d * 3}.{d * 3}-{d * 2}").encode() for d in string.digits)
+
+MENSAGEM_CPF_ESTRITO = "CPF deve ter formato '123.456.789-09' e dígitos verificadores válidos"
+
+
+def digitos_verificadores_cpf(digitos: str) -> str:
+    """Os dois dígitos verificadores de um CPF a partir dos nove primeiros dígitos."""
+    soma = sum(int(d) * peso for d, peso in zip(digitos, range(10, 1, -1)))
+    primeiro = chr(_DV_CPF[soma % 11])
+    soma = sum(int(d) * peso for d, peso in zip(digitos + primeiro, range(11, 1, -1)))
+    return primeiro + chr(_DV_CPF[soma % 11])
+
+
+def _dv_cpf_valido(bruto: bytes) -> bool:
+    """Confere os dígitos verificadores de um CPF ASCII que já casou com a máscara."""
+    t = _TABELAS_CPF
+    soma = (t[0][bruto[0]] + t[1][bruto[1]] + t[2][bruto[2]] + t[3][bruto[4]] + t[4][bruto[5]]
+            + t[5][bruto[6]] + t[6][bruto[8]] + t[7][bruto[9]] + t[8][bruto[10]])
+    ponderada = soma >> 7
+    primeiro = _DV_CPF[ponderada % 11]
+    return (bruto[12] == primeiro
+            and bruto[13] == _DV_CPF[(ponderada + (soma & 127) + 2 * (primeiro - 48)) % 11]
+            and bruto[:14] not in _CPFS_REPETIDOS)
+
+
+_CPF_ESPERADO, _CPF_COM_QUEBRA = formas_mascara(MASCARAS['cpf'])
+
+
+def casar_cpf_estrito(valor: str) -> bool:
+    """Máscara do CPF e dígitos verificadores numa só passada (casador do modo estrito)."""
+    try:
+        bruto = valor.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+    traduzido = bruto.translate(_TABELA_DIGITOS)
+    return (traduzido == _CPF_ESPERADO or traduzido == _CPF_COM_QUEBRA) and _dv_cpf_valido(bruto)
+
+
+# Calendário do modo estrito de data_horario (compartilhado com o backend
+# NumPy). TIPO_ANO[ano] é 0 para o ano 0 (fora do calendário de datetime),
+# 1 para anos comuns e 2 para bissextos; ULTIMO_DIA[tipo][mes] é o último
+# dia do mês (0 para meses inexistentes).
+TIPO_ANO = bytes([0]) + bytes(2 if ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0) else 1
+                               for ano in range(1, 10000))
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+ULTIMO_DIA = (bytes(100),
+               bytes((0,) + _DIAS_MES + (0,) * 87),
+               bytes((0, 31, 29) + _DIAS_MES[2:] + (0,) * 87))
+
+_DATA_ESPERADA, _DATA_COM_QUEBRA = formas_mascara(MASCARAS['data_horario'])
+
+MENSAGEM_DATA_ESTRITA = "Data/horário deve ser uma data e hora existentes no formato 'dd/mm/aaaa hh:mm:ss'"
+
+Limite = Union[str, datetime.date, datetime.datetime, None]
+
+
+def _texto_limite(limite: Limite) -> str:
+    if isinstance(limite, datetime.datetime):
+        return limite.strftime('%d/%m/%Y %H:%M:%S')
+    if isinstance(limite, datetime.date):
+        return limite.strftime('%d/%m/%Y')
+    return str(limite)
+
+
+def _chave_data(limite: Limite, fim_do_dia: bool) -> Optional[int]:
+    """Limite de data como o inteiro aaaammddhhmmss comparado pelo modo estrito.
+
+    Aceita date, datetime ou texto 'dd/mm/aaaa[ hh:mm:ss]'; uma data sem
+    horário vale desde 00:00:00 (mínimo) ou até 23:59:59 (máximo).
+    """
+    if limite is None:
+        return None
+    if isinstance(limite, str):
+        formato = '%d/%m/%Y %H:%M:%S' if ' ' in limite.strip() else '%d/%m/%Y'
+        try:
+            convertido = datetime.datetime.strptime(limite.strip(), formato)
+        except ValueError:
+            raise ValueError(f"Limite de data inválido: '{limite}' (use 'dd/mm/aaaa' ou 'dd/mm/aaaa hh:mm:ss')") from None
+        limite = convertido if ' ' in limite.strip() else convertido.date()
+    if isinstance(limite, datetime.datetime):
+        return int(limite.strftime('%Y%m%d%H%M%S'))
+    if isinstance(limite, datetime.date):
+        return (limite.year * 10000 + limite.month * 100 + limite.day) * 1000000 + (235959 if fim_do_dia else 0)
+    raise TypeError(f"Limite de data deve ser date, datetime ou texto, recebido {type(limite).__name__}")
+
+
+class VerificadorDataHorario:
+    """Casador do modo estrito de data_horario.
+
+    Confere a máscara, a existência da data (meses de 28 a 31 dias e anos
+    bissextos, pelas tabelas acima) e o horário (até 23:59:59) com
+    aritmética direta sobre os bytes, sem criar objetos datetime. Com
+    `minimo`/`maximo`, a data também precisa estar no intervalo (inclusivo).
+    """
+
+    __slots__ = ('minimo', 'maximo')
+
+    def __init__(self, minimo: Limite = None, maximo: Limite = None):
+        self.minimo = _chave_data(minimo, fim_do_dia=False)
+        self.maximo = _chave_data(maximo, fim_do_dia=True)
+        if self.minimo is not None and self.maximo is not None and self.minimo > self.maximo:
+            raise ValueError("O limite mínimo de data é posterior ao máximo")
+
+    def __call__(self, valor: str) -> bool:
+        try:
+            bruto = valor.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        traduzido = bruto.translate(_TABELA_DIGITOS)
+        if traduzido != _DATA_ESPERADA and traduzido != _DATA_COM_QUEBRA:
+            return False
+        # Dígitos ASCII: '0' é 48, então d1 * 10 + d2 = b1 * 10 + b2 - 528
+        dia = bruto[0] * 10 + bruto[1] - 528
+        mes = bruto[3] * 10 + bruto[4] - 528
+        ano = bruto[6] * 1000 + bruto[7] * 100 + bruto[8] * 10 + bruto[9] - 53328
+        hora = bruto[11] * 10 + bruto[12] - 528
+        minuto = bruto[14] * 10 + bruto[15] - 528
+        segundo = bruto[17] * 10 + bruto[18] - 528
+        if not (0 < dia <= ULTIMO_DIA[TIPO_ANO[ano]][mes] and hora < 24 and minuto < 60 and segundo < 60):
+            return False
+        if self.minimo is None and self.maximo is None:
+            return True
+        chave = ((((ano * 100 + mes) * 100 + dia) * 100 + hora) * 100 + minuto) * 100 + segundo
+        return ((self.minimo is None or chave >= self.minimo)
+                and (self.maximo is None or chave <= self.maximo))
+
+
+_CEP_ESPERADO, _CEP_COM_QUEBRA = formas_mascara(MASCARAS['cep'])
+
+MENSAGEM_CEP_INEXISTENTE = "CEP deve ter formato '66.645-225' e constar da tabela de CEPs"
+
+
+class VerificadorCEP:
+    """Casador de cep com a etapa de existência: máscara e busca no IndiceCEP."""
+
+    __slots__ = ('indice',)
+
+    def __init__(self, indice: Union[str, IndiceCEP]):
+        self.indice = IndiceCEP(indice) if isinstance(indice, str) else indice
+
+    def __call__(self, valor: str) -> bool:
+        try:
+            bruto = valor.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        traduzido = bruto.translate(_TABELA_DIGITOS)
+        if traduzido != _CEP_ESPERADO and traduzido != _CEP_COM_QUEBRA:
+            return False
+        return self.indice.contem(int(bruto.translate(None, b'.-')))
+
+
+_TELEFONE_ESPERADO, _TELEFONE_COM_QUEBRA = formas_mascara(MASCARAS['telefone'])
+
+MENSAGEM_TELEFONE_ESTRITO = "Telefone deve ter formato '(91) 99999-9999', com DDD existente e prefixo válido"
+
+
+class VerificadorTelefone:
+    """Casador de telefone com o plano de numeração: máscara, DDD e prefixo.
+
+    As regras do plano viram o conjunto dos inícios aceitos ('(91) 9', ...),
+    então DDD e prefixo custam uma consulta a um frozenset antes da máscara.
+    """
+
+    __slots__ = ('plano', '_inicios')
+
+    def __init__(self, plano: PlanoTelefonia):
+        self.plano = plano
+        self._inicios = frozenset(f"({ddd:02d}) {digito}" for ddd, bits in enumerate(plano.prefixos)
+                                  for digito in range(10) if bits >> digito & 1)
+
+    def __call__(self, valor: str) -> bool:
+        if valor[:6] not in self._inicios:
+            return False
+        try:
+            traduzido = valor.encode('ascii').translate(_TABELA_DIGITOS)
+        except UnicodeEncodeError:
+            return False
+        return traduzido == _TELEFONE_ESPERADO or traduzido == _TELEFONE_COM_QUEBRA
+
+
+MENSAGEM_EMAIL_PERMITIDO = "Email deve ter formato 'usuario@dominio.br' e domínio permitido"
+MENSAGEM_EMAIL_BLOQUEADO = "Email deve ter formato 'usuario@dominio.br' e domínio não bloqueado"
+EMAIL_NAO_PERMITIDO = ResultadoValidacao(False, MENSAGEM_EMAIL_PERMITIDO)
+EMAIL_BLOQUEADO = ResultadoValidacao(False, MENSAGEM_EMAIL_BLOQUEADO)
+
+
+class VerificadorEmail:
+    """Casador de email com listas de domínios: regex e depois as listas.
+
+    O domínio é o texto depois do último '@'; um domínio bloqueado (ou
+    subdomínio de um bloqueado) é rejeitado mesmo que esteja entre os
+    permitidos e, com `permitidos`, só passam os domínios da lista.
+    explicar() diz qual lista rejeitou o valor.
+    """
+
+    __slots__ = ('padrao', 'permitidos', 'bloqueados', '_casar')
+
+    def __init__(self, padrao: re.Pattern, permitidos: Optional[ListaDominios] = None,
+                 bloqueados: Optional[ListaDominios] = None):
+        self.padrao = padrao
+        self.permitidos = permitidos
+        self.bloqueados = bloqueados
+        self._casar = padrao.match
+
+    def __getstate__(self):
+        return self.padrao, self.permitidos, self.bloqueados
+
+    def __setstate__(self, estado):
+        self.__init__(*estado)
+
+    def __call__(self, valor: str) -> bool:
+        if self._casar(valor) is None:
+            return False
+        dominio = valor.rpartition('@')[2].rstrip('\n').lower()
+        bloqueados = self.bloqueados
+        if bloqueados is not None and bloqueados.contem(dominio):
+            return False
+        permitidos = self.permitidos
+        return permitidos is None or permitidos.contem(dominio)
+
+    def explicar(self, valor: str) -> Optional[ResultadoValidacao]:
+        """Resultado de um valor rejeitado pelas listas; None se a falha é de formato."""
+        if self._casar(valor) is None:
+            return None
+        dominio = valor.rpartition('@')[2].rstrip('\n').lower()
+        if self.bloqueados is not None and self.bloqueados.contem(dominio):
+            return EMAIL_BLOQUEADO
+        if self.permitidos is not None and not self.permitidos.contem(dominio):
+            return EMAIL_NAO_PERMITIDO
+        return None
+
+
+class ResultadoLote:
+    """Resultado compacto de uma validação em lote.
+
+    `validos[campo]` guarda um byte por registro (1 = válido, 0 = inválido)
+    e `falhas[campo]` guarda apenas os índices dos registros inválidos.
+    Se o orçamento de tempo acabou, só os primeiros `avaliados` registros
+    foram validados; os demais (`nao_avaliados`) não são válidos nem
+    inválidos e ficam fora de `validos` e `falhas`.
+    """
+
+    def __init__(self, total: int, validos: Dict[str, bytearray], falhas: Dict[str, List[int]],
+                 avaliados: Optional[int] = None):
+        self.total = total
+        self.validos = validos
+        self.falhas = falhas
+        self.avaliados = total if avaliados is None else avaliados
+
+    @property
+    def nao_avaliados(self) -> int:
+        return self.total - self.avaliados
+
+    def contagem_falhas(self) -> Dict[str, int]:
+        return {campo: len(indices) for campo, indices in self.falhas.items()}
+
+    def indices_invalidos(self) -> List[int]:
+        """Índices dos registros com pelo menos um campo inválido, em ordem."""
+        indices = set()
+        for falhas in self.falhas.values():
+            indices.update(falhas)
+        return sorted(indices)
+
+    def todos_validos(self) -> bool:
+        return self.avaliados == self.total and not any(self.falhas.values())
+
+    def estender(self, outro: 'ResultadoLote') -> None:
+        """Anexa os resultados de `outro` (registros seguintes) a este lote.
+
+        Depois do primeiro registro não avaliado, os registros seguintes
+        também contam como não avaliados.
+        """
+        if self.avaliados < self.total:
+            self.total += outro.total
+            return
+        if self.total == 0 and not self.validos:
+            self.validos = {campo: bytearray() for campo in outro.validos}
+            self.falhas = {campo: [] for campo in outro.validos}
+        elif self.validos.keys() != outro.validos.keys():
+            raise ValueError("Os lotes devem conter os mesmos campos para serem combinados")
+
+        for campo, validos in outro.validos.items():
+            self.validos[campo] += validos
+            self.falhas[campo].extend(indice + self.total for indice in outro.falhas[campo])
+        self.avaliados = self.total + outro.avaliados
+        self.total += outro.total
+
+
+class CacheResultados:
+    """Cache LRU limitado de resultados, indexado por (campo, valor).
+
+    Usa functools.lru_cache, que é seguro entre threads. Como uma entrada só
+    sai do cache por despejo, despejos = faltas - tamanho. No modo paralelo
+    cada processo tem o seu próprio cache.
+    """
+
+    def __init__(self, funcao: Callable[[str, str], 'ResultadoValidacao'], capacidade: int):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva")
+        self.capacidade = capacidade
+        self.consultar = lru_cache(maxsize=capacidade)(funcao)
+
+    def estatisticas(self) -> Dict[str, int]:
+        info = self.consultar.cache_info()
+        return {
+            'acertos': info.hits,
+            'faltas': info.misses,
+            'despejos': info.misses - info.currsize,
+            'tamanho': info.currsize,
+            'capacidade': self.capacidade,
+        }
+
+    def limpar(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        self.consultar.cache_clear()
+
+
+# Custo relativo de validar cada campo, medido com benchmark_validadores.py;
+# usado para ordenar verificações do mais barato ao mais caro
+CUSTOS = {
+    'cep': 1.0,
+    'rg': 1.0,
+    'cpf': 1.0,
+    'telefone': 1.0,
+    'data_horario': 1.0,
+    'nome': 1.5,
+    'email': 1.5,
+    'numero_flutuante': 2.0,
+    'senha': 2.0,
+}
+
+
+class CampoValidacao(NamedTuple):
+    """Definição declarativa de um campo: verificação, prefiltro, custo e resposta de erro."""
+    nome: str
+    padrao: re.Pattern
+    casador: Callable[[str], object]
+    prefiltro: Prefiltro
+    custo: float
+    invalido: ResultadoValidacao
+
+    @property
+    def mensagem(self) -> str:
+        return self.invalido.mensagem
+
+
+def definir_campo(nome: str, padrao: Union[str, re.Pattern], mensagem: str,
+                  casador: Optional[Callable[[str], object]] = None,
+                  prefiltro: Optional[Prefiltro] = None,
+                  custo: float = 1.0) -> CampoValidacao:
+    """Cria um CampoValidacao. Sem `casador`, usa `padrao.match`."""
+    if isinstance(padrao, str):
+        padrao = re.compile(padrao)
+    invalido = FORMATO_INVALIDO.get(nome)
+    if invalido is None or invalido.mensagem != mensagem:
+        invalido = ResultadoValidacao(False, mensagem)
+    return CampoValidacao(nome, padrao, casador or padrao.match,
+                          prefiltro or Prefiltro(1), custo, invalido)
+
+
+class RegistroCampos:
+    """Campos conhecidos por um ValidadorDados, na ordem de validação.
+
+    `tabela` é o dicionário {nome: CampoValidacao} consultado diretamente
+    pelos validadores e pelos modos em lote e paralelo.
+    """
+
+    def __init__(self, campos: Iterable[CampoValidacao] = ()):
+        self.tabela: Dict[str, CampoValidacao] = {}
+        for campo in campos:
+            self.registrar(campo)
+
+    def registrar(self, campo: CampoValidacao, substituir: bool = False) -> None:
+        if campo.nome in self.tabela and not substituir:
+            raise ValueError(f"Campo '{campo.nome}' já registrado (use substituir=True)")
+        self.tabela[campo.nome] = campo
+
+    def remover(self, nome: str) -> None:
+        del self.tabela[nome]
+
+    def nomes(self) -> Tuple[str, ...]:
+        return tuple(self.tabela)
+
+    def __getitem__(self, nome: str) -> CampoValidacao:
+        return self.tabela[nome]
+
+    def __contains__(self, nome) -> bool:
+        return nome in self.tabela
+
+    def __iter__(self) -> Iterator[CampoValidacao]:
+        return iter(self.tabela.values())
+
+    def __len__(self) -> int:
+        return len(self.tabela)
+
+
+def compilar_verificador(campo: CampoValidacao) -> Callable[[str], ResultadoValidacao]:
+    """Função de um argumento equivalente a validar o campo, com o prefiltro
+    e o casador já resolvidos como constantes da closure."""
+    minimo, maximo, posicao, aceitos = campo.prefiltro
+    casador = campo.casador
+    invalido = campo.invalido
+    # Casadores com mais de um motivo de rejeição (ex.: VerificadorEmail) explicam a falha
+    explicar = getattr(casador, 'explicar', None)
+
+    if explicar is not None:
+        def verificar(valor):
+            if not valor or valor[0] == ' ' or valor[-1] == ' ':
+                return VAZIO
+            if minimo <= len(valor) <= maximo and (aceitos is None or valor[posicao] in aceitos):
+                return VALIDO if casador(valor) else explicar(valor) or invalido
+            return invalido
+    elif aceitos is None:
+        def verificar(valor):
+            if not valor or valor[0] == ' ' or valor[-1] == ' ':
+                return VAZIO
+            if minimo <= len(valor) <= maximo and casador(valor):
+                return VALIDO
+            return invalido
+    else:
+        def verificar(valor):
+            if not valor or valor[0] == ' ' or valor[-1] == ' ':
+                return VAZIO
+            if minimo <= len(valor) <= maximo and valor[posicao] in aceitos and casador(valor):
+                return VALIDO
+            return invalido
+    return verificar
+
+
+def _pegador(campos: Tuple[str, ...]) -> Callable[[Dict[str, str]], Tuple[str, ...]]:
+    """itemgetter que sempre devolve uma tupla, mesmo com um único campo."""
+    if len(campos) == 1:
+        campo, = campos
+        return lambda dados: (dados[campo],)
+    return itemgetter(*campos)
+
+
+class PlanoRegistro:
+    """Validador de registros pré-compilado para um conjunto fixo de campos.
+
+    Para registros com todos os campos, chamar o plano equivale a
+    validar_todos_campos; valido() só responde se o registro inteiro é
+    válido, conferindo os campos do mais barato ao mais caro e parando na
+    primeira falha. Os campos do plano são obrigatórios: ausentes contam
+    como vazios e reprovam o registro, enquanto validar_todos_campos e
+    registro_valido ignoram campos ausentes. As definições são as do
+    momento da compilação.
+    """
+
+    __slots__ = ('campos', '_verificadores', '_pegar', '_verificadores_custo', '_pegar_custo')
+
+    def __init__(self, campos: Tuple[str, ...], verificadores: Dict[str, Callable[[str], ResultadoValidacao]],
+                 custos: Dict[str, float]):
+        self.campos = campos
+        self._verificadores = tuple(verificadores[campo] for campo in campos)
+        self._pegar = _pegador(campos)
+        # Do mais barato ao mais caro; sorted é estável, então empates mantêm a ordem dos campos
+        por_custo = tuple(sorted(campos, key=custos.__getitem__))
+        self._verificadores_custo = tuple(verificadores[campo] for campo in por_custo)
+        self._pegar_custo = _pegador(por_custo)
+
+    def __call__(self, dados: Dict[str, str]) -> ResultadoRegistro:
+        try:
+            valores = self._pegar(dados)
+        except KeyError:
+            valores = tuple(dados.get(campo) for campo in self.campos)
+        return ResultadoRegistro(self.campos, tuple([verificar(valor) for verificar, valor
+                                                     in zip(self._verificadores, valores)]))
+
+    def valido(self, dados: Dict[str, str]) -> bool:
+        try:
+            valores = self._pegar_custo(dados)
+        except KeyError:
+            return False  # campo ausente = vazio
+        for verificar, valor in zip(self._verificadores_custo, valores):
+            if verificar(valor) is not VALIDO:
+                return False
+        return True
+
+    def filtrar_validos(self, registros: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+        """Os registros válidos, na ordem da entrada."""
+        valido = self.valido
+        return (dados for dados in registros if valido(dados))
+
+
+class VerificacaoRapida:
+    """Modo fail-fast: confere os campos de um registro e para na primeira falha.
+
+    A ordem minimiza o custo esperado: campos com menor custo / taxa de
+    rejeição vêm primeiro. O custo vem do registro de campos; a taxa de
+    rejeição é estimada em tempo de execução e, com `adaptativo`, a ordem é
+    recalculada a cada `intervalo` registros.
+    """
+
+    def __init__(self, verificadores: Dict[str, Callable[[str], ResultadoValidacao]],
+                 custos: Dict[str, float], adaptativo: bool = True, intervalo: int = 1024):
+        self.verificadores = verificadores
+        self.custos = custos
+        self.adaptativo = adaptativo
+        self.intervalo = intervalo
+        self.avaliacoes = dict.fromkeys(verificadores, 0)
+        self.rejeicoes = dict.fromkeys(verificadores, 0)
+        self.registros = 0
+        self._ordenar()
+
+    def taxa_rejeicao(self, campo: str) -> float:
+        # Estimativa com suavização de Laplace: sem dados, 50%
+        return (self.rejeicoes[campo] + 1) / (self.avaliacoes[campo] + 2)
+
+    def _ordenar(self) -> None:
+        self.ordem = tuple(sorted(self.verificadores,
+                                  key=lambda campo: self.custos[campo] / self.taxa_rejeicao(campo)))
+        self._etapas = tuple((campo, self.verificadores[campo]) for campo in self.ordem)
+        # Contadores por posição na ordem atual; somados por campo em _consolidar
+        self._parados = [0] * len(self.ordem)
+        self._ausentes = [0] * len(self.ordem)
+        self._inicio_ordem = self.registros
+        self._proxima_revisao = self.registros + self.intervalo
+
+    def _consolidar(self) -> None:
+        alcancados = self.registros - self._inicio_ordem
+        for posicao, campo in enumerate(self.ordem):
+            self.avaliacoes[campo] += alcancados - self._ausentes[posicao]
+            self.rejeicoes[campo] += self._parados[posicao]
+            alcancados -= self._parados[posicao]
+
+    def primeira_falha(self, dados: Dict[str, str]) -> Optional[Tuple[str, ResultadoValidacao]]:
+        """(campo, resultado) da primeira falha, ou None se o registro é válido."""
+        self.registros += 1
+        falha = None
+        for posicao, (campo, verificar) in enumerate(self._etapas):
+            if campo in dados:
+                resultado = verificar(dados[campo])
+                if resultado is not VALIDO:
+                    self._parados[posicao] += 1
+                    falha = campo, resultado
+                    break
+            else:
+                self._ausentes[posicao] += 1
+        if self.registros >= self._proxima_revisao:
+            self._consolidar()
+            if self.adaptativo:
+                self._ordenar()
+            else:
+                self._inicio_ordem = self.registros
+                self._proxima_revisao = self.registros + self.intervalo
+                self._parados = [0] * len(self.ordem)
+                self._ausentes = [0] * len(self.ordem)
+        return falha
+
+    def estatisticas(self) -> Dict[str, object]:
+        self._consolidar()
+        self._inicio_ordem = self.registros
+        self._parados = [0] * len(self.ordem)
+        self._ausentes = [0] * len(self.ordem)
+        return {
+            'registros': self.registros,
+            'ordem': list(self.ordem),
+            'campos': {campo: {'custo': self.custos[campo],
+                               'avaliacoes': self.avaliacoes[campo],
+                               'rejeicoes': self.rejeicoes[campo],
+                               'taxa_rejeicao': round(self.taxa_rejeicao(campo), 4)}
+                       for campo in self.ordem},
+        }
+
 
 class ValidadorDados:
-    def __init__(self):
+    def __init__(self, usar_mascaras: bool = True, tamanho_cache: int = 0,
+                 ordem_adaptativa: bool = True,
+                 limites_tamanho: Optional[Dict[str, Optional[int]]] = None,
+                 cpf_estrito: bool = False, data_estrita: bool = False,
+                 indice_cep: Optional[str] = None, telefone_estrito: bool = False,
+                 dominios_permitidos: Optional[FonteDominios] = None,
+                 dominios_bloqueados: Optional[FonteDominios] = None):
         self.patterns = self._compile_patterns()
+        # Tamanho máximo por campo (None = sem limite), aplicado no prefiltro
+        self._limites: Dict[str, int] = {}
+        for campo, limite in (limites_tamanho or {}).items():
+            self._definir_limite(campo, limite)
+        self.campos = RegistroCampos(self._campos_padrao(usar_mascaras))
+        # Tabela de despacho: {campo: CampoValidacao}, compartilhada com o registro
+        self._tabela = self.campos.tabela
+        # Campos registrados em tempo de execução, repassados aos workers paralelos
+        self._personalizados: Dict[str, dict] = {}
+        self._automato = None
+        self._formas = {}
+        # Modo fail-fast (primeira_falha), criado no primeiro uso
+        self._rapida = None
+        self._ordem_adaptativa = ordem_adaptativa
+        # Métricas opcionais (ativar_metricas); None = nenhuma medição
+        self.metricas: Optional[MetricasValidacao] = None
+        # Ganchos de diagnóstico (adicionar_gancho)
+        self._ganchos: List[Gancho] = []
+        # Com tamanho_cache > 0, valores repetidos são respondidos pelo cache LRU
+        self.cache = CacheResultados(self._validar_valor, tamanho_cache) if tamanho_cache else None
+        if cpf_estrito:
+            self.ativar_cpf_estrito()
+        if data_estrita:
+            self.ativar_data_estrita()
+        if indice_cep is not None:
+            self.usar_indice_cep(indice_cep)
+        if telefone_estrito:
+            self.usar_plano_telefonia()
+        if dominios_permitidos is not None or dominios_bloqueados is not None:
+            self.usar_dominios_email(dominios_permitidos, dominios_bloqueados)
     
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
         return {
@@ -18,101 +814,539 @@ class ValidadorDados:
             'numero_flutuante': re.compile(r'^[+-]?(\d+([.,]\d+)?|\d*[.,]\d+)$')
         }
     
-    def validar_nome(self, nome: str) -> Tuple[bool, str]:
-        if not nome or nome.startswith(' ') or nome.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['nome'].match(nome):
-            return True, "Válido"
-        return False, "Nome deve ter formato 'Nome Sobrenome' com primeira letra maiúscula"
+    def _campos_padrao(self, usar_mascaras: bool) -> Iterator[CampoValidacao]:
+        for nome, padrao in self.patterns.items():
+            # Campos de layout fixo usam a máscara posicional; os demais, a regex
+            if usar_mascaras and nome in MASCARAS:
+                casador = compilar_mascara(MASCARAS[nome], padrao)
+            else:
+                casador = padrao.match
+            yield self._com_limite(CampoValidacao(nome, padrao, casador, PREFILTROS[nome],
+                                                  CUSTOS[nome], FORMATO_INVALIDO[nome]))
     
-    def validar_email(self, email: str) -> Tuple[bool, str]:
-        if not email or email.startswith(' ') or email.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['email'].match(email):
-            return True, "Válido"
-        return False, "Email deve ter formato 'usuario@dominio.br' (apenas letras minúsculas)"
+    def registrar_campo(self, nome: str, padrao: Union[str, re.Pattern], mensagem: str,
+                        casador: Optional[Callable[[str], object]] = None,
+                        prefiltro: Optional[Prefiltro] = None,
+                        custo: float = 1.0, substituir: bool = False) -> CampoValidacao:
+        """Registra (ou substitui) um campo em tempo de execução, sem subclasse.
+
+        O campo passa a valer em validar(), validar_todos_campos, validar_lote
+        e nos modos paralelos. Para o modo paralelo, `casador` precisa ser
+        uma função de módulo (serializável com pickle).
+        """
+        campo = self._com_limite(definir_campo(nome, padrao, mensagem, casador, prefiltro, custo))
+        self.campos.registrar(campo, substituir)
+        self.patterns[nome] = campo.padrao
+        self._personalizados[nome] = {
+            'nome': nome, 'padrao': campo.padrao, 'mensagem': mensagem,
+            'casador': casador, 'prefiltro': prefiltro, 'custo': custo, 'substituir': True,
+        }
+        self._campos_alterados()
+        return campo
     
-    def validar_senha(self, senha: str) -> Tuple[bool, str]:
-        if not senha or senha.startswith(' ') or senha.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['senha'].match(senha):
-            return True, "Válido"
-        return False, "Senha deve ter 8 caracteres com pelo menos 1 maiúscula e 1 número"
+    def ativar_cpf_estrito(self) -> CampoValidacao:
+        """Passa a exigir dígitos verificadores válidos no CPF (módulo 11).
+
+        O casador confere a máscara e os dígitos numa só passada, e vale em
+        todos os modos (lote, plano, paralelo, NumPy). Registrado como campo
+        personalizado, o modo estrito é repassado aos workers paralelos.
+        """
+        return self.registrar_campo('cpf', self.patterns['cpf'], MENSAGEM_CPF_ESTRITO,
+                                    casador=casar_cpf_estrito, prefiltro=PREFILTROS['cpf'],
+                                    custo=CUSTOS['cpf'], substituir=True)
+
+    @property
+    def cpf_estrito(self) -> bool:
+        return 'cpf' in self._tabela and self._tabela['cpf'].casador is casar_cpf_estrito
+
+    def ativar_data_estrita(self, minimo: Limite = None, maximo: Limite = None) -> CampoValidacao:
+        """Passa a exigir datas e horários existentes em data_horario.
+
+        `31/02/2025 25:61:99` deixa de ser válido. `minimo` e `maximo`
+        (date, datetime ou 'dd/mm/aaaa[ hh:mm:ss]') limitam o intervalo
+        aceito. Vale em todos os modos, como ativar_cpf_estrito.
+        """
+        verificador = VerificadorDataHorario(minimo, maximo)
+        mensagem = MENSAGEM_DATA_ESTRITA
+        if minimo is not None and maximo is not None:
+            mensagem += f", entre {_texto_limite(minimo)} e {_texto_limite(maximo)}"
+        elif minimo is not None:
+            mensagem += f", a partir de {_texto_limite(minimo)}"
+        elif maximo is not None:
+            mensagem += f", até {_texto_limite(maximo)}"
+        return self.registrar_campo('data_horario', self.patterns['data_horario'], mensagem,
+                                    casador=verificador, prefiltro=PREFILTROS['data_horario'],
+                                    custo=CUSTOS['data_horario'], substituir=True)
+
+    def usar_indice_cep(self, indice: Union[str, IndiceCEP]) -> CampoValidacao:
+        """Acrescenta a validar_cep a etapa de existência: o CEP precisa estar
+        numa das faixas do índice (arquivo gerado por indice_cep.py).
+
+        O índice é mapeado em memória, não carregado; os workers paralelos
+        mapeiam o mesmo arquivo.
+        """
+        return self.registrar_campo('cep', self.patterns['cep'], MENSAGEM_CEP_INEXISTENTE,
+                                    casador=VerificadorCEP(indice), prefiltro=PREFILTROS['cep'],
+                                    custo=CUSTOS['cep'], substituir=True)
+
+    def usar_plano_telefonia(self, plano: Union[str, PlanoTelefonia, None] = None) -> CampoValidacao:
+        """Passa a exigir, em validar_telefone, DDD existente e prefixo aceito
+        pelo plano de numeração (CSV de plano_telefonia.py; padrão:
+        ddd_brasil.csv, celulares começando com 9).
+
+        A regra é conferida na mesma passada da máscara, em todos os modos,
+        como ativar_cpf_estrito.
+        """
+        if not isinstance(plano, PlanoTelefonia):
+            plano = ler_plano(plano)
+        return self.registrar_campo('telefone', self.patterns['telefone'], MENSAGEM_TELEFONE_ESTRITO,
+                                    casador=VerificadorTelefone(plano), prefiltro=PREFILTROS['telefone'],
+                                    custo=CUSTOS['telefone'], substituir=True)
+
+    def usar_dominios_email(self, permitidos: Optional[FonteDominios] = None,
+                            bloqueados: Optional[FonteDominios] = None) -> CampoValidacao:
+        """Acrescenta a validar_email as listas de domínios (veja dominios_email.py).
+
+        `permitidos` e `bloqueados` são listas em texto (um caminho ou
+        vários), índices gerados por dominios_email.py ou listas já abertas.
+        Os domínios são conferidos na mesma passada da regex, em todos os
+        modos; os índices mapeados em memória são compartilhados com os
+        workers paralelos.
+        """
+        verificador = VerificadorEmail(self.patterns['email'],
+                                       None if permitidos is None else abrir_dominios(permitidos),
+                                       None if bloqueados is None else abrir_dominios(bloqueados))
+        mensagem = MENSAGEM_EMAIL_PERMITIDO if permitidos is not None else MENSAGEM_EMAIL_BLOQUEADO
+        return self.registrar_campo('email', self.patterns['email'], mensagem,
+                                    casador=verificador, prefiltro=PREFILTROS['email'],
+                                    custo=CUSTOS['email'], substituir=True)
+
+    def definicoes_personalizadas(self) -> List[dict]:
+        """Argumentos de registrar_campo de cada campo registrado em tempo de execução."""
+        return list(self._personalizados.values())
     
-    def validar_cpf(self, cpf: str) -> Tuple[bool, str]:
-        if not cpf or cpf.startswith(' ') or cpf.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['cpf'].match(cpf):
-            return True, "Válido"
-        return False, "CPF deve ter formato '123.456.789-09'"
+    def limitar_tamanho(self, campo: str, maximo: Optional[int]) -> None:
+        """Define o tamanho máximo de `campo` (None remove o limite).
+
+        Valores mais longos são inválidos, sem chegar à regex. O limite nunca
+        afrouxa o prefiltro do campo (ex.: o tamanho fixo do CPF).
+        """
+        if campo not in self._tabela:
+            raise KeyError(f"Campo desconhecido: '{campo}'")
+        self._definir_limite(campo, maximo)
+        if campo in self._personalizados:
+            prefiltro = self._personalizados[campo]['prefiltro'] or Prefiltro(1)
+        else:
+            prefiltro = PREFILTROS[campo]
+        self.campos.registrar(self._com_limite(self._tabela[campo]._replace(prefiltro=prefiltro)), substituir=True)
+        self._campos_alterados()
+
+    def limites_tamanho(self) -> Dict[str, int]:
+        """Tamanho máximo configurado de cada campo limitado (repassado aos workers paralelos)."""
+        return dict(self._limites)
+
+    def _definir_limite(self, campo: str, maximo: Optional[int]) -> None:
+        if maximo is None:
+            self._limites.pop(campo, None)
+        elif maximo < 1:
+            raise ValueError("O tamanho máximo deve ser positivo")
+        else:
+            self._limites[campo] = maximo
+
+    def _com_limite(self, campo: CampoValidacao) -> CampoValidacao:
+        limite = self._limites.get(campo.nome)
+        if limite is None or campo.prefiltro.maximo <= limite:
+            return campo
+        return campo._replace(prefiltro=campo.prefiltro._replace(maximo=limite))
+
+    def _campos_alterados(self) -> None:
+        self._automato = None
+        self._rapida = None
+        self._formas.clear()
+        if self.cache is not None:
+            self.cache.limpar()
     
-    def validar_rg(self, rg: str) -> Tuple[bool, str]:
-        if not rg or rg.startswith(' ') or rg.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['rg'].match(rg):
-            return True, "Válido"
-        return False, "RG deve ter formato '123456-7'"
+    def validar(self, campo: str, valor: str) -> ResultadoValidacao:
+        """Valida `valor` como `campo` (qualquer campo do registro, inclusive personalizados)."""
+        if campo not in self._tabela:
+            raise KeyError(f"Campo desconhecido: '{campo}'")
+        return self._validar(campo, valor)
     
-    def validar_telefone(self, telefone: str) -> Tuple[bool, str]:
-        if not telefone or telefone.startswith(' ') or telefone.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['telefone'].match(telefone):
-            return True, "Válido"
-        return False, "Telefone deve ter formato '(91) 99999-9999'"
+    def _validar(self, campo: str, valor: str) -> ResultadoValidacao:
+        if self.cache is not None:
+            return self.cache.consultar(campo, valor)
+        return self._validar_valor(campo, valor)
     
-    def validar_cep(self, cep: str) -> Tuple[bool, str]:
-        if not cep or cep.startswith(' ') or cep.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
+    def _validar_valor(self, campo: str, valor: str) -> ResultadoValidacao:
+        if not valor or valor[0] == ' ' or valor[-1] == ' ':
+            return VAZIO
         
-        if self.patterns['cep'].match(cep):
-            return True, "Válido"
-        return False, "CEP deve ter formato '66.645-225'"
+        definicao = self._tabela[campo]
+        minimo, maximo, posicao, aceitos = definicao.prefiltro
+        if minimo <= len(valor) <= maximo and (aceitos is None or valor[posicao] in aceitos):
+            if definicao.casador(valor):
+                return VALIDO
+            # Casadores com mais de um motivo de rejeição (ex.: VerificadorEmail) explicam a falha
+            explicar = getattr(definicao.casador, 'explicar', None)
+            if explicar is not None:
+                return explicar(valor) or definicao.invalido
+        return definicao.invalido
     
-    def validar_data_horario(self, data_horario: str) -> Tuple[bool, str]:
-        if not data_horario or data_horario.startswith(' ') or data_horario.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['data_horario'].match(data_horario):
-            return True, "Válido"
-        return False, "Data/horário deve ter formato 'dd/mm/aaaa hh:mm:ss'"
+    def validar_nome(self, nome: str) -> ResultadoValidacao:
+        return self._validar('nome', nome)
     
-    def validar_numero_flutuante(self, numero: str) -> Tuple[bool, str]:
-        if not numero or numero.startswith(' ') or numero.endswith(' '):
-            return False, "Campo não pode estar vazio ou ter espaços no início/fim"
-        
-        if self.patterns['numero_flutuante'].match(numero):
-            return True, "Válido"
-        return False, "Número deve ter formato '+/-123.45' ou '123,45' (com ou sem sinal)"
+    def validar_email(self, email: str) -> ResultadoValidacao:
+        return self._validar('email', email)
     
-    def validar_todos_campos(self, dados: Dict[str, str]) -> Dict[str, Tuple[bool, str]]:
-        resultados = {}
-        
-        if 'nome' in dados:
-            resultados['nome'] = self.validar_nome(dados['nome'])
-        if 'email' in dados:
-            resultados['email'] = self.validar_email(dados['email'])
-        if 'senha' in dados:
-            resultados['senha'] = self.validar_senha(dados['senha'])
-        if 'cpf' in dados:
-            resultados['cpf'] = self.validar_cpf(dados['cpf'])
-        if 'rg' in dados:
-            resultados['rg'] = self.validar_rg(dados['rg'])
-        if 'telefone' in dados:
-            resultados['telefone'] = self.validar_telefone(dados['telefone'])
-        if 'cep' in dados:
-            resultados['cep'] = self.validar_cep(dados['cep'])
-        if 'data_horario' in dados:
-            resultados['data_horario'] = self.validar_data_horario(dados['data_horario'])
-        if 'numero_flutuante' in dados:
-            resultados['numero_flutuante'] = self.validar_numero_flutuante(dados['numero_flutuante'])
-        
-        return resultados
+    def validar_senha(self, senha: str) -> ResultadoValidacao:
+        return self._validar('senha', senha)
+    
+    def validar_cpf(self, cpf: str) -> ResultadoValidacao:
+        return self._validar('cpf', cpf)
+    
+    def validar_rg(self, rg: str) -> ResultadoValidacao:
+        return self._validar('rg', rg)
+    
+    def validar_telefone(self, telefone: str) -> ResultadoValidacao:
+        return self._validar('telefone', telefone)
+    
+    def validar_cep(self, cep: str) -> ResultadoValidacao:
+        return self._validar('cep', cep)
+    
+    def validar_data_horario(self, data_horario: str) -> ResultadoValidacao:
+        return self._validar('data_horario', data_horario)
+    
+    def validar_numero_flutuante(self, numero: str) -> ResultadoValidacao:
+        return self._validar('numero_flutuante', numero)
+    
+    def validar_todos_campos(self, dados: Dict[str, str]) -> ResultadoRegistro:
+        campos = []
+        resultados = []
+        for campo in self._tabela:
+            if campo in dados:
+                campos.append(campo)
+                resultados.append(self._validar(campo, dados[campo]))
+        # Registros com os mesmos campos compartilham a mesma tupla de nomes
+        campos = tuple(campos)
+        campos = self._formas.setdefault(campos, campos)
+        return ResultadoRegistro(campos, tuple(resultados))
+
+    def compilar_plano(self, campos: Iterable[str]) -> PlanoRegistro:
+        """Pré-compila a validação de registros que têm sempre os mesmos `campos`.
+
+        Os verificadores são resolvidos uma vez, então cada registro não paga
+        a consulta de campos feita por validar_todos_campos.
+        """
+        campos = set(campos)
+        desconhecidos = sorted(campos - self._tabela.keys())
+        if desconhecidos:
+            raise ValueError(f"Campos desconhecidos: {', '.join(desconhecidos)}")
+        # Mesma ordem (e mesma tupla) de validar_todos_campos
+        ordem = tuple(campo for campo in self._tabela if campo in campos)
+        ordem = self._formas.setdefault(ordem, ordem)
+        return PlanoRegistro(ordem, self._verificadores(ordem), {campo: self._tabela[campo].custo for campo in ordem})
+
+    def _verificadores(self, campos: Iterable[str]) -> Dict[str, Callable[[str], ResultadoValidacao]]:
+        if self.cache is not None:
+            verificadores = {campo: partial(self.cache.consultar, campo) for campo in campos}
+        else:
+            verificadores = {campo: compilar_verificador(self._tabela[campo]) for campo in campos}
+        if self.metricas is not None or self._ganchos:
+            verificadores = {campo: self._instrumentado(verificar, campo) for campo, verificar in verificadores.items()}
+        return verificadores
+
+    def primeira_falha(self, dados: Dict[str, str]) -> Optional[Tuple[str, ResultadoValidacao]]:
+        """Modo fail-fast de validar_todos_campos: devolve (campo, resultado) da
+        primeira falha, ou None se todos os campos presentes são válidos.
+
+        Os campos são conferidos do mais barato e mais rejeitado ao mais caro
+        e menos rejeitado (veja VerificacaoRapida); qual falha é informada
+        depende dessa ordem, não da ordem dos campos.
+        """
+        if self._rapida is None:
+            self._rapida = VerificacaoRapida(self._verificadores(self._tabela),
+                                             {campo.nome: campo.custo for campo in self.campos},
+                                             self._ordem_adaptativa)
+        return self._rapida.primeira_falha(dados)
+
+    def registro_valido(self, dados: Dict[str, str]) -> bool:
+        """True se todos os campos presentes são válidos, parando na primeira falha."""
+        return self.primeira_falha(dados) is None
+
+    def estatisticas_falha_rapida(self) -> Optional[Dict[str, object]]:
+        """Ordem atual e taxas de rejeição do modo fail-fast (None se ainda não usado)."""
+        return self._rapida.estatisticas() if self._rapida is not None else None
+
+    def validar_lote(self, registros: Union[Iterable[Dict[str, str]], Dict[str, List[str]]],
+                     orcamento: Optional[float] = None) -> ResultadoLote:
+        """Valida muitos registros de uma vez, coluna por coluna.
+
+        Aceita um iterável de dicionários (os campos são os que aparecem em
+        algum registro; valores ausentes contam como vazios) ou um
+        dicionário de colunas no formato {campo: [valores]}.
+
+        Com `orcamento` (segundos), os registros são validados em blocos de
+        BLOCO_ORCAMENTO e a validação para quando o tempo acaba: os
+        registros restantes ficam como não avaliados (veja ResultadoLote).
+        """
+        colunas = self._colunas_lote(registros)
+        total = len(next(iter(colunas.values()))) if colunas else 0
+        for campo, coluna in colunas.items():
+            if len(coluna) != total:
+                raise ValueError(f"Coluna '{campo}' tem {len(coluna)} valores, esperado {total}")
+
+        if orcamento is not None:
+            return self._validar_lote_ate(colunas, total, time.monotonic() + orcamento)
+
+        validos = {}
+        falhas = {}
+        for campo, coluna in colunas.items():
+            validos[campo], falhas[campo] = self._validar_coluna(campo, coluna)
+
+        return ResultadoLote(total, validos, falhas)
+
+    def _validar_lote_ate(self, colunas: Dict[str, List[str]], total: int, prazo: float) -> ResultadoLote:
+        """validar_lote em blocos de registros, parando em `prazo` (time.monotonic)."""
+        validos = {campo: bytearray() for campo in colunas}
+        falhas = {campo: [] for campo in colunas}
+        avaliados = 0
+        while avaliados < total and time.monotonic() < prazo:
+            fim = min(avaliados + BLOCO_ORCAMENTO, total)
+            for campo, coluna in colunas.items():
+                validos_bloco, falhas_bloco = self._validar_coluna(campo, coluna[avaliados:fim])
+                validos[campo] += validos_bloco
+                falhas[campo].extend(indice + avaliados for indice in falhas_bloco)
+            avaliados = fim
+        return ResultadoLote(total, validos, falhas, avaliados)
+
+    def _colunas_lote(self, registros) -> Dict[str, List[str]]:
+        if isinstance(registros, Mapping):
+            return {campo: registros[campo] for campo in self._tabela if campo in registros}
+
+        if not isinstance(registros, (list, tuple)):
+            registros = list(registros)
+        presentes = set().union(*registros)
+        return {campo: [registro.get(campo) for registro in registros]
+                for campo in self._tabela if campo in presentes}
+
+    def _validar_coluna(self, campo: str, coluna: Iterable[str]) -> Tuple[bytearray, List[int]]:
+        if self.cache is not None:
+            return self._validar_coluna_com_cache(campo, coluna)
+
+        # Mesma regra de validar_<campo>, sem criar tupla/mensagem por valor
+        definicao = self._tabela[campo]
+        minimo, maximo, posicao, aceitos = definicao.prefiltro
+        match = definicao.casador
+        validos = bytearray()
+        falhas = []
+        marcar = validos.append
+        falhar = falhas.append
+
+        if aceitos is None:
+            for indice, valor in enumerate(coluna):
+                if (valor and minimo <= len(valor) <= maximo
+                        and valor[0] != ' ' and valor[-1] != ' ' and match(valor)):
+                    marcar(1)
+                else:
+                    marcar(0)
+                    falhar(indice)
+        else:
+            for indice, valor in enumerate(coluna):
+                if (valor and minimo <= len(valor) <= maximo and valor[posicao] in aceitos
+                        and valor[0] != ' ' and valor[-1] != ' ' and match(valor)):
+                    marcar(1)
+                else:
+                    marcar(0)
+                    falhar(indice)
+
+        return validos, falhas
+
+    def _validar_coluna_com_cache(self, campo: str, coluna: Iterable[str]) -> Tuple[bytearray, List[int]]:
+        consultar = self.cache.consultar
+        validos = bytearray()
+        falhas = []
+        for indice, valor in enumerate(coluna):
+            if consultar(campo, valor)[0]:
+                validos.append(1)
+            else:
+                validos.append(0)
+                falhas.append(indice)
+        return validos, falhas
+
+    def ativar_metricas(self) -> MetricasValidacao:
+        """Liga a coleta de métricas por campo (veja metricas_validacao).
+
+        Os métodos do caminho crítico passam a ser versões medidas; planos
+        compilados antes disso continuam sem medição.
+        """
+        if self.metricas is None:
+            self.metricas = MetricasValidacao(self.cache)
+            self._instrumentar()
+        return self.metricas
+
+    def desativar_metricas(self) -> None:
+        """Desliga as métricas e volta aos métodos sem medição."""
+        if self.metricas is not None:
+            self.metricas = None
+            self._instrumentar()
+
+    def adicionar_gancho(self, antes: Optional[Callable[[str, str], None]] = None,
+                         depois: Optional[Callable[[str, str, ResultadoValidacao, float], None]] = None) -> Gancho:
+        """Registra callbacks em torno de cada validação de um valor.
+
+        `antes(campo, valor)` roda antes e `depois(campo, valor, resultado,
+        segundos)` depois de cada validação, inclusive em validar_lote (que
+        passa a validar valor a valor), planos e primeira_falha. Devolve o
+        identificador usado em remover_gancho.
+        """
+        gancho = Gancho(antes, depois)
+        self._ganchos.append(gancho)
+        self._instrumentar()
+        return gancho
+
+    def remover_gancho(self, gancho: Gancho) -> None:
+        self._ganchos = [registrado for registrado in self._ganchos if registrado is not gancho]
+        self._instrumentar()
+
+    def registrar_lentas(self, limiar_us: float = 100.0, amostragem: float = 1.0,
+                         destino: Optional[Callable[[dict], None]] = None) -> RegistroLentas:
+        """Registra (por amostragem) as validações acima de `limiar_us` microssegundos.
+
+        Veja ganchos_validacao.RegistroLentas; remova com
+        remover_gancho(registro.gancho).
+        """
+        registro = RegistroLentas(limiar_us * 1e-6, amostragem, destino)
+        registro.gancho = self.adicionar_gancho(depois=registro)
+        return registro
+
+    def _instrumentar(self) -> None:
+        """Escolhe os métodos do caminho crítico: sem métricas nem ganchos, os da classe."""
+        self.__dict__.pop('_validar', None)
+        self.__dict__.pop('_validar_coluna', None)
+        self._antes = tuple(gancho.antes for gancho in self._ganchos if gancho.antes is not None)
+        self._depois = tuple(gancho.depois for gancho in self._ganchos if gancho.depois is not None)
+        if self.metricas is not None or self._ganchos:
+            self._validar = self._instrumentado(partial(ValidadorDados._validar, self))
+            self._validar_coluna = self._validar_coluna_instrumentado
+        self._rapida = None
+
+    def _instrumentado(self, validar: Callable, campo: Optional[str] = None) -> Callable:
+        """Envolve `validar(campo, valor)` (ou `validar(valor)`, se `campo` for dado) com métricas e ganchos."""
+        metricas = self.metricas
+        antes = self._antes
+        depois = self._depois
+        relogio = time.perf_counter_ns
+        fixo = campo
+
+        def validar_instrumentado(*argumentos):
+            campo, valor = (fixo, argumentos[0]) if fixo is not None else argumentos
+            for gancho in antes:
+                gancho(campo, valor)
+            inicio = relogio()
+            resultado = validar(*argumentos)
+            segundos = (relogio() - inicio) * 1e-9
+            if metricas is not None:
+                metricas.registrar(campo, resultado[0], segundos)
+            for gancho in depois:
+                gancho(campo, valor, resultado, segundos)
+            return resultado
+        return validar_instrumentado
+
+    def _validar_coluna_instrumentado(self, campo: str, coluna: Iterable[str]) -> Tuple[bytearray, List[int]]:
+        if self._ganchos:
+            # Os ganchos veem cada valor: valida um a um
+            validar = self._validar
+            validos = bytearray()
+            falhas = []
+            for indice, valor in enumerate(coluna):
+                if validar(campo, valor)[0]:
+                    validos.append(1)
+                else:
+                    validos.append(0)
+                    falhas.append(indice)
+            return validos, falhas
+
+        inicio = time.perf_counter_ns()
+        validos, falhas = ValidadorDados._validar_coluna(self, campo, coluna)
+        self.metricas.registrar_lote(campo, len(validos), len(validos) - len(falhas),
+                                     (time.perf_counter_ns() - inicio) * 1e-9)
+        return validos, falhas
+
+    def estatisticas_cache(self) -> Optional[Dict[str, int]]:
+        return self.cache.estatisticas() if self.cache is not None else None
+
+    def validar_coluna_numpy(self, campo: str, coluna):
+        """Valida uma coluna inteira com NumPy e devolve um array booleano.
+
+        Campos de layout fixo (veja MASCARAS) são verificados com operações
+        vetorizadas sobre arrays `S`/`U`; os demais usam validar_lote.
+        Requer o pacote numpy.
+        """
+        from validacao_numpy import validar_coluna
+        return validar_coluna(self, campo, coluna)
+
+    def detectar_tipos(self, valor: str) -> Tuple[str, ...]:
+        """Todos os campos cujo formato aceita `valor`, com uma única leitura do texto.
+
+        Usa o autômato produto dos padrões (veja automato_campos), construído
+        na primeira chamada. Campos registrados com casador próprio ou com
+        padrões fora do subconjunto suportado pelo autômato são conferidos um
+        a um, depois dos demais.
+        """
+        if not valor:
+            return ()
+        if self._automato is None:
+            self._automato, self._fora_do_automato = self._construir_automato()
+        tipos = self._automato.detectar(valor)
+        if len(valor) > min(self._limites.values(), default=SEM_LIMITE):
+            tipos = tuple(campo for campo in tipos if len(valor) <= self._limites.get(campo, SEM_LIMITE))
+        for campo in self._fora_do_automato:
+            if self._validar(campo, valor)[0]:
+                tipos += (campo,)
+        return tipos
+
+    def _construir_automato(self) -> Tuple[AutomatoProduto, Tuple[str, ...]]:
+        suportados = {}
+        fora = []
+        for campo, padrao in self.patterns.items():
+            # Casadores próprios (ex.: CPF estrito) vão além da regex
+            if self._personalizados.get(campo, {}).get('casador') is not None:
+                fora.append(campo)
+                continue
+            # Flags (ex.: re.IGNORECASE) não são representadas no autômato
+            if padrao.flags & ~re.UNICODE:
+                fora.append(campo)
+                continue
+            try:
+                lookaheads, corpo = _separar_lookaheads(padrao.pattern)
+                for regex in lookaheads:
+                    AFD.de_regex(regex, prefixo=True)
+                AFD.de_regex(corpo)
+            except ValueError:
+                fora.append(campo)
+            else:
+                suportados[campo] = padrao.pattern
+        return AutomatoProduto(suportados), tuple(fora)
+
+    def inferir_tipo_coluna(self, amostras: Iterable[str], limiar: float = 0.9) -> Optional[str]:
+        """Infere o campo de uma coluna sem rótulo a partir de uma amostra dos valores.
+
+        Devolve o campo aceito pela maior parte das amostras não vazias, desde
+        que essa fração seja pelo menos `limiar`; caso contrário, None.
+        """
+        contagem = dict.fromkeys(self.patterns, 0)
+        total = 0
+        for valor in amostras:
+            if not valor:
+                continue
+            total += 1
+            for campo in self.detectar_tipos(valor):
+                contagem[campo] += 1
+
+        if not total:
+            return None
+        melhor = max(contagem, key=contagem.get)
+        return melhor if contagem[melhor] / total >= limiar else None
 
 if __name__ == "__main__":
     validador = ValidadorDados()